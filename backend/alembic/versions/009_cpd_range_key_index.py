@@ -0,0 +1,38 @@
+"""Partial index over campaign_performance_daily range keys.
+
+``find_encompassing_range_data`` scans an account's legacy range-key
+rows (``date`` of the form ``"start__end"``). Those are a small slice of
+the table, so a partial index on ``(credential_id, date)`` restricted to
+``strpos(date, '__') > 0`` lets that lookup skip the per-day rows.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+    indexes = {ix["name"] for ix in insp.get_indexes("campaign_performance_daily")}
+    if "ix_cpd_range_keys" not in indexes:
+        op.create_index(
+            "ix_cpd_range_keys",
+            "campaign_performance_daily",
+            ["credential_id", "date"],
+            postgresql_where=sa.text("strpos(date, '__') > 0"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cpd_range_keys", table_name="campaign_performance_daily", if_exists=True)
@@ -0,0 +1,47 @@
+"""Partial indexes over single-day performance rows.
+
+``campaign_performance_daily.date`` and ``account_performance_daily.date``
+hold either an ISO day or a legacy ``"start__end"`` range key. Report,
+trend and coverage queries only want the single-day rows and filter them
+with ``strpos(date, '__') <= 0``. Indexing ``(credential_id, date)`` under
+that predicate keeps range-key rows out of those scans without rewriting
+the column type.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DAY_KEY_INDEXES = (
+    ("ix_cpd_day_keys", "campaign_performance_daily"),
+    ("ix_apd_day_keys", "account_performance_daily"),
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+    for name, table in _DAY_KEY_INDEXES:
+        indexes = {ix["name"] for ix in insp.get_indexes(table)}
+        if name not in indexes:
+            op.create_index(
+                name,
+                table,
+                ["credential_id", "date"],
+                postgresql_where=sa.text("strpos(date, '__') <= 0"),
+            )
+
+
+def downgrade() -> None:
+    for name, table in _DAY_KEY_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,64 @@
+"""Compress raw_data JSON columns with lz4.
+
+Every synced entity keeps the raw Amazon Ads payload in ``raw_data``
+(several KB per SP campaign), so sync write throughput is dominated by
+TOAST compressing those values. PostgreSQL 14+ can use lz4 instead of the
+default pglz: several times faster to compress and decompress at a
+similar ratio for JSON, and transparent to every reader of the column.
+
+Only newly written values use lz4; existing rows keep pglz until they are
+next rewritten (which sync does routinely). Skipped on servers older
+than 14 or built without lz4.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_RAW_DATA_TABLES = (
+    "accounts",
+    "campaigns",
+    "ad_groups",
+    "targets",
+    "ads",
+    "ad_associations",
+    "product_performance_daily",
+)
+
+
+def _lz4_available(conn) -> bool:
+    enumvals = conn.execute(
+        sa.text("SELECT enumvals FROM pg_settings WHERE name = 'default_toast_compression'")
+    ).scalar()
+    return bool(enumvals) and "lz4" in enumvals
+
+
+def _set_compression(method: str) -> None:
+    conn = op.get_bind()
+    if not _lz4_available(conn):
+        return
+    insp = sa.inspect(conn)
+    for table in _RAW_DATA_TABLES:
+        if not insp.has_table(table):
+            continue
+        if "raw_data" not in {c["name"] for c in insp.get_columns(table)}:
+            continue
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN raw_data SET COMPRESSION {method}")
+
+
+def upgrade() -> None:
+    _set_compression("lz4")
+
+
+def downgrade() -> None:
+    _set_compression("pglz")
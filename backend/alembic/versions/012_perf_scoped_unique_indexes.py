@@ -0,0 +1,45 @@
+"""Profile-scoped unique indexes on the daily performance tables.
+
+The daily stores upsert with ``INSERT ... ON CONFLICT`` against
+``(credential_id, COALESCE(profile_id, ''), [amazon_campaign_id,] date)``.
+``init_db`` has been creating these indexes at startup; this migration
+makes them part of the schema history so an Alembic-managed database is
+guaranteed to have the conflict targets, and drops the superseded
+unscoped constraints (which never matched NULL profiles).
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_cpd_scoped_unique
+        ON campaign_performance_daily (credential_id, COALESCE(profile_id, ''), amazon_campaign_id, date)
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_apd_scoped_unique
+        ON account_performance_daily (credential_id, COALESCE(profile_id, ''), date)
+        """
+    )
+    op.execute("ALTER TABLE campaign_performance_daily DROP CONSTRAINT IF EXISTS uq_campaign_perf_daily")
+    op.execute("ALTER TABLE account_performance_daily DROP CONSTRAINT IF EXISTS uq_account_perf_daily")
+
+
+def downgrade() -> None:
+    # The scoped indexes are also ensured by init_db at startup; removing
+    # them would break the ON CONFLICT upserts, so downgrade is a no-op.
+    pass
@@ -0,0 +1,71 @@
+"""Covering indexes for the daily performance aggregations.
+
+Replaces the partial ``(credential_id, date)`` day-key indexes from 010
+with ``(credential_id, profile_id, date)`` indexes under the same
+single-day predicate that INCLUDE the aggregated columns:
+
+* ``ix_apd_day_covering`` carries every column the account trend and the
+  exact-daily coverage count read, so both become index-only scans.
+* ``ix_cpd_day_covering`` carries the campaign id and summed metrics used
+  by the per-campaign aggregation, avoiding most heap fetches there.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DAY_KEYS = sa.text("strpos(date, '__') <= 0")
+
+_COVERING = (
+    (
+        "ix_cpd_day_covering",
+        "ix_cpd_day_keys",
+        "campaign_performance_daily",
+        ["amazon_campaign_id", "spend", "sales", "impressions", "clicks", "orders", "daily_budget"],
+    ),
+    (
+        "ix_apd_day_covering",
+        "ix_apd_day_keys",
+        "account_performance_daily",
+        [
+            "total_spend", "total_sales", "total_impressions", "total_clicks",
+            "total_orders", "avg_acos", "avg_roas", "avg_ctr", "avg_cpc",
+            "avg_top_of_search_impression_share", "total_campaigns", "active_campaigns",
+        ],
+    ),
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    insp = sa.inspect(conn)
+    for name, superseded, table, include in _COVERING:
+        indexes = {ix["name"] for ix in insp.get_indexes(table)}
+        if name not in indexes:
+            op.create_index(
+                name,
+                table,
+                ["credential_id", "profile_id", "date"],
+                postgresql_include=include,
+                postgresql_where=_DAY_KEYS,
+            )
+        op.drop_index(superseded, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for name, superseded, table, _ in _COVERING:
+        op.create_index(
+            superseded, table, ["credential_id", "date"],
+            postgresql_where=_DAY_KEYS, if_not_exists=True,
+        )
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,52 @@
+"""Partial indexes for the search term summary top-N lists.
+
+``get_search_term_summary`` reads four ``ORDER BY ... LIMIT`` lists per
+credential/profile. Each index below leads with ``(credential_id,
+profile_id)``, is ordered by the sort column and (where the list is a
+category) carries that category as its predicate, so every list becomes an
+ordered index scan that stops after ``LIMIT`` rows instead of sorting all
+of the credential's search terms:
+
+* ``ix_stp_top_sales`` – converting terms by sales
+* ``ix_stp_top_non_converting`` – clicked, non-converting terms by cost
+* ``ix_stp_top_high_acos`` – ACOS above 50% by cost
+* ``ix_stp_top_clicks`` – all terms by clicks
+
+Predicates match the ``STP_*`` expressions in ``search_term_service``.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ("ix_stp_top_sales", "sales", "WHERE purchases > 0"),
+    ("ix_stp_top_non_converting", "cost", "WHERE clicks > 0 AND coalesce(purchases, 0) = 0"),
+    ("ix_stp_top_high_acos", "cost", "WHERE acos > 50 AND cost > 0"),
+    ("ix_stp_top_clicks", "clicks", ""),
+)
+
+
+def upgrade() -> None:
+    for name, order_column, predicate in _INDEXES:
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {name}
+            ON search_term_performance (credential_id, profile_id, {order_column} DESC NULLS LAST)
+            {predicate}
+            """
+        )
+
+
+def downgrade() -> None:
+    for name, _, _ in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
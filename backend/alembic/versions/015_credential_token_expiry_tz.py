@@ -0,0 +1,55 @@
+"""Store credentials.token_expires_at as TIMESTAMP WITH TIME ZONE.
+
+The token check compares the expiry with an aware ``datetime.now(UTC)``
+on every MCP call; with a naive column every read had to be re-tagged as
+UTC first, and writers had to remember to strip tzinfo. Existing values
+are naive UTC, so they are converted ``AT TIME ZONE 'UTC'``.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_timezone_aware(conn) -> bool:
+    insp = sa.inspect(conn)
+    for col in insp.get_columns("credentials"):
+        if col["name"] == "token_expires_at":
+            return bool(getattr(col["type"], "timezone", False))
+    return False
+
+
+def upgrade() -> None:
+    # Skip databases created from the current models (already timestamptz):
+    # re-applying AT TIME ZONE to a timestamptz would shift the values.
+    if _is_timezone_aware(op.get_bind()):
+        return
+    op.execute(
+        """
+        ALTER TABLE credentials
+        ALTER COLUMN token_expires_at TYPE TIMESTAMP WITH TIME ZONE
+        USING token_expires_at AT TIME ZONE 'UTC'
+        """
+    )
+
+
+def downgrade() -> None:
+    if not _is_timezone_aware(op.get_bind()):
+        return
+    op.execute(
+        """
+        ALTER TABLE credentials
+        ALTER COLUMN token_expires_at TYPE TIMESTAMP WITHOUT TIME ZONE
+        USING token_expires_at AT TIME ZONE 'UTC'
+        """
+    )
@@ -0,0 +1,37 @@
+"""Index reports by (credential_id, created_at).
+
+Report lookups fetch a credential's newest reports with ``ORDER BY
+created_at DESC LIMIT n``, as do the sync freshness checks and the
+``check_report_db`` diagnostic. The separate ``credential_id`` and
+``created_at`` indexes force either a sort of every report for the
+credential or a walk of the whole table in date order. One composite
+index, read backwards, serves both the filter and the order and stops
+after ``n`` rows.
+
+The daily performance tables already have ``(credential_id, date)``
+indexes (``ix_cpd_credential_date``, ``ix_apd_credential_date``).
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+    if "ix_reports_credential_created" not in {ix["name"] for ix in insp.get_indexes("reports")}:
+        op.create_index("ix_reports_credential_created", "reports", ["credential_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_credential_created", table_name="reports", if_exists=True)
@@ -7,6 +7,7 @@ import logging
 import ssl
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 from sqlalchemy import text
 from app.config import get_settings
 
@@ -40,6 +41,20 @@ engine = create_async_engine(
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def make_script_engine():
+    """
+    Engine for one-shot CLI scripts in scripts/.
+    NullPool closes each connection on release, so a script holds no idle
+    connections and leaves none behind for the event loop to reap at exit.
+    """
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        poolclass=NullPool,
+        connect_args=_get_connect_args(),
+    )
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -0,0 +1,50 @@
+"""
+Shared outbound HTTP clients.
+
+Each service that calls an external API (LwA tokens, report downloads,
+Resend) keeps one lazily created ``httpx.AsyncClient`` alive across requests
+so calls to the same host reuse TCP/TLS connections. The clients are closed
+from app shutdown and recreated on next use.
+"""
+
+import importlib.util
+from functools import lru_cache
+from typing import Any, Optional
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def h2_available() -> bool:
+    """True when the optional ``h2`` package (httpx's HTTP/2 extra) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class SharedAsyncClient:
+    """A lazily created ``httpx.AsyncClient`` reused across requests.
+
+    ``http2=True`` asks for HTTP/2, which is enabled only when ``h2`` is
+    installed; ALPN still falls back to HTTP/1.1 for servers that decline it.
+    Keyword arguments are passed to ``httpx.AsyncClient`` on creation.
+    """
+
+    def __init__(self, *, http2: bool = False, **client_kwargs: Any):
+        self.http2 = http2
+        self.client_kwargs = client_kwargs
+        self.client: Optional[httpx.AsyncClient] = None
+
+    def get(self, **extra_kwargs: Any) -> httpx.AsyncClient:
+        """Return the shared client, creating it (with ``extra_kwargs``) if needed."""
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                http2=self.http2 and h2_available(),
+                **self.client_kwargs,
+                **extra_kwargs,
+            )
+        return self.client
+
+    async def aclose(self) -> None:
+        """Close the client; the next ``get()`` creates a fresh one."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
@@ -5,7 +5,9 @@ All data persisted to PostgreSQL.
 Serves frontend static files when present (unified deploy = no CORS).
 """
 
+import asyncio
 import logging
+import time
 from pathlib import Path
 from contextlib import asynccontextmanager
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -24,7 +26,10 @@ from app.routers import (
 )
 from app.models import User
 from app.services.auth_service import hash_password
-from sqlalchemy import select, func
+from app.services.email_service import close_http_client as close_email_http_client
+from app.services.reporting_service import close_http_client as close_report_http_client
+from app.services.token_service import close_http_client as close_token_http_client
+from sqlalchemy import select
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -38,13 +43,13 @@ async def _bootstrap_first_admin():
         return
     from app.database import async_session
     async with async_session() as db:
-        r = await db.execute(select(func.count()).select_from(User))
-        count = r.scalar() or 0
-        if count > 0:
+        r = await db.execute(select(User.id).limit(1))
+        if r.scalar_one_or_none() is not None:
             return  # Users already exist
+        password_hash = await asyncio.to_thread(hash_password, settings.first_admin_password)
         admin = User(
             email=settings.first_admin_email.lower(),
-            password_hash=hash_password(settings.first_admin_password),
+            password_hash=password_hash,
             name="Admin",
             role="admin",
             is_active=True,
@@ -54,9 +59,22 @@ async def _bootstrap_first_admin():
         logger.info(f"Bootstrap: created first admin user {admin.email}")
 
 
+def _enable_eager_tasks() -> None:
+    """Run new tasks eagerly until their first suspend (Python 3.12+).
+
+    Short coroutines fanned out with ``asyncio.gather`` / ``create_task``
+    (MCP calls that fail fast, cached lookups) then finish without a
+    scheduler round-trip. No-op on older interpreters.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Amazon Ads Optimizer...")
+    _enable_eager_tasks()
     try:
         await init_db()
         await _bootstrap_first_admin()
@@ -66,6 +84,9 @@ async def lifespan(app: FastAPI):
         # Still yield so app can serve /api/health (degraded) and logs are visible
     yield
     logger.info("Shutting down...")
+    await close_email_http_client()
+    await close_report_http_client()
+    await close_token_http_client()
 
 
 app = FastAPI(
@@ -136,9 +157,26 @@ app.include_router(activity.router, prefix="/api", dependencies=[Depends(require
 app.include_router(cron.router, prefix="/api")  # No auth — uses CRON_SECRET
 
 
+# A successful DB probe is reused this long, so uptime monitors and
+# liveness probes don't each check out a pool connection for SELECT 1.
+# Failures are never cached: a degraded DB is re-probed on every request.
+DB_HEALTH_TTL_SECONDS = 1.5
+_db_healthy_until = 0.0
+
+
+async def _database_healthy() -> bool:
+    global _db_healthy_until
+    if time.monotonic() < _db_healthy_until:
+        return True
+    db_ok = await check_db_connection()
+    if db_ok:
+        _db_healthy_until = time.monotonic() + DB_HEALTH_TTL_SECONDS
+    return db_ok
+
+
 @app.get("/api/health")
 async def health_check():
-    db_ok = await check_db_connection()
+    db_ok = await _database_healthy()
     return {
         "status": "healthy" if db_ok else "degraded",
         "service": "Amazon Ads Optimizer",
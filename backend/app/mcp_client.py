@@ -4,13 +4,78 @@ Connects to the official Amazon Ads MCP Server via Streamable HTTP transport.
 Handles tool calls for campaign management, reporting, billing, and more.
 """
 
+import asyncio
 import logging
-from typing import Any, Optional
+import random
+import re
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import httpx
 from mcp.client.streamable_http import streamablehttp_client
 from mcp import ClientSession
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every tool call inside ``AmazonAdsMCP.session()``.
+MCP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# Amazon Ads rate limits are shared per account/region, so every tool call
+# in the process goes through one limiter, however many services fan out.
+# Throttled calls (HTTP 429 / ThrottlingException) are retried with jittered
+# exponential backoff; other failures are not, since create/update tools are
+# not idempotent.
+MCP_MAX_IN_FLIGHT = 16
+MCP_THROTTLE_RETRIES = 3
+MCP_THROTTLE_BASE_DELAY = 1.0
+MCP_THROTTLE_MAX_DELAY = 16.0
+_THROTTLE_RE = re.compile(r"\b429\b|too many requests|throttl|rate exceeded", re.IGNORECASE)
+
+# One semaphore per event loop (asyncio primitives are loop-bound).
+_call_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _call_limiter() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _call_limiters.get(loop)
+    if sem is None:
+        sem = _call_limiters[loop] = asyncio.Semaphore(MCP_MAX_IN_FLIGHT)
+    return sem
+
+
+def _is_throttled(exc: BaseException) -> bool:
+    """True if ``exc`` (or any exception it groups/wraps) is a 429/throttle."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429
+    if isinstance(exc, BaseExceptionGroup):
+        return any(_is_throttled(e) for e in exc.exceptions)
+    cause = exc.__cause__ or exc.__context__
+    if cause is not None and cause is not exc and _is_throttled(cause):
+        return True
+    return bool(_THROTTLE_RE.search(str(exc)))
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Borrowed view of a pooled transport.
+
+    The MCP transport closes its ``httpx.AsyncClient`` when each call's
+    stream ends; closing this wrapper is a no-op so the underlying pool (and
+    its TLS connections) survives until the owning ``session()`` exits.
+    """
+
+    def __init__(self, pool: httpx.AsyncHTTPTransport):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
 # ── Region URL Mapping ────────────────────────────────────────────────
 REGION_URLS = {
     "na": "https://advertising-ai.amazon.com/mcp",
@@ -56,6 +121,40 @@ class AmazonAdsMCP:
         self.profile_id = profile_id
         self.account_id = account_id
         self.advertiser_account_id: Optional[str] = None
+        self._pool: Optional[httpx.AsyncHTTPTransport] = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["AmazonAdsMCP"]:
+        """Reuse one keep-alive connection pool for every tool call in scope.
+
+        Without this each ``call_tool`` opens its own HTTP client and pays a
+        fresh TCP + TLS handshake. Nested scopes share the outermost pool.
+        """
+        if self._pool is not None:
+            yield self
+            return
+        self._pool = httpx.AsyncHTTPTransport(limits=MCP_POOL_LIMITS)
+        try:
+            yield self
+        finally:
+            pool, self._pool = self._pool, None
+            await pool.aclose()
+
+    def _transport_kwargs(self) -> dict[str, Any]:
+        """Extra ``streamablehttp_client`` kwargs routing through the pinned pool."""
+        pool = self._pool
+        if pool is None:
+            return {}
+
+        def factory(headers=None, timeout=None, auth=None) -> httpx.AsyncClient:
+            return httpx.AsyncClient(
+                headers=headers,
+                timeout=timeout,
+                auth=auth,
+                transport=_SharedTransport(pool),
+            )
+
+        return {"httpx_client_factory": factory}
 
     def set_advertiser_account_id(self, advertiser_account_id: Optional[str]) -> None:
         """Store the active advertiser account for MCP body scoping."""
@@ -185,9 +284,26 @@ class AmazonAdsMCP:
         arguments = self._sanitize_arguments(arguments, tool_name)
         logger.info(f"MCP call: {tool_name} with args keys: {list(arguments.keys())}")
 
+        for attempt in range(MCP_THROTTLE_RETRIES + 1):
+            try:
+                async with _call_limiter():
+                    return await self._call_tool_once(tool_name, arguments)
+            except MCPError as e:
+                if attempt >= MCP_THROTTLE_RETRIES or not _is_throttled(e):
+                    raise
+                delay = min(MCP_THROTTLE_BASE_DELAY * 2 ** attempt, MCP_THROTTLE_MAX_DELAY)
+                delay += random.uniform(0, 0.1 * delay)
+                logger.warning(
+                    "MCP call %s throttled; retry %d/%d in %.1fs",
+                    tool_name, attempt + 1, MCP_THROTTLE_RETRIES, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _call_tool_once(self, tool_name: str, arguments: dict[str, Any]) -> dict:
         try:
             async with streamablehttp_client(
                 url=self.url, headers=self._headers_for_tool(tool_name),
+                **self._transport_kwargs(),
             ) as (read_stream, write_stream, _):
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
@@ -197,13 +313,15 @@ class AmazonAdsMCP:
             raise
         except Exception as e:
             logger.error(f"MCP tool call failed: {tool_name} - {str(e)}")
-            raise MCPError(f"Failed to call {tool_name}: {str(e)}")
+            raise MCPError(f"Failed to call {tool_name}: {str(e)}") from e
 
     async def call_tools_sequential(self, calls: list[tuple[str, dict]]) -> list[dict]:
         """Call multiple MCP tools in sequence within a single session."""
         results = []
         try:
-            async with streamablehttp_client(url=self.url, headers=self.headers) as (
+            async with streamablehttp_client(
+                url=self.url, headers=self.headers, **self._transport_kwargs(),
+            ) as (
                 read_stream,
                 write_stream,
                 _,
@@ -225,7 +343,9 @@ class AmazonAdsMCP:
     async def list_tools(self, include_schema: bool = False) -> list[dict]:
         """List all available MCP tools. Optionally include inputSchema."""
         try:
-            async with streamablehttp_client(url=self.url, headers=self.headers) as (
+            async with streamablehttp_client(
+                url=self.url, headers=self.headers, **self._transport_kwargs(),
+            ) as (
                 read_stream,
                 write_stream,
                 _,
@@ -809,23 +929,40 @@ class AmazonAdsMCP:
             logger.warning(f"v3 report retrieve failed: {resp.status_code} - {resp.text[:200]}")
             return {"success": [{"report": {"reportId": report_id, "status": "UNKNOWN"}}]}
 
-    async def poll_report(self, report_ids: list[str], max_wait: int = 120, interval: int = 10) -> dict:
+    async def poll_report(
+        self,
+        report_ids: list[str],
+        max_wait: int = 120,
+        interval: float = 10,
+        *,
+        backoff: float = 1.0,
+        max_interval: Optional[float] = None,
+        jitter: float = 0.0,
+    ) -> dict:
         """
         Poll for report completion. Amazon Ads reports are async and can take
         30-120+ seconds to complete.
+
+        The wait starts at ``interval`` and is multiplied by ``backoff`` after
+        each poll (capped at ``max_interval``), with ±``jitter`` randomisation
+        so concurrent pollers spread out. The defaults poll at a fixed cadence.
         Returns the completed report data, or the last status if timed out.
         """
-        import asyncio
-        elapsed = 0
+        elapsed = 0.0
+        delay = float(interval)
         last_result = {}
 
         while elapsed < max_wait:
-            await asyncio.sleep(interval)
-            elapsed += interval
+            wait = min(delay * random.uniform(1 - jitter, 1 + jitter), max_wait - elapsed)
+            await asyncio.sleep(wait)
+            elapsed += wait
+            delay *= backoff
+            if max_interval is not None:
+                delay = min(delay, max_interval)
 
             result = await self.retrieve_report(report_ids)
             last_result = result
-            logger.info(f"Report poll ({elapsed}s): {self._summarize_report_status(result)}")
+            logger.info(f"Report poll ({elapsed:.0f}s): {self._summarize_report_status(result)}")
 
             # Check if report is complete
             status = self._get_report_status(result)
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from sqlalchemy import (
     String, Text, Float, Integer, BigInteger, Boolean, DateTime,
     JSON, ForeignKey, Index, UniqueConstraint,
-    Enum as SAEnum,
+    Enum as SAEnum, text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -72,7 +72,7 @@ class Credential(Base):
     client_secret: Mapped[str] = mapped_column(Text, nullable=True)
     access_token: Mapped[str] = mapped_column(Text, nullable=False)
     refresh_token: Mapped[str] = mapped_column(Text, nullable=True)
-    token_expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    token_expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)  # aware UTC
     profile_id: Mapped[str] = mapped_column(String(255), nullable=True)
     account_id: Mapped[str] = mapped_column(String(255), nullable=True)
     region: Mapped[str] = mapped_column(String(10), default="na")
@@ -351,6 +351,7 @@ class Report(Base):
         Index("ix_reports_report_type", "report_type"),
         Index("ix_reports_status", "status"),
         Index("ix_reports_created_at", "created_at"),
+        Index("ix_reports_credential_created", "credential_id", "created_at"),
     )
 
 
@@ -854,6 +855,21 @@ class CampaignPerformanceDaily(Base):
         Index("ix_cpd_campaign_id", "amazon_campaign_id"),
         Index("ix_cpd_date", "date"),
         Index("ix_cpd_credential_date", "credential_id", "date"),
+        # date holds "YYYY-MM-DD" or a legacy "start__end" range key; these split the two
+        # (see reporting_service.single_day_key / range_key). The day index carries
+        # the summed metrics so the per-campaign aggregation reads them from the index.
+        Index(
+            "ix_cpd_day_covering", "credential_id", "profile_id", "date",
+            postgresql_include=[
+                "amazon_campaign_id", "spend", "sales", "impressions",
+                "clicks", "orders", "daily_budget",
+            ],
+            postgresql_where=text("strpos(date, '__') <= 0"),
+        ),
+        Index(
+            "ix_cpd_range_keys", "credential_id", "date",
+            postgresql_where=text("strpos(date, '__') > 0"),
+        ),
     )
 
 
@@ -901,6 +917,17 @@ class AccountPerformanceDaily(Base):
         Index("ix_apd_profile_id", "profile_id"),
         Index("ix_apd_date", "date"),
         Index("ix_apd_credential_date", "credential_id", "date"),
+        # Covers every column the daily trend and coverage queries read, so
+        # both are index-only scans over the single-day rows.
+        Index(
+            "ix_apd_day_covering", "credential_id", "profile_id", "date",
+            postgresql_include=[
+                "total_spend", "total_sales", "total_impressions", "total_clicks",
+                "total_orders", "avg_acos", "avg_roas", "avg_ctr", "avg_cpc",
+                "avg_top_of_search_impression_share", "total_campaigns", "active_campaigns",
+            ],
+            postgresql_where=text("strpos(date, '__') <= 0"),
+        ),
     )
 
 
@@ -1039,6 +1066,21 @@ class SearchTermPerformance(Base):
         Index("ix_stp_clicks", "clicks"),
         Index("ix_stp_purchases", "purchases"),
         Index("ix_stp_time_unit", "time_unit"),
+        # Top-N lists in get_search_term_summary (predicates must match the
+        # STP_* expressions in search_term_service).
+        Index(
+            "ix_stp_top_sales", "credential_id", "profile_id", text("sales DESC NULLS LAST"),
+            postgresql_where=text("purchases > 0"),
+        ),
+        Index(
+            "ix_stp_top_non_converting", "credential_id", "profile_id", text("cost DESC NULLS LAST"),
+            postgresql_where=text("clicks > 0 AND coalesce(purchases, 0) = 0"),
+        ),
+        Index(
+            "ix_stp_top_high_acos", "credential_id", "profile_id", text("cost DESC NULLS LAST"),
+            postgresql_where=text("acos > 50 AND cost > 0"),
+        ),
+        Index("ix_stp_top_clicks", "credential_id", "profile_id", text("clicks DESC NULLS LAST")),
     )
 
 
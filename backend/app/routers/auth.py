@@ -81,7 +81,8 @@ async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     if not user.is_active:
         raise HTTPException(status_code=401, detail="Account is disabled")
-    if not verify_password(payload.password, user.password_hash):
+    # bcrypt takes a few hundred ms; keep it off the event loop.
+    if not await asyncio.to_thread(verify_password, payload.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     user.last_login_at = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -110,15 +111,15 @@ async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db))
 
     # Bootstrap: if no users exist and dev mode, allow first registration without token
     if not settings.is_production and not payload.token:
-        from sqlalchemy import func
-        count_result = await db.execute(select(func.count()).select_from(User))
-        if count_result.scalar() == 0:
+        any_user = await db.execute(select(User.id).limit(1))
+        if any_user.scalar_one_or_none() is None:
             existing = await db.execute(select(User).where(User.email == payload.email.lower()))
             if existing.scalar_one_or_none():
                 raise HTTPException(status_code=400, detail="Email already registered")
+            password_hash = await asyncio.to_thread(hash_password, payload.password)
             user = User(
                 email=payload.email.lower(),
-                password_hash=hash_password(payload.password),
+                password_hash=password_hash,
                 name=payload.name or payload.email.split("@")[0],
                 role="admin",
                 is_active=True,
@@ -158,9 +159,10 @@ async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_db))
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    password_hash = await asyncio.to_thread(hash_password, payload.password)
     user = User(
         email=payload.email.lower(),
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
         name=payload.name or payload.email.split("@")[0],
         role=inv.role,
         is_active=True,
@@ -247,8 +249,8 @@ async def forgot_password(payload: ForgotPasswordRequest, db: AsyncSession = Dep
     await db.flush()
     reset_link = f"{base}/reset-password?token={token}"
 
-    from app.services.email_service import send_password_reset_email
-    asyncio.create_task(asyncio.to_thread(send_password_reset_email, payload.email.lower(), reset_link))
+    from app.services.email_service import send_password_reset_email_async
+    asyncio.create_task(send_password_reset_email_async(payload.email.lower(), reset_link))
 
     return {"message": "If that email is registered, you will receive a reset link."}
 
@@ -271,7 +273,7 @@ async def reset_password(payload: ResetPasswordRequest, db: AsyncSession = Depen
     if not user:
         raise HTTPException(status_code=400, detail="User not found")
 
-    user.password_hash = hash_password(payload.password)
+    user.password_hash = await asyncio.to_thread(hash_password, payload.password)
     prt.used_at = now
     await db.flush()
 
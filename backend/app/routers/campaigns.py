@@ -28,9 +28,10 @@ from app.services.reporting_service import (
     get_date_range,
     DATE_PRESETS,
     resolve_perf_date_source,
+    single_day_key,
     apply_targeting_performance_to_db_targets,
 )
-from app.services.product_image_service import get_product_image_url
+from app.services.product_image_service import extract_image_from_raw_data, get_product_image_urls
 from app.utils import (
     parse_uuid,
     safe_error_detail,
@@ -108,7 +109,7 @@ def _perf_date_where(perf_where, mode: str, val1: str, val2: Optional[str]):
         # single_day: only rows without __ in date
         perf_where.append(CampaignPerformanceDaily.date >= val1)
         perf_where.append(CampaignPerformanceDaily.date <= val2)
-        perf_where.append(func.strpos(CampaignPerformanceDaily.date, "__") <= 0)
+        perf_where.append(single_day_key(CampaignPerformanceDaily.date))
 
 
 @router.get("")
@@ -1379,18 +1380,21 @@ async def list_ads(
 
     # For single-ad groups, attach ad group metrics to the ad (best available proxy for ad-level data)
     ad_list = []
+    needs_image: list[tuple[dict, str]] = []
     for a in ads:
         # Fallback: extract ASIN/SKU from raw_data if missing (e.g. pre-fix synced ads)
         asin_val, sku_val = a.asin, a.sku
+        extracted = None
         if (not asin_val or not sku_val) and a.raw_data:
-            ra, rs = extract_ad_asin_sku(a.raw_data)
+            extracted = extract_ad_asin_sku(a.raw_data)
+            ra, rs = extracted
             asin_val = asin_val or ra
             sku_val = sku_val or rs
         ad_name_val = a.ad_name or ((a.raw_data or {}).get("creative") or {}).get("headline") if a.raw_data else a.ad_name
         if not ad_name_val:
             ad_name_val = (f"ASIN: {asin_val}" if asin_val else None) or (f"SKU: {sku_val}" if sku_val else None)
         if not ad_name_val and a.raw_data:
-            ra, rs = extract_ad_asin_sku(a.raw_data)
+            ra, rs = extracted or extract_ad_asin_sku(a.raw_data)
             ad_name_val = extract_ad_display_name(a.raw_data, ra, rs)
         d = {
             "id": str(a.id),
@@ -1409,16 +1413,12 @@ async def list_ads(
             d["raw_data"] = a.raw_data
         if asin_val:
             d["product_url"] = f"https://www.amazon.com/dp/{asin_val}"
-        # Get image: raw_data extraction, then PA-API, then ASIN fallback URL
-        img_url = await get_product_image_url(
-            asin=asin_val,
-            raw_data=a.raw_data,
-            paapi_access_key=paapi_access,
-            paapi_secret_key=paapi_secret,
-            paapi_partner_tag=paapi_tag,
-        )
+        # Get image: raw_data extraction here; PA-API / ASIN fallback batched below
+        img_url = extract_image_from_raw_data(a.raw_data) if a.raw_data else None
         if img_url:
             d["image_url"] = img_url
+        elif asin_val:
+            needs_image.append((d, asin_val))
         if ad_group_metrics and len(ads) == 1:
             d["spend"] = ad_group_metrics["spend"]
             d["sales"] = ad_group_metrics["sales"]
@@ -1426,6 +1426,16 @@ async def list_ads(
             d["acos"] = ad_group_metrics["acos"]
         ad_list.append(d)
 
+    if needs_image:
+        image_urls = await get_product_image_urls(
+            [asin for _, asin in needs_image],
+            paapi_access_key=paapi_access,
+            paapi_secret_key=paapi_secret,
+            paapi_partner_tag=paapi_tag,
+        )
+        for d, asin in needs_image:
+            d["image_url"] = image_urls[asin]
+
     return {
         "ads": ad_list,
         "count": len(ads),
@@ -1945,7 +1955,7 @@ async def _run_sync_background(
     profile on a multi-profile credential without depending on whichever
     profile is currently marked default in the DB.
     """
-    from app.services.email_service import send_sync_complete_email
+    from app.services.email_service import send_sync_complete_email_async
 
     async def on_progress(step: str, pct: int, s: dict) -> None:
         """Update SyncJob in a separate session so polling sees progress without committing sync data."""
@@ -1975,8 +1985,7 @@ async def _run_sync_background(
 
             # Send email
             if user_email:
-                asyncio.create_task(asyncio.to_thread(
-                    send_sync_complete_email,
+                asyncio.create_task(send_sync_complete_email_async(
                     user_email,
                     success=True,
                     stats=result.get("stats"),
@@ -1996,8 +2005,7 @@ async def _run_sync_background(
             except Exception:
                 await db.rollback()
             if user_email:
-                asyncio.create_task(asyncio.to_thread(
-                    send_sync_complete_email,
+                asyncio.create_task(send_sync_complete_email_async(
                     user_email,
                     success=False,
                     error_message=err_msg,
@@ -1167,7 +1167,7 @@ async def cron_weekly_digest(
     """
     from app.config import get_settings as _gs
     from app.services.digest_service import build_weekly_digest_html
-    from app.services.email_service import send_weekly_digest_email
+    from app.services.email_service import send_weekly_digest_email_async
 
     settings = _gs()
     r = await db.execute(
@@ -1181,7 +1181,7 @@ async def cron_weekly_digest(
         )
         if not html:
             continue
-        if await asyncio.to_thread(send_weekly_digest_email, user.email, html):
+        if await send_weekly_digest_email_async(user.email, html):
             sent += 1
     return {"sent": sent, "eligible_users": len(users)}
 
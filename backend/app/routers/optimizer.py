@@ -246,6 +246,7 @@ async def run_optimization(payload: OptimizeRunRequest, db: AsyncSession = Depen
             min_clicks=rule.min_clicks,
             lookback_days=max(1, min(int(rule.lookback_days or 14), 90)),
             dry_run=payload.dry_run,
+            include_raw_targets=True,
         )
 
         summary = opt_result.get("summary", {})
@@ -296,6 +297,12 @@ async def run_optimization(payload: OptimizeRunRequest, db: AsyncSession = Depen
         opt_run.unchanged = summary.get("unchanged", 0)
         opt_run.summary_data = summary
         opt_run.completed_at = utcnow()
+        failed_campaign_ids = opt_result.get("failed_campaign_ids") or []
+        if failed_campaign_ids:
+            opt_run.error_message = (
+                f"Targets unavailable for {len(failed_campaign_ids)} campaign(s): "
+                f"{', '.join(failed_campaign_ids)}"
+            )
 
         # Store individual bid changes in DB
         changes = opt_result.get("changes", [])
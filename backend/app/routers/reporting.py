@@ -12,7 +12,7 @@ import logging
 from datetime import date as date_type, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, delete
+from sqlalchemy import select, func, and_, delete, lambda_stmt
 from pydantic import BaseModel
 from typing import Optional
 from app.database import get_db, async_session
@@ -26,8 +26,8 @@ from app.services.reporting_service import (
     get_date_range, get_comparison_range, get_comparison_range_for_dates,
     compute_metrics, compute_deltas, enrich_campaigns, ReportingService,
     store_campaign_rows_by_date, store_account_daily_summary,
-    query_campaign_daily, query_account_daily_trend,
-    DATE_PRESETS,
+    query_campaign_daily, query_campaign_daily_periods, query_account_daily_trend,
+    ACTIVE_STATES, DATE_PRESETS, single_day_key, with_account_day_filters,
     get_currency_for_marketplace,
 )
 from app.services.search_term_service import SearchTermService, get_search_term_summary
@@ -125,20 +125,9 @@ async def _get_exact_daily_coverage(
     profile_id: Optional[str] = None,
 ) -> tuple[bool, int, int]:
     expected_days = _days_inclusive(start_date, end_date)
-    where = [
-        AccountPerformanceDaily.credential_id == credential_id,
-        AccountPerformanceDaily.date >= start_date,
-        AccountPerformanceDaily.date <= end_date,
-        func.strpos(AccountPerformanceDaily.date, "__") <= 0,
-    ]
-    if profile_id is not None:
-        where.append(AccountPerformanceDaily.profile_id == profile_id)
-    else:
-        where.append(AccountPerformanceDaily.profile_id.is_(None))
-
-    result = await db.execute(
-        select(func.count(func.distinct(AccountPerformanceDaily.date))).where(and_(*where))
-    )
+    stmt = lambda_stmt(lambda: select(func.count(func.distinct(AccountPerformanceDaily.date))))
+    stmt = with_account_day_filters(stmt, credential_id, start_date, end_date, profile_id)
+    result = await db.execute(stmt)
     synced_days = int(result.scalar() or 0)
     return synced_days >= expected_days, synced_days, expected_days
 
@@ -455,12 +444,12 @@ async def _clear_exact_daily_slice(
     campaign_where = [
         CampaignPerformanceDaily.credential_id == credential_id,
         CampaignPerformanceDaily.date == report_date,
-        func.strpos(CampaignPerformanceDaily.date, "__") <= 0,
+        single_day_key(CampaignPerformanceDaily.date),
     ]
     account_where = [
         AccountPerformanceDaily.credential_id == credential_id,
         AccountPerformanceDaily.date == report_date,
-        func.strpos(AccountPerformanceDaily.date, "__") <= 0,
+        single_day_key(AccountPerformanceDaily.date),
     ]
     if profile_id is not None:
         campaign_where.append(CampaignPerformanceDaily.profile_id == profile_id)
@@ -737,9 +726,7 @@ async def _run_report_sync_background(report_id: uuid.UUID) -> None:
                     current += timedelta(days=1)
                     continue
 
-                day_rows = service.parse_report_campaign_rows(day_result)
-                for row in day_rows:
-                    row["report_date"] = row.get("report_date") or day_str
+                day_rows = service.parse_report_campaign_rows(day_result, default_date=day_str)
 
                 await _clear_exact_daily_slice(db, cred.id, day_str, profile_id)
                 if day_rows:
@@ -1025,7 +1012,7 @@ async def report_summary(
                 "total_campaigns": len(cached_campaigns),
                 "active_campaigns": len([
                     c for c in cached_campaigns
-                    if (c.get("state") or "").lower() in ("enabled", "active")
+                    if (c.get("state") or "").lower() in ACTIVE_STATES
                 ]),
                 "paused_campaigns": len([
                     c for c in cached_campaigns
@@ -1055,7 +1042,7 @@ async def report_summary(
     enriched = daily_campaigns if daily_campaigns else []
 
     summary = compute_metrics(enriched)
-    active = [c for c in enriched if (c.get("state") or "").lower() in ("enabled", "active")]
+    active = [c for c in enriched if (c.get("state") or "").lower() in ACTIVE_STATES]
     paused = [c for c in enriched if (c.get("state") or "").lower() == "paused"]
 
     by_sales = sorted(enriched, key=lambda x: x.get("sales", 0), reverse=True)
@@ -1170,6 +1157,44 @@ async def report_trends(
     return {"source": "none", "data": []}
 
 
+async def _resolve_comparison_sync(
+    db: AsyncSession,
+    cred: Credential,
+    comp_start_str: str,
+    comp_end_str: str,
+) -> tuple[bool, int, int, Optional[Report]]:
+    """Exact daily coverage and sync job for the comparison period.
+
+    A stale comparison sync job is restarted, as for the current period.
+    Returns ``(exact_ready, synced_days, expected_days, sync_job)``.
+    """
+    comp_exact_ready, comp_synced_days, comp_expected_days = await _get_exact_daily_coverage(
+        db,
+        cred.id,
+        comp_start_str,
+        comp_end_str,
+        profile_id=cred.profile_id,
+    )
+    comp_job = await _find_report_sync_job(
+        db,
+        cred.id,
+        comp_start_str,
+        comp_end_str,
+        profile_id=cred.profile_id,
+    )
+    if _is_report_sync_job_stale(comp_job):
+        logger.warning(
+            "Comparison performance report sync stale; restarting: report_id=%s profile_id=%s range=%s..%s",
+            str(comp_job.id), cred.profile_id, comp_start_str, comp_end_str,
+        )
+        comp_job = await _restart_report_sync_job(
+            db,
+            comp_job,
+            reason="Comparison exact daily sync heartbeat went stale; resuming saved progress.",
+        )
+    return comp_exact_ready, comp_synced_days, comp_expected_days, comp_job
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  POST /generate — Full report generation with historical storage
 # ══════════════════════════════════════════════════════════════════════
@@ -1260,6 +1285,17 @@ async def generate_report(
             reason="Exact daily sync heartbeat went stale; resuming saved progress.",
         )
 
+    comp_coverage = None
+    comp_exact_ready = False
+    comp_campaigns = None
+    if payload.compare:
+        if payload.start_date and payload.end_date:
+            comp_start, comp_end = get_comparison_range_for_dates(start_date, end_date)
+        else:
+            comp_start, comp_end = get_comparison_range(preset)
+        comp_start_str = comp_start.isoformat()
+        comp_end_str = comp_end.isoformat()
+
     if exact_daily_ready:
         await _finalize_report_sync_job_if_ready(
             db,
@@ -1268,13 +1304,27 @@ async def generate_report(
             synced_days,
             expected_days,
         )
-        campaigns_data = await query_campaign_daily(
-            db,
-            cred.id,
-            start_str,
-            end_str,
-            profile_id=cred.profile_id,
-        )
+        if payload.compare:
+            # Resolve comparison coverage before the current-period query so
+            # that, when both periods are synced, their campaign aggregates
+            # come back from a single query.
+            comp_coverage = await _resolve_comparison_sync(db, cred, comp_start_str, comp_end_str)
+            comp_exact_ready = comp_coverage[0]
+        if comp_exact_ready:
+            campaigns_data, comp_campaigns = await query_campaign_daily_periods(
+                db,
+                cred.id,
+                [(start_str, end_str), (comp_start_str, comp_end_str)],
+                profile_id=cred.profile_id,
+            )
+        else:
+            campaigns_data = await query_campaign_daily(
+                db,
+                cred.id,
+                start_str,
+                end_str,
+                profile_id=cred.profile_id,
+            )
         daily_trend = await query_account_daily_trend(
             db,
             cred.id,
@@ -1424,40 +1474,11 @@ async def generate_report(
 
     # ── Comparison period ─────────────────────────────────────────────
     if payload.compare:
-        if payload.start_date and payload.end_date:
-            comp_start, comp_end = get_comparison_range_for_dates(start_date, end_date)
-        else:
-            comp_start, comp_end = get_comparison_range(preset)
-        comp_start_str = comp_start.isoformat()
-        comp_end_str = comp_end.isoformat()
-        comp_campaigns = []
+        if comp_coverage is None:
+            comp_coverage = await _resolve_comparison_sync(db, cred, comp_start_str, comp_end_str)
+        comp_exact_ready, comp_synced_days, comp_expected_days, comp_job = comp_coverage
         comp_source = "unavailable"
         comp_daily_trend = []
-        comp_exact_ready, comp_synced_days, comp_expected_days = await _get_exact_daily_coverage(
-            db,
-            cred.id,
-            comp_start_str,
-            comp_end_str,
-            profile_id=cred.profile_id,
-        )
-        comp_job = await _find_report_sync_job(
-            db,
-            cred.id,
-            comp_start_str,
-            comp_end_str,
-            profile_id=cred.profile_id,
-        )
-        if _is_report_sync_job_stale(comp_job):
-            logger.warning(
-                "Comparison performance report sync stale; restarting: report_id=%s profile_id=%s range=%s..%s",
-                str(comp_job.id), cred.profile_id, comp_start_str, comp_end_str,
-            )
-            comp_job = await _restart_report_sync_job(
-                db,
-                comp_job,
-                reason="Comparison exact daily sync heartbeat went stale; resuming saved progress.",
-            )
-
         if comp_exact_ready:
             await _finalize_report_sync_job_if_ready(
                 db,
@@ -1466,9 +1487,10 @@ async def generate_report(
                 comp_synced_days,
                 comp_expected_days,
             )
-            comp_campaigns = await query_campaign_daily(
-                db, cred.id, comp_start_str, comp_end_str, profile_id=cred.profile_id
-            )
+            if comp_campaigns is None:
+                comp_campaigns = await query_campaign_daily(
+                    db, cred.id, comp_start_str, comp_end_str, profile_id=cred.profile_id
+                )
             comp_source = "daily_history"
             comp_summary = compute_metrics(comp_campaigns)
             deltas = compute_deltas(summary, comp_summary)
@@ -106,9 +106,11 @@ async def create_user(
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    # bcrypt takes a few hundred ms; keep it off the event loop.
+    password_hash = await asyncio.to_thread(hash_password, payload.password)
     user = User(
         email=payload.email.lower(),
-        password_hash=hash_password(payload.password),
+        password_hash=password_hash,
         name=payload.name or payload.email.split("@")[0],
         role=payload.role,
         is_active=True,
@@ -223,9 +225,9 @@ async def create_invitation(
     invite_link = f"{base}/register?token={token}"
 
     # Send invite email via Resend (non-blocking; does not fail the request if email fails)
-    from app.services.email_service import send_invite_email
+    from app.services.email_service import send_invite_email_async
     inviter_name = current.name or current.email
-    asyncio.create_task(asyncio.to_thread(send_invite_email, inv.email, invite_link, inviter_name))
+    asyncio.create_task(send_invite_email_async(inv.email, invite_link, inviter_name))
 
     return InvitationResponse(
         id=str(inv.id),
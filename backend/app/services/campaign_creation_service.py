@@ -26,36 +26,129 @@ or targets. Phase 5 hardening introduces a *compensating-delete* path:
 
 The caller can opt out via ``rollback_on_failure=False`` when running a
 manual triage / dry-run.
+
+Scheduling
+----------
+
+The app installs ``asyncio.eager_task_factory`` on its event loop at
+startup (Python 3.12+, see ``app.main``), so any task this service fans
+out runs synchronously up to its first real await — MCP calls that
+error out immediately cost no extra scheduler hop.
 """
 
+import asyncio
 import logging
 from typing import Any, Optional
 from app.mcp_client import AmazonAdsMCP
+from app.utils import first_truthy
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single MCP create call (campaign, ad group, ad or target
+# batch). A hung call becomes a soft error instead of pinning the plan and
+# its pooled connection for the transport's 5-minute read timeout.
+MCP_STAGE_TIMEOUT_SECONDS = 60.0
+
+
+_ID_KEYS = ("campaignId", "adGroupId", "adId", "targetId", "id")
+
+# Plan field aliases accepted by _build_campaign_payload (camelCase first).
+_AD_PRODUCT_KEYS = ("adProduct", "ad_product", "type")
+_TARGETING_KEYS = ("targetingType", "targeting_type")
+_DAILY_BUDGET_KEYS = ("dailyBudget", "daily_budget")
+_DEFAULT_DAILY_BUDGET = 50.0
+
 
 def _extract_id(result: dict, keys: list[str]) -> Optional[str]:
     """Extract ID from MCP response. Amazon returns various structures."""
-    if not isinstance(result, dict):
+    # Fast path: the common ``{"success": [{"<kind>Id": ...}]}`` shape.
+    if type(result) is dict:
+        succ = result.get("success")
+        if type(succ) is list and succ and type(succ[0]) is dict:
+            found = first_truthy(succ[0], _ID_KEYS)
+            if found:
+                return found
+    elif not isinstance(result, dict):
         return None
     for key in keys:
         val = result.get(key)
         if isinstance(val, list) and val:
             item = val[0]
             if isinstance(item, dict):
-                return item.get("campaignId") or item.get("adGroupId") or item.get("adId") or item.get("targetId") or item.get("id")
+                return first_truthy(item, _ID_KEYS)
         if isinstance(val, str):
             return val
     # Nested: success[0].campaignId etc
     for succ in result.get("success", []) or []:
         if isinstance(succ, dict):
-            for k in ("campaignId", "adGroupId", "adId", "targetId", "id"):
-                if succ.get(k):
-                    return succ[k]
+            found = first_truthy(succ, _ID_KEYS)
+            if found:
+                return found
     return None
 
 
+_VALID_MATCH_TYPES = frozenset({"EXACT", "PHRASE", "BROAD"})
+# Amazon SP minimum keyword bid.
+_MIN_KEYWORD_BID = 0.02
+
+
+def _match_type(kw: dict) -> str:
+    match = str(kw.get("match_type") or kw.get("matchType") or "BROAD").upper()
+    return match if match in _VALID_MATCH_TYPES else "BROAD"
+
+
+def _kw_to_payload(
+    kw: dict,
+    ad_group_id: str,
+    default_bid: Any,
+    match: Optional[str] = None,
+) -> Optional[dict]:
+    """Build one keyword target payload, or None when the keyword has no text.
+
+    ``match`` short-circuits match-type resolution when the caller already
+    knows it (homogeneous keyword lists).
+    """
+    get = kw.get
+    text = (get("text") or get("keyword") or "").strip()
+    if not text:
+        return None
+    if match is None:
+        match = _match_type(kw)
+    bid_val = get("suggested_bid") or get("suggestedBid") or get("bid") or default_bid
+    try:
+        bid_num = float(bid_val) if bid_val is not None else 0.5
+    except (TypeError, ValueError):
+        bid_num = 0.5
+    # Clamp to Amazon SP minimum so the create call doesn't bounce the
+    # entire batch over a single row that defaulted to 0.0.
+    if bid_num < _MIN_KEYWORD_BID:
+        bid_num = _MIN_KEYWORD_BID
+    return {
+        "adGroupId": ad_group_id,
+        "expression": text,
+        "expressionType": "KEYWORD",
+        "matchType": match,
+        "bid": bid_num,
+        "state": "ENABLED",
+    }
+
+
+def _keyword_payloads(keywords: list[dict], ad_group_id: str, default_bid: Any) -> list[dict]:
+    """Target payloads for an ad group's keywords.
+
+    Plans usually give every keyword the same match type (or none, meaning
+    BROAD); in that case it is resolved once for the whole list.
+    """
+    raw = {kw.get("match_type") or kw.get("matchType") for kw in keywords}
+    match = _match_type({"match_type": raw.pop()}) if len(raw) == 1 else None
+    payloads = (_kw_to_payload(kw, ad_group_id, default_bid, match) for kw in keywords)
+    return [p for p in payloads if p]
+
+
+def _timeout_message() -> str:
+    return f"timed out after {MCP_STAGE_TIMEOUT_SECONDS:g}s"
+
+
 class CampaignCreationService:
     """Executes full campaign creation in sequence via MCP."""
 
@@ -79,7 +172,14 @@ class CampaignCreationService:
         is True (default) and the campaign-level create succeeds but a
         downstream step fatally fails, all created resources are deleted
         in reverse order before returning.
+
+        All MCP calls (creates and any rollback deletes) run inside one
+        ``client.session()`` so they share a keep-alive connection pool.
         """
+        async with self.client.session():
+            return await self._execute_plan(plan, rollback_on_failure=rollback_on_failure)
+
+    async def _execute_plan(self, plan: dict, *, rollback_on_failure: bool) -> dict:
         results: dict[str, Any] = {
             "campaign_id": None,
             "ad_group_ids": [],
@@ -100,20 +200,25 @@ class CampaignCreationService:
         # 1. Create campaign — fatal if this fails
         campaign_payload = self._build_campaign_payload(campaign)
         try:
-            camp_result = await self.client.create_campaign([campaign_payload])
+            async with asyncio.timeout(MCP_STAGE_TIMEOUT_SECONDS):
+                camp_result = await self.client.create_campaign([campaign_payload])
             campaign_id = _extract_id(camp_result, ["campaigns", "campaignId", "success"])
             if not campaign_id:
                 campaign_id = campaign_payload.get("campaignId")
             if campaign_id:
                 results["campaign_id"] = str(campaign_id)
                 rollback_steps.append(("campaign", str(campaign_id)))
-                logger.info(f"Created campaign: {results['campaign_id']}")
+                logger.info("Created campaign: %s", results["campaign_id"])
             else:
                 results["errors"].append(f"Campaign created but no ID returned: {camp_result}")
                 return results
+        except TimeoutError:
+            results["errors"].append(f"Campaign creation failed: {_timeout_message()}")
+            logger.error("Campaign creation timed out")
+            return results
         except Exception as e:
             results["errors"].append(f"Campaign creation failed: {str(e)}")
-            logger.error(f"Campaign creation failed: {e}")
+            logger.error("Campaign creation failed: %s", e)
             return results
 
         # 2. Create ad groups
@@ -121,6 +226,14 @@ class CampaignCreationService:
         if not ad_groups:
             ad_groups = [{"name": "Default Ad Group", "defaultBid": campaign.get("defaultBid", 0.5), "keywords": []}]
 
+        # AUTO campaigns reject keyword targets, so skip them there. Per
+        # Amazon SP API a manual campaign's ad group holds either keyword
+        # OR product targets; we only produce keyword targets here.
+        is_manual = str(first_truthy(campaign, _TARGETING_KEYS, "MANUAL")).upper() == "MANUAL"
+
+        ad_data = plan.get("ad", {})
+        asin = ad_data.get("asin") or campaign.get("asin")
+
         ad_groups_created = 0
         for ag in ad_groups:
             ag_payload = {
@@ -136,7 +249,8 @@ class CampaignCreationService:
                     ag_payload["defaultBid"] = bid
 
             try:
-                ag_result = await self.client.create_ad_group([ag_payload])
+                async with asyncio.timeout(MCP_STAGE_TIMEOUT_SECONDS):
+                    ag_result = await self.client.create_ad_group([ag_payload])
                 ad_group_id = _extract_id(ag_result, ["adGroups", "adGroupId", "success"])
                 if not ad_group_id:
                     results["errors"].append(f"Ad group created but no ID returned: {ag_result}")
@@ -144,90 +258,29 @@ class CampaignCreationService:
                 results["ad_group_ids"].append(str(ad_group_id))
                 rollback_steps.append(("ad_group", str(ad_group_id)))
                 ad_groups_created += 1
-                logger.info(f"Created ad group: {ad_group_id}")
-
-                # 3. Create ad (product ad with ASIN)
-                ad_data = plan.get("ad", {})
-                asin = ad_data.get("asin") or campaign.get("asin")
-                if asin:
-                    ad_payload = {
-                        "adGroupId": ad_group_id,
-                        "asin": asin,
-                        "state": str(ad_data.get("state") or "ENABLED").upper(),
-                    }
-                    if ad_data.get("name"):
-                        ad_payload["name"] = ad_data["name"]
-                    if ad_data.get("sku"):
-                        ad_payload["sku"] = ad_data["sku"]
-                    try:
-                        ad_result = await self.client.create_ad([ad_payload])
-                        ad_id = _extract_id(ad_result, ["ads", "adId", "success"])
-                        if ad_id:
-                            results["ad_ids"].append(str(ad_id))
-                            rollback_steps.append(("ad", str(ad_id)))
-                    except Exception as e:
-                        results["errors"].append(f"Ad creation failed: {str(e)}")
-
-                # 4. Create targets (keywords) — soft errors only.
-                # AUTO campaigns reject keyword targets, so skip them
-                # there. Per Amazon SP API a manual campaign's ad group
-                # holds either keyword OR product targets; we only
-                # produce keyword targets here.
-                campaign_targeting = (
-                    campaign.get("targetingType")
-                    or campaign.get("targeting_type")
-                    or "MANUAL"
-                )
+                logger.info("Created ad group: %s", ad_group_id)
+
+                # 3 + 4. The product ad and keyword targets depend only on
+                # the ad group ID, so create them concurrently. Both are
+                # soft errors — each task records its own failure.
                 keywords = ag.get("keywords", [])
-                if keywords and str(campaign_targeting).upper() == "MANUAL":
-                    target_payloads = []
-                    for kw in keywords:
-                        text = (kw.get("text") or kw.get("keyword") or "").strip()
-                        if not text:
-                            continue
-                        match_raw = (kw.get("match_type") or kw.get("matchType") or "BROAD")
-                        match = str(match_raw).upper()
-                        if match not in ("EXACT", "PHRASE", "BROAD"):
-                            match = "BROAD"
-                        bid_val = (
-                            kw.get("suggested_bid")
-                            or kw.get("suggestedBid")
-                            or kw.get("bid")
-                            or bid
-                        )
-                        try:
-                            bid_num = float(bid_val) if bid_val is not None else 0.5
-                        except (TypeError, ValueError):
-                            bid_num = 0.5
-                        # Clamp to Amazon SP minimum so the create call
-                        # doesn't bounce the entire batch over a single
-                        # row that defaulted to 0.0.
-                        if bid_num < 0.02:
-                            bid_num = 0.02
-                        target_payloads.append({
-                            "adGroupId": ad_group_id,
-                            "expression": text,
-                            "expressionType": "KEYWORD",
-                            "matchType": match,
-                            "bid": bid_num,
-                            "state": "ENABLED",
-                        })
+                target_payloads = (
+                    _keyword_payloads(keywords, ad_group_id, bid) if keywords and is_manual else []
+                )
+                async with asyncio.TaskGroup() as tg:
+                    if asin:
+                        tg.create_task(self._create_ad(
+                            self._build_ad_payload(ad_data, ad_group_id, asin),
+                            results, rollback_steps,
+                        ))
                     if target_payloads:
-                        try:
-                            tgt_result = await self.client.create_target(target_payloads)
-                            ids = tgt_result.get("targets") or tgt_result.get("success", [])
-                            if isinstance(ids, list):
-                                for t in ids:
-                                    if isinstance(t, dict) and t.get("targetId"):
-                                        tid = str(t["targetId"])
-                                        results["target_ids"].append(tid)
-                                        rollback_steps.append(("target", tid))
-                            logger.info(f"Created {len(target_payloads)} targets")
-                        except Exception as e:
-                            results["errors"].append(f"Target creation failed: {str(e)}")
+                        tg.create_task(self._create_targets(target_payloads, results, rollback_steps))
+            except TimeoutError:
+                results["errors"].append(f"Ad group creation failed: {_timeout_message()}")
+                logger.error("Ad group creation timed out")
             except Exception as e:
                 results["errors"].append(f"Ad group creation failed: {str(e)}")
-                logger.error(f"Ad group creation failed: {e}")
+                logger.error("Ad group creation failed: %s", e)
 
         # Rollback — only when *no* ad group was created (campaign is an
         # empty husk). Partial plans (some ad groups created) keep what
@@ -237,6 +290,61 @@ class CampaignCreationService:
             await self._rollback(rollback_steps, results)
         return results
 
+    @staticmethod
+    def _build_ad_payload(ad_data: dict, ad_group_id: str, asin: str) -> dict:
+        ad_payload = {
+            "adGroupId": ad_group_id,
+            "asin": asin,
+            "state": str(ad_data.get("state") or "ENABLED").upper(),
+        }
+        if ad_data.get("name"):
+            ad_payload["name"] = ad_data["name"]
+        if ad_data.get("sku"):
+            ad_payload["sku"] = ad_data["sku"]
+        return ad_payload
+
+    async def _create_ad(
+        self,
+        ad_payload: dict,
+        results: dict,
+        rollback_steps: list[tuple[str, str]],
+    ) -> None:
+        """Create the product ad for one ad group. Soft error, never raises."""
+        try:
+            async with asyncio.timeout(MCP_STAGE_TIMEOUT_SECONDS):
+                ad_result = await self.client.create_ad([ad_payload])
+            ad_id = _extract_id(ad_result, ["ads", "adId", "success"])
+            if ad_id:
+                results["ad_ids"].append(str(ad_id))
+                rollback_steps.append(("ad", str(ad_id)))
+        except TimeoutError:
+            results["errors"].append(f"Ad creation failed: {_timeout_message()}")
+        except Exception as e:
+            results["errors"].append(f"Ad creation failed: {str(e)}")
+
+    async def _create_targets(
+        self,
+        target_payloads: list[dict],
+        results: dict,
+        rollback_steps: list[tuple[str, str]],
+    ) -> None:
+        """Create keyword targets for one ad group. Soft error, never raises."""
+        try:
+            async with asyncio.timeout(MCP_STAGE_TIMEOUT_SECONDS):
+                tgt_result = await self.client.create_target(target_payloads)
+            ids = tgt_result.get("targets") or tgt_result.get("success", [])
+            if isinstance(ids, list):
+                for t in ids:
+                    if isinstance(t, dict) and t.get("targetId"):
+                        tid = str(t["targetId"])
+                        results["target_ids"].append(tid)
+                        rollback_steps.append(("target", tid))
+            logger.info("Created %d targets", len(target_payloads))
+        except TimeoutError:
+            results["errors"].append(f"Target creation failed: {_timeout_message()}")
+        except Exception as e:
+            results["errors"].append(f"Target creation failed: {str(e)}")
+
     async def _rollback(
         self,
         steps: list[tuple[str, str]],
@@ -278,18 +386,10 @@ class CampaignCreationService:
         lowercase values which Amazon silently accepted only sometimes;
         normalising here removes that variance.
         """
-        ad_product = (
-            campaign.get("adProduct")
-            or campaign.get("ad_product")
-            or campaign.get("type")
-            or "SPONSORED_PRODUCTS"
-        )
-        targeting = campaign.get("targetingType") or campaign.get("targeting_type") or "MANUAL"
-        state = campaign.get("state") or "ENABLED"
         return {
             "name": campaign.get("name", "New Campaign"),
-            "adProduct": str(ad_product).upper(),
-            "targetingType": str(targeting).upper(),
-            "state": str(state).upper(),
-            "dailyBudget": float(campaign.get("dailyBudget") or campaign.get("daily_budget") or 50),
+            "adProduct": str(first_truthy(campaign, _AD_PRODUCT_KEYS, "SPONSORED_PRODUCTS")).upper(),
+            "targetingType": str(first_truthy(campaign, _TARGETING_KEYS, "MANUAL")).upper(),
+            "state": str(campaign.get("state") or "ENABLED").upper(),
+            "dailyBudget": float(first_truthy(campaign, _DAILY_BUDGET_KEYS, _DEFAULT_DAILY_BUDGET)),
         }
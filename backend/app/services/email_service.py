@@ -1,28 +1,134 @@
 """
 Email service using Resend for invite and password reset notifications.
+
+Each notification has a sync entrypoint (Resend SDK, for scripts and thread
+callers) and an ``*_async`` variant that POSTs to the Resend REST API through
+a shared ``httpx.AsyncClient`` so request handlers never block the event loop.
 """
 
+import asyncio
 import logging
+from html import escape as _esc
 from typing import Optional
 
+import httpx
+
+from app.http_client import SharedAsyncClient
+
 logger = logging.getLogger(__name__)
 
+RESEND_API_BASE = "https://api.resend.com"
+RESEND_TIMEOUT_SECONDS = 10.0
+# Resend's /emails/batch endpoint accepts at most 100 messages per request.
+RESEND_BATCH_LIMIT = 100
+
+_HTTP = SharedAsyncClient(base_url=RESEND_API_BASE, timeout=RESEND_TIMEOUT_SECONDS)
+# Settings when Resend is configured, else None. Set by reload_email_config().
+_SETTINGS = None
+
+
+def _http() -> httpx.AsyncClient:
+    """Return the shared Resend HTTP client, creating it on first use."""
+    return _HTTP.get()
 
-def send_invite_email(to_email: str, invite_link: str, inviter_name: Optional[str] = None) -> bool:
-    """Send invitation email via Resend. Returns True if sent, False if skipped (no API key)."""
-    from app.config import get_settings
-    settings = get_settings()
-    if not settings.resend_api_key or not settings.from_email:
-        logger.info("Resend not configured; skipping invite email")
-        return False
 
+def _auth(settings) -> dict:
+    """Per-request auth header, so a reloaded API key applies to the next send."""
+    return {"Authorization": f"Bearer {settings.resend_api_key}"}
+
+
+async def close_http_client() -> None:
+    """Close the shared Resend client (called from app shutdown)."""
+    await _HTTP.aclose()
+
+
+def reload_email_config() -> bool:
+    """Re-read Resend settings; returns True when email sending is enabled.
+
+    Runs once at import so every send can skip settings lookups when Resend
+    is not configured (dev, CI). Call again after changing settings.
+    """
+    global _SETTINGS
     try:
-        import resend
-        resend.api_key = settings.resend_api_key
+        from app.config import get_settings
+        settings = get_settings()
+        _SETTINGS = settings if settings.resend_api_key and settings.from_email else None
+    except Exception as e:
+        logger.warning("Email settings unavailable; email disabled: %s", e)
+        _SETTINGS = None
+    return _SETTINGS is not None
+
+
+def _configured_settings(kind: str):
+    """Return settings when Resend is configured, else log and return None."""
+    if _SETTINGS is None:
+        logger.info("Resend not configured; skipping %s", kind)
+    return _SETTINGS
+
 
-        inviter = inviter_name or "Your administrator"
-        subject = "You're invited to Amazon Ads Optimizer"
-        html = f"""
+def _params(settings, to_email: str, subject: str, html: str) -> dict:
+    return {
+        "from": settings.from_email,
+        "to": [to_email],
+        "subject": subject,
+        "html": html,
+    }
+
+
+def _send(settings, params: dict) -> None:
+    import resend
+    resend.api_key = settings.resend_api_key
+    resend.Emails.send(params)
+
+
+async def _send_async(settings, params: dict) -> None:
+    r = await _http().post("/emails", json=params, headers=_auth(settings))
+    r.raise_for_status()
+
+
+def _batches(params_list: list[dict]) -> list[list[dict]]:
+    return [
+        params_list[i:i + RESEND_BATCH_LIMIT]
+        for i in range(0, len(params_list), RESEND_BATCH_LIMIT)
+    ]
+
+
+def _send_batch(settings, params_list: list[dict], kind: str) -> int:
+    """Send via ``resend.Batch``; returns how many messages were accepted."""
+    import resend
+    resend.api_key = settings.resend_api_key
+    sent = 0
+    for chunk in _batches(params_list):
+        try:
+            resend.Batch.send(chunk)
+            sent += len(chunk)
+        except Exception as e:
+            logger.exception("Failed to send %s batch of %d: %s", kind, len(chunk), e)
+    return sent
+
+
+async def _send_batch_async(settings, params_list: list[dict], kind: str) -> int:
+    """POST every chunk to ``/emails/batch`` concurrently; returns messages accepted."""
+    http = _http()
+    headers = _auth(settings)
+
+    async def post(chunk: list[dict]) -> int:
+        try:
+            r = await http.post("/emails/batch", json=chunk, headers=headers)
+            r.raise_for_status()
+            return len(chunk)
+        except Exception as e:
+            logger.exception("Failed to send %s batch of %d: %s", kind, len(chunk), e)
+            return 0
+
+    return sum(await asyncio.gather(*(post(c) for c in _batches(params_list))))
+
+
+# Message bodies are rendered once per send with ``str.format_map``. Every
+# interpolated value that can carry user input (names, links, error text) is
+# HTML-escaped first.
+_INVITE_SUBJECT = "You're invited to Amazon Ads Optimizer"
+_INVITE_HTML = """
         <p>Hello,</p>
         <p>{inviter} has invited you to join Amazon Ads Optimizer.</p>
         <p>Click the link below to create your account and set your password:</p>
@@ -33,34 +139,8 @@ def send_invite_email(to_email: str, invite_link: str, inviter_name: Optional[st
         <p>— Amazon Ads Optimizer</p>
         """
 
-        params = {
-            "from": settings.from_email,
-            "to": [to_email],
-            "subject": subject,
-            "html": html,
-        }
-        resend.Emails.send(params)
-        logger.info(f"Invite email sent to {to_email}")
-        return True
-    except Exception as e:
-        logger.exception(f"Failed to send invite email to {to_email}: {e}")
-        return False
-
-
-def send_password_reset_email(to_email: str, reset_link: str) -> bool:
-    """Send password reset email via Resend. Returns True if sent, False if skipped."""
-    from app.config import get_settings
-    settings = get_settings()
-    if not settings.resend_api_key or not settings.from_email:
-        logger.info("Resend not configured; skipping password reset email")
-        return False
-
-    try:
-        import resend
-        resend.api_key = settings.resend_api_key
-
-        subject = "Reset your Amazon Ads Optimizer password"
-        html = f"""
+_RESET_SUBJECT = "Reset your Amazon Ads Optimizer password"
+_RESET_HTML = """
         <p>Hello,</p>
         <p>You requested a password reset for your Amazon Ads Optimizer account.</p>
         <p>Click the link below to set a new password:</p>
@@ -71,61 +151,23 @@ def send_password_reset_email(to_email: str, reset_link: str) -> bool:
         <p>— Amazon Ads Optimizer</p>
         """
 
-        params = {
-            "from": settings.from_email,
-            "to": [to_email],
-            "subject": subject,
-            "html": html,
-        }
-        resend.Emails.send(params)
-        logger.info(f"Password reset email sent to {to_email}")
-        return True
-    except Exception as e:
-        logger.exception(f"Failed to send password reset email to {to_email}: {e}")
-        return False
-
-
-def send_sync_complete_email(
-    to_email: str,
-    success: bool,
-    stats: Optional[dict] = None,
-    error_message: Optional[str] = None,
-    account_name: Optional[str] = None,
-) -> bool:
-    """Send campaign sync completion email. Returns True if sent, False if skipped."""
-    from app.config import get_settings
-    settings = get_settings()
-    if not settings.resend_api_key or not settings.from_email:
-        logger.info("Resend not configured; skipping sync complete email")
-        return False
-
-    try:
-        import resend
-        resend.api_key = settings.resend_api_key
-
-        if success:
-            subject = "Campaign sync completed — Amazon Ads Optimizer"
-            stats_str = ""
-            if stats:
-                stats_str = (
-                    f"<p><strong>Synced:</strong> {stats.get('campaigns', 0)} campaigns, "
-                    f"{stats.get('ad_groups', 0)} ad groups, "
-                    f"{stats.get('targets', 0)} targets, "
-                    f"{stats.get('ads', 0)} ads</p>"
-                )
-            account_str = f" for {account_name}" if account_name else ""
-            html = f"""
+_SYNC_OK_SUBJECT = "Campaign sync completed — Amazon Ads Optimizer"
+_SYNC_OK_HTML = """
             <p>Hello,</p>
             <p>Your campaign sync{account_str} has completed successfully.</p>
             {stats_str}
             <p>You can now view your updated campaigns in the Campaign Manager.</p>
             <p>— Amazon Ads Optimizer</p>
             """
-        else:
-            subject = "Campaign sync failed — Amazon Ads Optimizer"
-            err = error_message or "An unknown error occurred."
-            account_str = f" for {account_name}" if account_name else ""
-            html = f"""
+_SYNC_STATS_HTML = (
+    "<p><strong>Synced:</strong> {campaigns} campaigns, "
+    "{ad_groups} ad groups, "
+    "{targets} targets, "
+    "{ads} ads</p>"
+)
+
+_SYNC_FAILED_SUBJECT = "Campaign sync failed — Amazon Ads Optimizer"
+_SYNC_FAILED_HTML = """
             <p>Hello,</p>
             <p>Your campaign sync{account_str} failed.</p>
             <p><strong>Error:</strong> {err}</p>
@@ -133,41 +175,209 @@ def send_sync_complete_email(
             <p>— Amazon Ads Optimizer</p>
             """
 
-        params = {
-            "from": settings.from_email,
-            "to": [to_email],
-            "subject": subject,
-            "html": html,
-        }
-        resend.Emails.send(params)
-        logger.info(f"Sync complete email sent to {to_email} (success={success})")
+
+def _invite_message(invite_link: str, inviter_name: Optional[str]) -> tuple[str, str]:
+    html = _INVITE_HTML.format_map({
+        "inviter": _esc(inviter_name or "Your administrator"),
+        "invite_link": _esc(invite_link),
+    })
+    return _INVITE_SUBJECT, html
+
+
+def _password_reset_message(reset_link: str) -> tuple[str, str]:
+    return _RESET_SUBJECT, _RESET_HTML.format_map({"reset_link": _esc(reset_link)})
+
+
+def _sync_complete_message(
+    success: bool,
+    stats: Optional[dict],
+    error_message: Optional[str],
+    account_name: Optional[str],
+) -> tuple[str, str]:
+    account_str = f" for {_esc(account_name)}" if account_name else ""
+    if success:
+        stats_str = ""
+        if stats:
+            stats_str = _SYNC_STATS_HTML.format_map({
+                "campaigns": stats.get("campaigns", 0),
+                "ad_groups": stats.get("ad_groups", 0),
+                "targets": stats.get("targets", 0),
+                "ads": stats.get("ads", 0),
+            })
+        html = _SYNC_OK_HTML.format_map({"account_str": account_str, "stats_str": stats_str})
+        return _SYNC_OK_SUBJECT, html
+    html = _SYNC_FAILED_HTML.format_map({
+        "account_str": account_str,
+        "err": _esc(error_message or "An unknown error occurred."),
+    })
+    return _SYNC_FAILED_SUBJECT, html
+
+
+def send_invite_email(to_email: str, invite_link: str, inviter_name: Optional[str] = None) -> bool:
+    """Send invitation email via Resend. Returns True if sent, False if skipped (no API key)."""
+    settings = _configured_settings("invite email")
+    if settings is None:
+        return False
+    try:
+        subject, html = _invite_message(invite_link, inviter_name)
+        _send(settings, _params(settings, to_email, subject, html))
+        logger.info("Invite email sent to %s", to_email)
+        return True
+    except Exception as e:
+        logger.exception("Failed to send invite email to %s: %s", to_email, e)
+        return False
+
+
+async def send_invite_email_async(
+    to_email: str, invite_link: str, inviter_name: Optional[str] = None
+) -> bool:
+    """Async variant of :func:`send_invite_email` using the shared HTTP client."""
+    settings = _configured_settings("invite email")
+    if settings is None:
+        return False
+    try:
+        subject, html = _invite_message(invite_link, inviter_name)
+        await _send_async(settings, _params(settings, to_email, subject, html))
+        logger.info("Invite email sent to %s", to_email)
+        return True
+    except Exception as e:
+        logger.exception("Failed to send invite email to %s: %s", to_email, e)
+        return False
+
+
+def send_password_reset_email(to_email: str, reset_link: str) -> bool:
+    """Send password reset email via Resend. Returns True if sent, False if skipped."""
+    settings = _configured_settings("password reset email")
+    if settings is None:
+        return False
+    try:
+        subject, html = _password_reset_message(reset_link)
+        _send(settings, _params(settings, to_email, subject, html))
+        logger.info("Password reset email sent to %s", to_email)
         return True
     except Exception as e:
-        logger.exception(f"Failed to send sync complete email to {to_email}: {e}")
+        logger.exception("Failed to send password reset email to %s: %s", to_email, e)
         return False
 
 
+async def send_password_reset_email_async(to_email: str, reset_link: str) -> bool:
+    """Async variant of :func:`send_password_reset_email`."""
+    settings = _configured_settings("password reset email")
+    if settings is None:
+        return False
+    try:
+        subject, html = _password_reset_message(reset_link)
+        await _send_async(settings, _params(settings, to_email, subject, html))
+        logger.info("Password reset email sent to %s", to_email)
+        return True
+    except Exception as e:
+        logger.exception("Failed to send password reset email to %s: %s", to_email, e)
+        return False
+
+
+def send_sync_complete_emails(
+    recipients: list[str],
+    success: bool,
+    stats: Optional[dict] = None,
+    error_message: Optional[str] = None,
+    account_name: Optional[str] = None,
+) -> int:
+    """Send one sync completion email per recipient in batched Resend calls.
+
+    Returns the number of emails sent (0 when Resend is not configured).
+    """
+    if not recipients:
+        return 0
+    settings = _configured_settings("sync complete email")
+    if settings is None:
+        return 0
+    subject, html = _sync_complete_message(success, stats, error_message, account_name)
+    sent = _send_batch(
+        settings,
+        [_params(settings, to, subject, html) for to in recipients],
+        "sync complete email",
+    )
+    logger.info("Sync complete email sent to %d/%d recipients (success=%s)", sent, len(recipients), success)
+    return sent
+
+
+async def send_sync_complete_emails_async(
+    recipients: list[str],
+    success: bool,
+    stats: Optional[dict] = None,
+    error_message: Optional[str] = None,
+    account_name: Optional[str] = None,
+) -> int:
+    """Async variant of :func:`send_sync_complete_emails`."""
+    if not recipients:
+        return 0
+    settings = _configured_settings("sync complete email")
+    if settings is None:
+        return 0
+    subject, html = _sync_complete_message(success, stats, error_message, account_name)
+    sent = await _send_batch_async(
+        settings,
+        [_params(settings, to, subject, html) for to in recipients],
+        "sync complete email",
+    )
+    logger.info("Sync complete email sent to %d/%d recipients (success=%s)", sent, len(recipients), success)
+    return sent
+
+
+def send_sync_complete_email(
+    to_email: str,
+    success: bool,
+    stats: Optional[dict] = None,
+    error_message: Optional[str] = None,
+    account_name: Optional[str] = None,
+) -> bool:
+    """Send campaign sync completion email. Returns True if sent, False if skipped."""
+    return send_sync_complete_emails(
+        [to_email], success, stats, error_message, account_name
+    ) == 1
+
+
+async def send_sync_complete_email_async(
+    to_email: str,
+    success: bool,
+    stats: Optional[dict] = None,
+    error_message: Optional[str] = None,
+    account_name: Optional[str] = None,
+) -> bool:
+    """Async variant of :func:`send_sync_complete_email`."""
+    return await send_sync_complete_emails_async(
+        [to_email], success, stats, error_message, account_name
+    ) == 1
+
+
 def send_weekly_digest_email(to_email: str, html_body: str) -> bool:
     """Send weekly digest. Returns True if sent."""
-    from app.config import get_settings
+    settings = _configured_settings("weekly digest")
+    if settings is None:
+        return False
+    try:
+        _send(settings, _params(settings, to_email, "Weekly Amazon Ads digest", html_body))
+        logger.info("Weekly digest sent to %s", to_email)
+        return True
+    except Exception as e:
+        logger.exception("Failed to send weekly digest to %s: %s", to_email, e)
+        return False
+
 
-    settings = get_settings()
-    if not settings.resend_api_key or not settings.from_email:
-        logger.info("Resend not configured; skipping weekly digest")
+async def send_weekly_digest_email_async(to_email: str, html_body: str) -> bool:
+    """Async variant of :func:`send_weekly_digest_email`."""
+    settings = _configured_settings("weekly digest")
+    if settings is None:
         return False
     try:
-        import resend
-
-        resend.api_key = settings.resend_api_key
-        params = {
-            "from": settings.from_email,
-            "to": [to_email],
-            "subject": "Weekly Amazon Ads digest",
-            "html": html_body,
-        }
-        resend.Emails.send(params)
+        await _send_async(
+            settings, _params(settings, to_email, "Weekly Amazon Ads digest", html_body)
+        )
         logger.info("Weekly digest sent to %s", to_email)
         return True
     except Exception as e:
         logger.exception("Failed to send weekly digest to %s: %s", to_email, e)
         return False
+
+
+reload_email_config()
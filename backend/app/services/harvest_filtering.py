@@ -5,8 +5,15 @@ Used by HarvestService, harvest preview API, and unit tests.
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional
 
+from app.utils import first_present, first_truthy
+
+# Field-name fallbacks across MCP target row variants, in lookup order.
+KEYWORD_TEXT_KEYS = ("keyword", "keywordText", "expression", "text")
+SPEND_KEYS = ("spend", "cost")
+
 
 def _to_float(value: Any) -> float:
     if value is None:
@@ -31,15 +38,16 @@ def _flat_target_row(t: dict) -> dict:
     return merged
 
 
-def _window_order(lookback_days: int) -> list[str]:
+@functools.lru_cache(maxsize=None)
+def _window_order(lookback_days: int) -> tuple[str, ...]:
     lb = max(1, min(int(lookback_days or 30), 90))
     if lb <= 1:
-        return ["1d", "7d", "14d", "30d", "any"]
+        return ("1d", "7d", "14d", "30d", "any")
     if lb <= 7:
-        return ["7d", "14d", "30d", "1d", "any"]
+        return ("7d", "14d", "30d", "1d", "any")
     if lb <= 14:
-        return ["14d", "7d", "30d", "1d", "any"]
-    return ["30d", "14d", "7d", "1d", "any"]
+        return ("14d", "7d", "30d", "1d", "any")
+    return ("30d", "14d", "7d", "1d", "any")
 
 
 def _first_present_float(t: dict, keys: tuple[str, ...]) -> float:
@@ -49,6 +57,7 @@ def _first_present_float(t: dict, keys: tuple[str, ...]) -> float:
     return 0.0
 
 
+@functools.lru_cache(maxsize=None)
 def _keys_for_window(metric: str, window: str) -> tuple[str, ...]:
     """Ordered MCP / Ads field names for sales | clicks | acos."""
     if window == "any":
@@ -111,7 +120,10 @@ def pick_harvest_metrics(target: dict, lookback_days: int) -> tuple[float, float
     Best-effort (sales, acos, clicks, window_label) aligned to lookback_days.
     Falls back to aggregate / unqualified fields when window-specific data is absent.
     """
-    t = _flat_target_row(target)
+    return _pick_flat_metrics(_flat_target_row(target), lookback_days)
+
+
+def _pick_flat_metrics(t: dict, lookback_days: int) -> tuple[float, float, float, str]:
     for window in _window_order(lookback_days):
         if window == "any":
             s = _first_present_float(t, _keys_for_window("sales", "any"))
@@ -166,27 +178,28 @@ def filter_target_list_for_harvest(
     want_mt = _norm_match_type(match_type_filter)
     qualified: list[dict] = []
     window_used = "aggregate"
+    try:
+        min_sales = float(sales_threshold)
+        max_acos = float(acos_threshold) if acos_threshold is not None else None
+        min_clicks = int(clicks_threshold) if clicks_threshold is not None else None
+        thresholds_ok = True
+    except (TypeError, ValueError):
+        # Unparseable thresholds qualify nothing.
+        thresholds_ok = False
     for t in target_list:
         row = _flat_target_row(t)
-        kw_text = (
-            row.get("keyword")
-            or row.get("keywordText")
-            or row.get("expression")
-            or row.get("text")
-        )
+        kw_text = first_truthy(row, KEYWORD_TEXT_KEYS)
         if not kw_text:
             continue
-        sales, acos, clicks, win = pick_harvest_metrics(row, lookback_days)
+        sales, acos, clicks, win = _pick_flat_metrics(row, lookback_days)
         if win != "aggregate":
             window_used = win
-        try:
-            if float(sales) < float(sales_threshold):
-                continue
-            if acos_threshold is not None and float(acos) > float(acos_threshold):
-                continue
-            if clicks_threshold is not None and int(clicks) < int(clicks_threshold):
-                continue
-        except (TypeError, ValueError):
+        # pick_harvest_metrics always returns floats, so compare directly.
+        if not thresholds_ok or sales < min_sales:
+            continue
+        if max_acos is not None and acos > max_acos:
+            continue
+        if min_clicks is not None and clicks < min_clicks:
             continue
         effective_mt = want_mt or _norm_match_type(row.get("matchType")) or "BROAD"
         qualified.append({
@@ -195,7 +208,7 @@ def filter_target_list_for_harvest(
             "bid": row.get("bid"),
             "clicks": clicks,
             "sales": sales,
-            "spend": row.get("spend") or row.get("cost"),
+            "spend": first_present(row, SPEND_KEYS),
             "acos": acos,
         })
     return qualified, window_used
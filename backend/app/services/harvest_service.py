@@ -8,10 +8,13 @@ Also handles negative keyword creation in source auto campaigns to prevent
 cannibalization between auto and manual campaigns.
 """
 
+import asyncio
 import logging
+import time
 from typing import Optional
 
 from app.mcp_client import AmazonAdsMCP
+from app.utils import first_list, first_present
 from app.services.harvest_filtering import (
     filter_target_list_for_harvest,
     normalize_target_list,
@@ -19,10 +22,27 @@ from app.services.harvest_filtering import (
 
 logger = logging.getLogger(__name__)
 
+# create_target payloads are split into chunks of this size, with at most
+# TARGET_CREATE_CONCURRENCY chunk requests in flight.
+TARGET_CREATE_CHUNK_SIZE = 100
+TARGET_CREATE_CONCURRENCY = 4
+
+# How long a resolved source ad-group id is reused per service instance.
+AD_GROUP_CACHE_TTL_SECONDS = 300.0
+_AD_GROUP_LIST_KEYS = ("adGroups", "result", "results", "items")
+
+# Keys create_campaign_harvest_targets has used for each field, in lookup
+# order. Checked at the top level first, then under ``result``.
+_CAMPAIGN_ID_KEYS = ("targetCampaignId", "campaignId", "manualCampaignId")
+_KEYWORD_COUNT_KEYS = ("keywordsHarvested", "keywords_harvested", "count")
+_KEYWORD_LIST_KEYS = ("keywords", "harvestedKeywords", "targets")
+
 
 class HarvestService:
     def __init__(self, client: AmazonAdsMCP):
         self.client = client
+        # campaign_id -> (ad_group_id, expires_at)
+        self._ad_group_cache: dict[str, tuple[str, float]] = {}
 
     async def execute_harvest(
         self,
@@ -143,8 +163,23 @@ class HarvestService:
         Manual harvest: get candidates from source, add as targets to existing campaign.
         """
         try:
-            # Step 1: Get keyword candidates from source auto campaign
-            candidates = await self.get_harvest_candidates(source_campaign_id)
+            # Step 1: Get keyword candidates from source auto campaign. When
+            # negating, look up the source ad group at the same time — the
+            # two queries are independent.
+            if negate_in_source and target_ad_group_id:
+                candidates, source_ad_group_id = await asyncio.gather(
+                    self.get_harvest_candidates(source_campaign_id),
+                    self._first_ad_group_id(source_campaign_id),
+                    return_exceptions=True,
+                )
+                if isinstance(candidates, BaseException):
+                    raise candidates
+                if isinstance(source_ad_group_id, BaseException):
+                    # Negation is best-effort and retries the lookup itself.
+                    source_ad_group_id = None
+            else:
+                candidates = await self.get_harvest_candidates(source_campaign_id)
+                source_ad_group_id = None
             raw_targets = candidates.get("targets", {})
             target_list = normalize_target_list(raw_targets)
             qualified_keywords, metrics_window = filter_target_list_for_harvest(
@@ -210,21 +245,29 @@ class HarvestService:
                     target_entry["bid"] = kw["bid"]
                 create_targets.append(target_entry)
 
-            create_result = await self.client.call_tool(
-                "campaign_management-create_target",
-                {"body": {"targets": create_targets}},
-            )
-            logger.info(f"Created {len(create_targets)} targets in campaign {target_campaign_id}")
-
-            # Step 5: Negate harvested keywords in the source auto campaign
+            created, create_results, create_errors = await self._create_targets_batched(create_targets)
+            if not created:
+                raise create_errors[0]
+            logger.info(f"Created {len(created)} targets in campaign {target_campaign_id}")
+            if create_errors:
+                created_texts = {t["keyword"] for t in created}
+                qualified_keywords = [
+                    kw for kw in qualified_keywords if kw["keyword"] in created_texts
+                ]
+
+            # Step 5: Negate harvested keywords in the source auto campaign.
+            # Deliberately after the positive create succeeds, and only for
+            # keywords that landed: negating first would drop the traffic
+            # if the create then failed.
             negated_count = 0
             if negate_in_source:
                 negated_count = await self._negate_keywords_in_source(
                     source_campaign_id=source_campaign_id,
                     keywords=qualified_keywords,
+                    source_ad_group_id=source_ad_group_id,
                 )
 
-            return {
+            result = {
                 "status": "success",
                 "mode": "existing_campaign",
                 "source_campaign_id": source_campaign_id,
@@ -234,8 +277,11 @@ class HarvestService:
                 "keywords_negated_in_source": negated_count,
                 "keywords": qualified_keywords,
                 "metrics_window": metrics_window,
-                "create_result": create_result,
+                "create_result": create_results[0] if len(create_results) == 1 else create_results,
             }
+            if create_errors:
+                result["create_errors"] = [str(e) for e in create_errors]
+            return result
 
         except Exception as e:
             logger.error(f"Harvest to existing campaign failed: {e}")
@@ -247,38 +293,82 @@ class HarvestService:
                 "error": str(e),
             }
 
+    async def _create_targets_batched(
+        self,
+        targets: list[dict],
+        chunk_size: int = TARGET_CREATE_CHUNK_SIZE,
+        concurrency: int = TARGET_CREATE_CONCURRENCY,
+    ) -> tuple[list[dict], list, list[Exception]]:
+        """Submit ``create_target`` in concurrent chunks.
+
+        Returns ``(created_targets, chunk_results, errors)``: the payloads
+        from chunks that succeeded, the raw tool results for those chunks,
+        and one exception per failed chunk. Never raises.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+
+        async def submit(chunk: list[dict]):
+            async with sem:
+                return await self.client.call_tool(
+                    "campaign_management-create_target",
+                    {"body": {"targets": chunk}},
+                )
+
+        outcomes = await asyncio.gather(*(submit(c) for c in chunks), return_exceptions=True)
+        created: list[dict] = []
+        results = []
+        errors: list[Exception] = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append(outcome)
+                continue
+            created.extend(chunk)
+            results.append(outcome)
+        return created, results, errors
+
+    async def _first_ad_group_id(self, campaign_id: str) -> Optional[str]:
+        """ID of the first ad group in a campaign, or None if it has none.
+
+        Found ids are cached for AD_GROUP_CACHE_TTL_SECONDS on this instance.
+        """
+        cached = self._ad_group_cache.get(campaign_id)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        ad_groups_result = await self.client.query_ad_groups(campaign_id=campaign_id)
+        ad_group_list = first_list(ad_groups_result, _AD_GROUP_LIST_KEYS) if isinstance(ad_groups_result, dict) else []
+        if not ad_group_list:
+            self._ad_group_cache.pop(campaign_id, None)
+            return None
+        ad_group_id = ad_group_list[0].get("adGroupId") or ad_group_list[0].get("id")
+        if ad_group_id:
+            self._ad_group_cache[campaign_id] = (ad_group_id, time.monotonic() + AD_GROUP_CACHE_TTL_SECONDS)
+        return ad_group_id
+
     async def _negate_keywords_in_source(
         self,
         source_campaign_id: str,
         keywords: list[dict],
+        source_ad_group_id: Optional[str] = None,
     ) -> int:
         """
         Add harvested keywords as negative exact targets in the source auto campaign.
         This prevents the auto campaign from bidding on keywords now handled by
         the manual campaign, avoiding cannibalization and wasted spend.
+
+        Pass ``source_ad_group_id`` when the caller already looked it up to
+        skip the ``query_ad_groups`` round-trip.
         """
         if not keywords:
             return 0
 
         try:
-            # Get ad groups in the source campaign for negation
-            ad_groups_result = await self.client.query_ad_groups(campaign_id=source_campaign_id)
-            ad_group_list = []
-            if isinstance(ad_groups_result, dict):
-                for key in ["adGroups", "result", "results", "items"]:
-                    if key in ad_groups_result and isinstance(ad_groups_result[key], list):
-                        ad_group_list = ad_groups_result[key]
-                        break
-
-            if not ad_group_list:
+            if not source_ad_group_id:
+                source_ad_group_id = await self._first_ad_group_id(source_campaign_id)
+            if not source_ad_group_id:
                 logger.warning(f"No ad groups found in source campaign {source_campaign_id} for negation")
                 return 0
 
-            source_ad_group_id = (
-                ad_group_list[0].get("adGroupId")
-                or ad_group_list[0].get("id")
-            )
-
             # Create negative keyword targets
             negative_targets = []
             for kw in keywords:
@@ -294,17 +384,21 @@ class HarvestService:
                     "adProduct": "SPONSORED_PRODUCTS",
                 })
 
-            if negative_targets:
-                await self.client.call_tool(
-                    "campaign_management-create_target",
-                    {"body": {"targets": negative_targets}},
-                )
-                logger.info(f"Created {len(negative_targets)} negative keywords in source campaign {source_campaign_id}")
-
-            return len(negative_targets)
+            if not negative_targets:
+                return 0
+            created, _, errors = await self._create_targets_batched(negative_targets)
+            for e in errors:
+                logger.warning(f"Failed to negate keyword chunk in source campaign: {e}")
+            if errors:
+                # The cached ad group may be stale (archived/moved); re-resolve next time.
+                self._ad_group_cache.pop(source_campaign_id, None)
+            if created:
+                logger.info(f"Created {len(created)} negative keywords in source campaign {source_campaign_id}")
+            return len(created)
 
         except Exception as e:
             logger.warning(f"Failed to negate keywords in source campaign: {e}")
+            self._ad_group_cache.pop(source_campaign_id, None)
             return 0
 
     async def get_harvest_candidates(self, source_campaign_id: str) -> dict:
@@ -322,21 +416,20 @@ class HarvestService:
     @staticmethod
     def _extract_target_id(result: dict) -> Optional[str]:
         """Extract the created manual campaign ID from the harvest result."""
-        if isinstance(result, dict):
-            for key in ["targetCampaignId", "campaignId", "manualCampaignId"]:
-                if key in result:
-                    return result[key]
-            if "result" in result and isinstance(result["result"], dict):
-                for key in ["targetCampaignId", "campaignId", "manualCampaignId"]:
-                    if key in result["result"]:
-                        return result["result"][key]
-        return None
+        if not isinstance(result, dict):
+            return None
+        value = first_present(result, _CAMPAIGN_ID_KEYS)
+        if value is None:
+            inner = result.get("result")
+            if isinstance(inner, dict):
+                value = first_present(inner, _CAMPAIGN_ID_KEYS)
+        return value
 
     @staticmethod
     def _extract_keyword_count(result: dict) -> int:
         """Extract the count of harvested keywords from the result."""
         if isinstance(result, dict):
-            for key in ["keywordsHarvested", "keywords_harvested", "count"]:
+            for key in _KEYWORD_COUNT_KEYS:
                 if key in result:
                     try:
                         return int(result[key])
@@ -347,12 +440,11 @@ class HarvestService:
     @staticmethod
     def _extract_keywords(result: dict) -> list[dict]:
         """Extract the list of harvested keywords from the result."""
-        if isinstance(result, dict):
-            for key in ["keywords", "harvestedKeywords", "targets"]:
-                if key in result and isinstance(result[key], list):
-                    return result[key]
-            if "result" in result and isinstance(result["result"], dict):
-                for key in ["keywords", "harvestedKeywords", "targets"]:
-                    if key in result["result"] and isinstance(result["result"][key], list):
-                        return result["result"][key]
-        return []
+        if not isinstance(result, dict):
+            return []
+        keywords = first_list(result, _KEYWORD_LIST_KEYS)
+        if not keywords:
+            inner = result.get("result")
+            if isinstance(inner, dict):
+                keywords = first_list(inner, _KEYWORD_LIST_KEYS)
+        return keywords
@@ -3,16 +3,119 @@ Optimizer Service — Bid optimization engine.
 Calculates optimal bids based on ACOS targets and applies them.
 """
 
+import asyncio
+import functools
 import logging
 from datetime import timedelta
 from typing import Any, Optional
 
 from app.mcp_client import AmazonAdsMCP
 from app.services.reporting_service import ReportingService
-from app.utils import marketplace_today
+from app.utils import first_list, first_present, first_truthy, marketplace_today
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent per-campaign query_targets calls (Amazon Ads rate limits
+# are shared per region, so fan-out stays bounded).
+TARGET_FETCH_CONCURRENCY = 8
+
+# Field-name fallbacks across MCP target row variants, in lookup order.
+TARGET_FIELDS: dict[str, tuple[str, ...]] = {
+    "target_id": ("targetId", "id"),
+    "bid": ("bid", "defaultBid"),
+    "clicks": ("clicks",),
+    "spend": ("spend", "cost"),
+    "sales": ("sales", "attributedSales"),
+}
+
+
+# Reason codes from the bid ladder. Only changes that are actually emitted
+# get their reason string rendered.
+REASON_ACOS_HIGH, REASON_ACOS_ABOVE, REASON_ACOS_LOW, REASON_NO_SALES = range(4)
+NO_CHANGE = -1
+REASON_TEMPLATES: dict[int, str] = {
+    REASON_ACOS_HIGH: "ACOS {acos:.1f}% > target {target_acos}% (high)",
+    REASON_ACOS_ABOVE: "ACOS {acos:.1f}% slightly above target {target_acos}%",
+    REASON_ACOS_LOW: "ACOS {acos:.1f}% well below target (room to grow)",
+    REASON_NO_SALES: "No sales after {clicks} clicks (${spend:.2f} spent)",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _make_kernel(
+    target_acos: float,
+    min_bid: float,
+    max_bid: float,
+    bid_step: float,
+    min_clicks: int,
+):
+    """Build the ACOS bid ladder specialised for one rule's thresholds.
+
+    Rules run repeatedly with the same settings, so derived thresholds are
+    computed once per distinct tuple and bound into the returned closure.
+    """
+    acos_high = target_acos * 1.2
+    acos_low = target_acos * 0.7
+    half_step = bid_step * 0.5
+
+    def kernel(bids, clicks_col, spend_col, sales_col, eligible_col) -> tuple[list[float], list[int]]:
+        new_bids: list[float] = []
+        codes: list[int] = []
+        for current_bid, clicks, spend, sales, eligible in zip(
+            bids, clicks_col, spend_col, sales_col, eligible_col
+        ):
+            new_bid = current_bid
+            code = NO_CHANGE
+            if eligible and clicks >= min_clicks:
+                if sales > 0:
+                    current_acos = spend / sales * 100
+                    if current_acos > acos_high:
+                        # ACOS too high — decrease bid
+                        new_bid = max(current_bid - bid_step, min_bid)
+                        code = REASON_ACOS_HIGH
+                    elif current_acos > target_acos:
+                        # ACOS slightly above target — small decrease
+                        new_bid = max(current_bid - half_step, min_bid)
+                        code = REASON_ACOS_ABOVE
+                    elif current_acos < acos_low:
+                        # ACOS well below target — increase bid to win more
+                        new_bid = min(current_bid + bid_step, max_bid)
+                        code = REASON_ACOS_LOW
+                elif spend > 0:
+                    # Spend with no sales — likely waste
+                    new_bid = max(current_bid - bid_step, min_bid)
+                    code = REASON_NO_SALES
+            new_bids.append(new_bid)
+            codes.append(code)
+        return new_bids, codes
+
+    return kernel
+
+
+def _bid_kernel(
+    bids: list[float],
+    clicks_col: list[int],
+    spend_col: list[float],
+    sales_col: list[float],
+    eligible_col: list[bool],
+    target_acos: float,
+    min_bid: float,
+    max_bid: float,
+    bid_step: float,
+    min_clicks: int,
+) -> tuple[list[float], list[int]]:
+    """Apply the ACOS bid ladder to parallel columns.
+
+    Returns ``(new_bids, codes)``: one entry per target, where ``codes`` holds
+    a ``REASON_*`` constant or ``NO_CHANGE`` (with ``new_bid`` equal to the
+    current bid). Scalar-only and allocation-free per element, so it can be
+    JIT-compiled as-is if a numeric backend is ever added.
+    """
+    kernel = _make_kernel(
+        float(target_acos), float(min_bid), float(max_bid), float(bid_step), int(min_clicks)
+    )
+    return kernel(bids, clicks_col, spend_col, sales_col, eligible_col)
+
 
 class OptimizerService:
     def __init__(
@@ -37,6 +140,7 @@ class OptimizerService:
         min_clicks: int = 10,
         lookback_days: int = 14,
         dry_run: bool = True,
+        include_raw_targets: bool = False,
     ) -> dict:
         """
         Analyze targets and calculate optimal bids based on ACOS target.
@@ -56,6 +160,9 @@ class OptimizerService:
             min_clicks: Minimum clicks before making bid decisions
             lookback_days: Performance window for targeting reports (1–90, clamped)
             dry_run: If True, only preview changes without applying
+            include_raw_targets: If True, return the fetched MCP target groups
+                under ``_raw_targets`` (for DB caching). Off by default so the
+                raw payload is not kept alive in the response.
         """
         logger.info(f"Starting bid optimization (dry_run={dry_run})")
 
@@ -79,19 +186,15 @@ class OptimizerService:
             logger.warning(f"Targeting performance report unavailable: {e}")
 
         # Step 2: Get all targets (SP + SB + SD)
+        failed_campaign_ids: list[str] = []
         if campaign_ids:
-            all_targets = []
-            for cid in campaign_ids:
-                targets = await self.client.query_targets(
-                    campaign_id=cid, all_products=True
-                )
-                all_targets.append({"campaign_id": cid, "targets": targets})
+            all_targets, failed_campaign_ids = await self._fetch_campaign_targets(campaign_ids)
         else:
             targets_data = await self.client.query_targets(all_products=True)
             all_targets = [{"campaign_id": "all", "targets": targets_data}]
 
-        # Step 3: Campaign-level report (audit trail / UI); optional
-        report = {}
+        # Step 3: Campaign-level report (audit trail); optional. Only the
+        # report ids are kept — the report itself is fetched by id later.
         try:
             report_config = {
                 "reports": [{
@@ -103,6 +206,7 @@ class OptimizerService:
                 report_config,
                 advertiser_account_id=self.advertiser_account_id,
             )
+            report_meta["campaign_report_ids"] = ReportingService.extract_report_ids(report)
         except Exception as e:
             logger.warning(f"Could not generate campaign summary report: {e}")
 
@@ -139,17 +243,55 @@ class OptimizerService:
                     "preview": adjustments,
                 }
 
-        return {
+        result = {
             "status": "applied" if not dry_run else "preview",
             "dry_run": dry_run,
             "targets_analyzed": adjustments["analyzed"],
             "targets_adjusted": applied_count if not dry_run else len(adjustments["changes"]),
             "changes": adjustments["changes"],
             "summary": adjustments["summary"],
-            "report": report,
             "report_meta": report_meta,
-            "_raw_targets": all_targets,  # raw MCP data for DB caching
+            "failed_campaign_ids": failed_campaign_ids,
         }
+        if failed_campaign_ids:
+            # Only the fetched campaigns were analysed; callers surface the rest.
+            result["summary"]["failed_campaign_ids"] = failed_campaign_ids
+        if include_raw_targets:
+            result["_raw_targets"] = all_targets  # raw MCP data for DB caching
+        return result
+
+    async def _fetch_campaign_targets(
+        self, campaign_ids: list[str]
+    ) -> tuple[list[dict], list[str]]:
+        """Fetch targets for each campaign concurrently (bounded).
+
+        Returns ``(target_groups, failed_campaign_ids)``. A failed campaign is
+        logged and returned in the second list so the run can report that it
+        covered only part of the request; if every fetch fails the first
+        error is raised so the run is reported as failed.
+        """
+        sem = asyncio.Semaphore(TARGET_FETCH_CONCURRENCY)
+
+        async def fetch(cid: str):
+            async with sem:
+                return await self.client.query_targets(campaign_id=cid, all_products=True)
+
+        results = await asyncio.gather(
+            *(fetch(cid) for cid in campaign_ids), return_exceptions=True
+        )
+        all_targets = []
+        errors = []
+        failed_ids = []
+        for cid, res in zip(campaign_ids, results):
+            if isinstance(res, Exception):
+                logger.warning("query_targets failed for campaign %s: %s", cid, res)
+                errors.append(res)
+                failed_ids.append(cid)
+                continue
+            all_targets.append({"campaign_id": cid, "targets": res})
+        if errors and not all_targets:
+            raise errors[0]
+        return all_targets, failed_ids
 
     def _calculate_adjustments(
         self,
@@ -161,97 +303,59 @@ class OptimizerService:
         min_clicks: int,
         metrics_by_target: Optional[dict[str, dict[str, Any]]] = None,
     ) -> dict:
-        """Calculate bid adjustments for each target based on performance."""
-        metrics_by_target = metrics_by_target or {}
-        changes = []
-        analyzed = 0
-        increases = 0
-        decreases = 0
-        unchanged = 0
-
-        for group in all_targets:
-            target_list = self._extract_targets(group.get("targets", {}))
-
-            for target in target_list:
-                analyzed += 1
-                target_id = target.get("targetId") or target.get("id")
-                if target_id is not None:
-                    target_id = str(target_id).strip()
-                # Extract bid from nested MCP format (bid can be dict or float)
-                raw_bid = target.get("bid") or target.get("defaultBid")
-                if isinstance(raw_bid, dict):
-                    raw_bid = raw_bid.get("value") or raw_bid.get("monetaryBid", {}).get("value")
-                current_bid = self._safe_float(raw_bid, 0)
-                # Prefer targeting-report metrics; fall back to MCP query / cache
-                ext = self._metrics_for_target(target_id, metrics_by_target)
-                clicks = ext["clicks"] if ext else self._safe_int(target.get("clicks"), 0)
-                spend = ext["spend"] if ext else self._safe_float(target.get("spend") or target.get("cost"), 0)
-                sales = ext["sales"] if ext else self._safe_float(target.get("sales") or target.get("attributedSales"), 0)
-                state = target.get("state", "").upper()
-
-                # Skip non-enabled targets
-                if state not in ("ENABLED", ""):
-                    unchanged += 1
-                    continue
+        """Calculate bid adjustments for each target based on performance.
 
-                if not target_id or current_bid <= 0:
-                    unchanged += 1
-                    continue
+        Two passes: :meth:`_target_columns` flattens the MCP rows into
+        parallel columns (ids, bids, clicks, spend, sales, eligibility), then
+        :func:`_bid_kernel` runs the decision ladder over plain floats. Change
+        dicts are built only for targets whose bid moves.
+        """
+        ids, bids, clicks_col, spend_col, sales_col, eligible_col = self._target_columns(
+            all_targets, metrics_by_target or {}
+        )
+        analyzed = len(ids)
+        new_bids, codes = _bid_kernel(
+            bids, clicks_col, spend_col, sales_col, eligible_col,
+            target_acos, min_bid, max_bid, bid_step, min_clicks,
+        )
 
-                # Calculate current ACOS
+        emitted = []
+        increases = 0
+        decreases = 0
+        for i, code in enumerate(codes):
+            if code == NO_CHANGE:
+                continue
+            if code == REASON_ACOS_LOW:
+                increases += 1
+            else:
+                decreases += 1
+            current_bid = bids[i]
+            new_bid = new_bids[i]
+            # Only record if bid actually changed
+            if abs(new_bid - current_bid) >= 0.01:
+                sales = sales_col[i]
+                spend = spend_col[i]
                 current_acos = (spend / sales * 100) if sales > 0 else None
+                emitted.append((ids[i], current_bid, new_bid, code, current_acos, clicks_col[i], spend, sales))
+        unchanged = analyzed - increases - decreases
 
-                # Determine action
-                new_bid = current_bid
-                reason = ""
-
-                if clicks >= min_clicks:
-                    if current_acos is not None:
-                        if current_acos > target_acos * 1.2:
-                            # ACOS too high — decrease bid
-                            new_bid = max(current_bid - bid_step, min_bid)
-                            reason = f"ACOS {current_acos:.1f}% > target {target_acos}% (high)"
-                            decreases += 1
-                        elif current_acos > target_acos:
-                            # ACOS slightly above target — small decrease
-                            new_bid = max(current_bid - (bid_step * 0.5), min_bid)
-                            reason = f"ACOS {current_acos:.1f}% slightly above target {target_acos}%"
-                            decreases += 1
-                        elif current_acos < target_acos * 0.7:
-                            # ACOS well below target — increase bid to win more
-                            new_bid = min(current_bid + bid_step, max_bid)
-                            reason = f"ACOS {current_acos:.1f}% well below target (room to grow)"
-                            increases += 1
-                        else:
-                            unchanged += 1
-                            continue
-                    else:
-                        # Spend with no sales — likely waste
-                        if spend > 0:
-                            new_bid = max(current_bid - bid_step, min_bid)
-                            reason = f"No sales after {clicks} clicks (${spend:.2f} spent)"
-                            decreases += 1
-                        else:
-                            unchanged += 1
-                            continue
-                else:
-                    unchanged += 1
-                    continue
-
-                # Only record if bid actually changed
-                if abs(new_bid - current_bid) >= 0.01:
-                    changes.append({
-                        "target_id": str(target_id),
-                        "current_bid": round(current_bid, 2),
-                        "new_bid": round(new_bid, 2),
-                        "change": round(new_bid - current_bid, 2),
-                        "direction": "increase" if new_bid > current_bid else "decrease",
-                        "reason": reason,
-                        "current_acos": round(current_acos, 1) if current_acos else None,
-                        "clicks": clicks,
-                        "spend": round(spend, 2),
-                        "sales": round(sales, 2),
-                    })
+        changes = [
+            {
+                "target_id": target_id,
+                "current_bid": round(current_bid, 2),
+                "new_bid": round(new_bid, 2),
+                "change": round(new_bid - current_bid, 2),
+                "direction": "increase" if new_bid > current_bid else "decrease",
+                "reason": REASON_TEMPLATES[code].format(
+                    acos=current_acos, target_acos=target_acos, clicks=clicks, spend=spend
+                ),
+                "current_acos": round(current_acos, 1) if current_acos else None,
+                "clicks": clicks,
+                "spend": round(spend, 2),
+                "sales": round(sales, 2),
+            }
+            for target_id, current_bid, new_bid, code, current_acos, clicks, spend, sales in emitted
+        ]
 
         return {
             "analyzed": analyzed,
@@ -266,6 +370,61 @@ class OptimizerService:
             },
         }
 
+    def _target_columns(
+        self,
+        all_targets: list[dict],
+        metrics_by_target: dict[str, dict[str, Any]],
+    ) -> tuple[list, list, list, list, list, list]:
+        """Flatten grouped MCP targets into parallel per-field columns.
+
+        ``eligible`` is False for non-enabled targets and targets without an
+        id or a positive bid — they are counted but never adjusted.
+        """
+        ids: list[str] = []
+        bids: list[float] = []
+        clicks_col: list[int] = []
+        spend_col: list[float] = []
+        sales_col: list[float] = []
+        eligible_col: list[bool] = []
+        safe_float = self._safe_float
+        safe_int = self._safe_int
+        id_keys = TARGET_FIELDS["target_id"]
+        bid_keys = TARGET_FIELDS["bid"]
+        clicks_keys = TARGET_FIELDS["clicks"]
+        spend_keys = TARGET_FIELDS["spend"]
+        sales_keys = TARGET_FIELDS["sales"]
+
+        for group in all_targets:
+            for target in self._extract_targets(group.get("targets", {})):
+                target_id = first_truthy(target, id_keys)
+                if target_id is not None:
+                    target_id = str(target_id).strip()
+                # Extract bid from nested MCP format (bid can be dict or float)
+                raw_bid = first_truthy(target, bid_keys)
+                if isinstance(raw_bid, dict):
+                    raw_bid = raw_bid.get("value") or raw_bid.get("monetaryBid", {}).get("value")
+                current_bid = safe_float(raw_bid, 0)
+                # Prefer targeting-report metrics; fall back to MCP query / cache
+                ext = self._metrics_for_target(target_id, metrics_by_target)
+                if ext:
+                    clicks, spend, sales = ext["clicks"], ext["spend"], ext["sales"]
+                else:
+                    clicks = safe_int(first_present(target, clicks_keys), 0)
+                    spend = safe_float(first_present(target, spend_keys), 0)
+                    sales = safe_float(first_present(target, sales_keys), 0)
+                state = target.get("state", "").upper()
+
+                ids.append(target_id)
+                bids.append(current_bid)
+                clicks_col.append(clicks)
+                spend_col.append(spend)
+                sales_col.append(sales)
+                eligible_col.append(
+                    state in ("ENABLED", "") and bool(target_id) and current_bid > 0
+                )
+
+        return ids, bids, clicks_col, spend_col, sales_col, eligible_col
+
     @staticmethod
     def _metrics_for_target(
         target_id,
@@ -278,24 +437,31 @@ class OptimizerService:
 
     @staticmethod
     def _extract_targets(data) -> list:
-        if isinstance(data, list):
-            return data
-        if isinstance(data, dict):
-            for key in ["targets", "result", "results", "items"]:
-                if key in data and isinstance(data[key], list):
-                    return data[key]
-        return []
+        return first_list(data)
 
     @staticmethod
     def _safe_float(val, default=0.0) -> float:
+        # JSON numbers are already float/int; only strings need parsing.
+        t = type(val)
+        if t is float:
+            return val
+        if t is int:
+            return float(val)
+        if val is None:
+            return default
         try:
-            return float(val) if val is not None else default
+            return float(val)
         except (ValueError, TypeError):
             return default
 
     @staticmethod
     def _safe_int(val, default=0) -> int:
+        t = type(val)
+        if t is int:
+            return val
+        if val is None:
+            return default
         try:
-            return int(val) if val is not None else default
-        except (ValueError, TypeError):
+            return int(val)
+        except (ValueError, TypeError, OverflowError):
             return default
@@ -5,7 +5,10 @@ Falls back to raw_data extraction and ASIN-based URL pattern.
 """
 
 import asyncio
+import functools
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -14,65 +17,125 @@ logger = logging.getLogger(__name__)
 # Format: https://images-na.ssl-images-amazon.com/images/P/{ASIN}.jpg
 ASIN_IMAGE_URL_TEMPLATE = "https://images-na.ssl-images-amazon.com/images/P/{asin}.jpg"
 
+# PA-API GetItems accepts at most 10 ASINs per request, and new associate
+# accounts are limited to about 1 request/second, so keep few batches in flight.
+PAAPI_BATCH_SIZE = 10
+PAAPI_CONCURRENCY = 2
 
-def _extract_from_raw_data(raw: dict) -> Optional[str]:
-    """Extract product/creative image URL from MCP raw_data if present."""
+# Resolved PA-API image URLs, per ASIN. When PA-API misses, the ASIN
+# fallback URL is cached for a shorter time so the ASIN is retried later.
+IMAGE_CACHE_MAXSIZE = 10_000
+IMAGE_CACHE_TTL_SECONDS = 24 * 3600
+IMAGE_CACHE_MISS_TTL_SECONDS = 3600
+_IMG_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+
+def _cache_get(asin: str) -> Optional[str]:
+    entry = _IMG_CACHE.get(asin)
+    if entry is None:
+        return None
+    expires_at, url = entry
+    if expires_at <= time.monotonic():
+        del _IMG_CACHE[asin]
+        return None
+    _IMG_CACHE.move_to_end(asin)
+    return url
+
+
+def _cache_put(asin: str, url: str, ttl: float) -> None:
+    _IMG_CACHE[asin] = (time.monotonic() + ttl, url)
+    _IMG_CACHE.move_to_end(asin)
+    while len(_IMG_CACHE) > IMAGE_CACHE_MAXSIZE:
+        _IMG_CACHE.popitem(last=False)
+
+
+def clear_image_cache() -> None:
+    _IMG_CACHE.clear()
+
+
+def extract_image_from_raw_data(raw: dict) -> Optional[str]:
+    """Extract product/creative image URL from MCP raw_data if present.
+
+    Paths are unrolled, most specific first: creative.primaryImage.url,
+    creative.images[0].url, creative.imageUrl, landingPage.url.
+    """
     if not raw:
         return None
-    for path in (
-        ("creative", "primaryImage", "url"),
-        ("creative", "images", 0, "url"),
-        ("creative", "imageUrl"),
-        ("landingPage", "url"),
-    ):
+    creative = raw.get("creative") if isinstance(raw, dict) else None
+    if isinstance(creative, dict):
         try:
-            obj = raw
-            for key in path:
-                obj = obj[key] if isinstance(obj, (dict, list)) else None
-                if obj is None:
-                    break
-            if isinstance(obj, str) and obj.startswith("http"):
-                return obj
-        except (KeyError, IndexError, TypeError):
-            continue
+            v = creative["primaryImage"]["url"]
+            if isinstance(v, str) and v.startswith("http"):
+                return v
+        except (KeyError, TypeError, IndexError):
+            pass
+        try:
+            v = creative["images"][0]["url"]
+            if isinstance(v, str) and v.startswith("http"):
+                return v
+        except (KeyError, TypeError, IndexError):
+            pass
+        v = creative.get("imageUrl")
+        if isinstance(v, str) and v.startswith("http"):
+            return v
+    try:
+        v = raw["landingPage"]["url"]
+        if isinstance(v, str) and v.startswith("http"):
+            return v
+    except (KeyError, TypeError, IndexError):
+        pass
     return None
 
 
-def _asin_fallback_url(asin: str) -> str:
-    """Return ASIN-based image URL (may not work for all products)."""
-    return ASIN_IMAGE_URL_TEMPLATE.format(asin=asin)
+# ASIN-based image URL (may not work for all products). Bound once so the
+# per-ASIN call is a positional format with no kwarg dict.
+_asin_fallback_url = ASIN_IMAGE_URL_TEMPLATE.replace("{asin}", "{}").format
 
 
-def _fetch_paapi_image(access_key: str, secret_key: str, partner_tag: str, asin: str) -> Optional[str]:
-    """Fetch product image URL via PA-API (sync, run in thread). Requires: pip install python-amazon-paapi"""
+@functools.lru_cache(maxsize=8)
+def _paapi_client(access_key: str, secret_key: str, partner_tag: str):
+    """Return a cached PA-API client (None if python-amazon-paapi is not installed)."""
     try:
-        try:
-            from amazon_paapi import AmazonApi
-            from amazon_paapi.models import Country
-        except ImportError:
-            logger.debug("python-amazon-paapi not installed; PA-API image fetch skipped")
-            return None
-
-        api = AmazonApi(
-            key=access_key,
-            secret=secret_key,
-            tag=partner_tag,
-            country=Country.US,
-        )
-        items = api.get_items(items=[asin])
-        if items and len(items) > 0:
-            item = items[0]
-            if hasattr(item, "images") and item.images:
-                primary = getattr(item.images, "primary", None)
-                if primary:
-                    large = getattr(primary, "large", None) or getattr(primary, "medium", None) or getattr(primary, "small", None)
-                    if large and hasattr(large, "url"):
-                        return large.url
-    except Exception as e:
-        logger.debug(f"PA-API image fetch failed for {asin}: {e}")
+        from amazon_paapi import AmazonApi
+        from amazon_paapi.models import Country
+    except ImportError:
+        logger.debug("python-amazon-paapi not installed; PA-API image fetch skipped")
+        return None
+    return AmazonApi(
+        key=access_key,
+        secret=secret_key,
+        tag=partner_tag,
+        country=Country.US,
+    )
+
+
+def _item_image_url(item) -> Optional[str]:
+    images = getattr(item, "images", None)
+    primary = getattr(images, "primary", None) if images else None
+    if primary:
+        large = getattr(primary, "large", None) or getattr(primary, "medium", None) or getattr(primary, "small", None)
+        if large and hasattr(large, "url"):
+            return large.url
     return None
 
 
+def _fetch_paapi_images(access_key: str, secret_key: str, partner_tag: str, asins: list[str]) -> dict[str, str]:
+    """Fetch image URLs for up to PAAPI_BATCH_SIZE ASINs in one GetItems call (sync, run in thread)."""
+    urls: dict[str, str] = {}
+    try:
+        api = _paapi_client(access_key, secret_key, partner_tag)
+        if api is None:
+            return urls
+        for item in api.get_items(items=asins) or []:
+            url = _item_image_url(item)
+            asin = getattr(item, "asin", None) or (asins[0] if len(asins) == 1 else None)
+            if url and asin:
+                urls[asin] = url
+    except Exception as e:
+        logger.debug(f"PA-API image fetch failed for {asins}: {e}")
+    return urls
+
+
 async def get_product_image_url(
     asin: Optional[str],
     raw_data: Optional[dict] = None,
@@ -83,30 +146,69 @@ async def get_product_image_url(
     """
     Get product image URL for an ASIN.
     Priority: 1) raw_data extraction, 2) PA-API if configured, 3) ASIN fallback URL.
+    PA-API lookups and caching go through get_product_image_urls.
     """
     # 1. Try raw_data first
     if raw_data:
-        url = _extract_from_raw_data(raw_data)
+        url = extract_image_from_raw_data(raw_data)
         if url:
             return url
 
     if not asin:
         return None
 
-    # 2. Try PA-API if configured
-    if paapi_access_key and paapi_secret_key and paapi_partner_tag:
-        try:
-            url = await asyncio.to_thread(
-                _fetch_paapi_image,
-                paapi_access_key,
-                paapi_secret_key,
-                paapi_partner_tag,
-                asin,
-            )
-            if url:
-                return url
-        except Exception as e:
-            logger.debug(f"PA-API async fetch failed: {e}")
-
-    # 3. Fallback to ASIN-based URL (works for many products)
-    return _asin_fallback_url(asin)
+    urls = await get_product_image_urls([asin], paapi_access_key, paapi_secret_key, paapi_partner_tag)
+    return urls[asin]
+
+
+async def get_product_image_urls(
+    asins: list[str],
+    paapi_access_key: Optional[str] = None,
+    paapi_secret_key: Optional[str] = None,
+    paapi_partner_tag: Optional[str] = None,
+) -> dict[str, str]:
+    """
+    Get image URLs for many ASINs at once.
+    PA-API is queried in batches of PAAPI_BATCH_SIZE; ASINs it does not
+    resolve get the ASIN fallback URL.
+    """
+    unique = list(dict.fromkeys(a for a in asins if a))
+    if not (paapi_access_key and paapi_secret_key and paapi_partner_tag):
+        return dict(zip(unique, map(_asin_fallback_url, unique)))
+
+    urls: dict[str, str] = {}
+    missing: list[str] = []
+    for asin in unique:
+        cached = _cache_get(asin)
+        if cached:
+            urls[asin] = cached
+        else:
+            missing.append(asin)
+
+    if missing:
+        sem = asyncio.Semaphore(PAAPI_CONCURRENCY)
+
+        async def fetch(chunk: list[str]) -> dict[str, str]:
+            async with sem:
+                return await asyncio.to_thread(
+                    _fetch_paapi_images,
+                    paapi_access_key,
+                    paapi_secret_key,
+                    paapi_partner_tag,
+                    chunk,
+                )
+
+        chunks = [missing[i:i + PAAPI_BATCH_SIZE] for i in range(0, len(missing), PAAPI_BATCH_SIZE)]
+        for found in await asyncio.gather(*(fetch(c) for c in chunks), return_exceptions=True):
+            if isinstance(found, BaseException):
+                logger.debug(f"PA-API async batch fetch failed: {found}")
+                continue
+            for asin, url in found.items():
+                _cache_put(asin, url, IMAGE_CACHE_TTL_SECONDS)
+            urls.update(found)
+
+        for asin in missing:
+            if asin not in urls:
+                urls[asin] = _asin_fallback_url(asin)
+                _cache_put(asin, urls[asin], IMAGE_CACHE_MISS_TTL_SECONDS)
+    return urls
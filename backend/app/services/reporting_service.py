@@ -5,23 +5,189 @@ Supports date-range presets, comparison periods, and stores all data for
 historical tracking.
 """
 
-import gzip
+import asyncio
+import json
 import logging
+import math
 import uuid
-from datetime import date, datetime, timedelta, timezone
-from typing import Optional, Tuple, List, Dict, Any
+import zlib
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, or_, case, exists, func, lambda_stmt, literal_column
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import httpx
+from app.http_client import SharedAsyncClient
 from app.mcp_client import AmazonAdsMCP
 from app.models import (
     CampaignPerformanceDaily, AccountPerformanceDaily,
     Campaign, Credential, Target,
 )
-from app.utils import marketplace_today, normalize_amazon_date, normalize_state_value
+from app.utils import first_present, marketplace_today, normalize_amazon_date, normalize_state_value, utcnow
+
+try:
+    import orjson
+except ImportError:  # optional: faster report part parsing
+    orjson = None
+
+try:
+    from isal import isal_zlib as _inflate_zlib
+except ImportError:  # optional: ISA-L inflate, same decompressobj API as zlib
+    _inflate_zlib = zlib
 
 logger = logging.getLogger(__name__)
 
+# Campaign sync batches: ids per IN-lookup and rows per INSERT statement
+# (asyncpg caps a statement at 32767 bind parameters).
+SYNC_LOOKUP_CHUNK = 1000
+SYNC_INSERT_CHUNK = 500
+
+# Rows per fetch when streaming stored range keys.
+RANGE_KEY_FETCH_BATCH = 500
+# Share of the requested days a stored range key must cover to stand in.
+RANGE_MIN_OVERLAP = 0.7
+
+# Bound once for the per-key / per-row loops below.
+_fromiso = date.fromisoformat
+
+
+@lru_cache(maxsize=4096)
+def _is_iso_day(value: str) -> bool:
+    """True for a "YYYY-MM-DD" string (cached: report rows repeat a few days)."""
+    try:
+        _fromiso(value)
+        return True
+    except ValueError:
+        return False
+
+
+# Report parts are fetched concurrently over one shared client; cap open
+# connections across all in-flight downloads.
+REPORT_PART_MAX_CONNECTIONS = 32
+REPORT_PART_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# Read size when streaming report parts; matches gzip.READ_BUFFER_SIZE.
+REPORT_READ_CHUNK = 128 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Presigned part URLs mostly point at the same regional S3 host; parts are
+# multiplexed over one connection when the h2 extra is installed.
+_HTTP = SharedAsyncClient(
+    http2=True,
+    timeout=REPORT_PART_TIMEOUT,
+    limits=httpx.Limits(
+        max_connections=REPORT_PART_MAX_CONNECTIONS,
+        max_keepalive_connections=REPORT_PART_MAX_CONNECTIONS,
+    ),
+)
+
+
+def report_http() -> httpx.AsyncClient:
+    """Return the shared report-download client, creating it on first use."""
+    return _HTTP.get()
+
+
+async def close_http_client() -> None:
+    """Close the shared report-download client (called from app shutdown)."""
+    await _HTTP.aclose()
+
+
+# Report polling: 2s, 3.4s, 5.8s, ... capped at 30s, each ±20%.
+REPORT_POLL_INITIAL = 2.0
+REPORT_POLL_BACKOFF = 1.7
+REPORT_POLL_MAX_INTERVAL = 30.0
+REPORT_POLL_JITTER = 0.2
+
+# Concurrent pending-report checks for one account are coalesced into a
+# single retrieve_report call of up to this many ids, after this window.
+PENDING_REPORT_BATCH_SIZE = 25
+PENDING_REPORT_BATCH_WINDOW = 0.05
+
+
+def _loads_report_json(body):
+    """Parse a report part body (bytes), using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few inputs the stdlib accepts (NaN, Infinity).
+            pass
+    return json.loads(body)
+
+
+# Keys some report formats wrap their row list in.
+REPORT_ROW_KEYS = ("rows", "data", "campaigns", "results")
+
+
+def _report_part_rows(body, row_keys: tuple = REPORT_ROW_KEYS) -> list:
+    """Parse one downloaded report part into its list of rows."""
+    parsed = _loads_report_json(body)
+    if isinstance(parsed, list):
+        return parsed
+    if isinstance(parsed, dict):
+        # Some formats wrap rows in a key
+        for key in row_keys:
+            if key in parsed and isinstance(parsed[key], list):
+                return parsed[key]
+        return [parsed]
+    return []
+
+
+async def fetch_report_part(
+    http: httpx.AsyncClient, url: str, row_keys: tuple = REPORT_ROW_KEYS
+) -> list:
+    """Download one report part and return its rows.
+
+    The body is inflated as it streams in, so only the decompressed JSON
+    is held in memory. Parts without the gzip magic are read as-is.
+
+    Transport compression is separate: httpx advertises every
+    Accept-Encoding it can decode (br too when brotli is installed) and
+    ``aiter_bytes`` undoes any Content-Encoding, so the magic check only
+    sees gzip that is part of the payload (GZIP_JSON reports).
+    """
+    body = bytearray()
+    async with http.stream("GET", url) as resp:
+        resp.raise_for_status()
+        inflater = None
+        gzipped = None
+        async for chunk in resp.aiter_bytes(REPORT_READ_CHUNK):
+            if gzipped is None:
+                gzipped = chunk[:2] == _GZIP_MAGIC
+            if not gzipped:
+                body += chunk
+                continue
+            # Concatenated gzip members each need a fresh inflater.
+            while chunk:
+                if inflater is None:
+                    inflater = _inflate_zlib.decompressobj(wbits=31)
+                body += inflater.decompress(chunk)
+                if not inflater.eof:
+                    break
+                chunk = inflater.unused_data
+                inflater = None
+
+    # Parsing a multi-MB part is CPU-bound; keep it off the event loop.
+    return await asyncio.to_thread(_report_part_rows, body, row_keys)
+
+
+# Performance tables key ``date`` as either "YYYY-MM-DD" or a legacy range key
+# "start__end". These predicates split the two and are rendered with inline
+# literals so PostgreSQL can match them against the partial indexes
+# ix_cpd_day_covering / ix_cpd_range_keys / ix_apd_day_covering (bound
+# parameters would not match).
+def single_day_key(column):
+    """SQL predicate: ``column`` holds a single-day date, not a range key."""
+    return func.strpos(column, literal_column("'__'")) <= literal_column("0")
+
+
+def range_key(column):
+    """SQL predicate: ``column`` holds a legacy "start__end" range key."""
+    return func.strpos(column, literal_column("'__'")) > literal_column("0")
+
+
 DATE_PRESETS = (
     "today", "yesterday", "last_7_days", "this_week", "last_week",
     "last_30_days", "this_month", "last_month", "year_to_date",
@@ -50,18 +216,22 @@ REGION_CURRENCY = {
     "fe": "JPY",
 }
 
+# Lower-cased campaign states counted as active.
+ACTIVE_STATES = frozenset({"enabled", "active"})
+
 
 def get_currency_for_marketplace(marketplace: str = None, region: str = None) -> str:
     """
     Resolve the currency code for a marketplace or region.
     Priority: marketplace-specific mapping > region fallback > USD default.
     """
+    # Callers almost always pass the canonical case already; only fold on a miss.
     if marketplace:
-        code = MARKETPLACE_CURRENCY.get(marketplace.upper())
+        code = MARKETPLACE_CURRENCY.get(marketplace) or MARKETPLACE_CURRENCY.get(marketplace.upper())
         if code:
             return code
     if region:
-        code = REGION_CURRENCY.get(region.lower())
+        code = REGION_CURRENCY.get(region) or REGION_CURRENCY.get(region.lower())
         if code:
             return code
     return "USD"
@@ -69,6 +239,63 @@ def get_currency_for_marketplace(marketplace: str = None, region: str = None) ->
 
 # ── Date-range helpers ────────────────────────────────────────────────
 
+ONE_DAY = timedelta(days=1)
+
+
+def _last_month(today: date) -> Tuple[date, date]:
+    last_day_prev = today.replace(day=1) - ONE_DAY
+    return last_day_prev.replace(day=1), last_day_prev
+
+
+def _last_week(today: date) -> Tuple[date, date]:
+    monday = today - timedelta(days=today.weekday() + 7)
+    return monday, monday + timedelta(days=6)
+
+
+# preset -> (today -> (start, end)); unknown presets fall back to the last 8 days.
+_PRESET_RANGES = {
+    "today": lambda t: (t, t),
+    "yesterday": lambda t: (t - ONE_DAY, t - ONE_DAY),
+    "last_7_days": lambda t: (t - timedelta(days=6), t),
+    "this_week": lambda t: (t - timedelta(days=t.weekday()), t),
+    "last_week": _last_week,
+    # Match Amazon Ads dashboard: 31 days (today - 30 through today)
+    "last_30_days": lambda t: (t - timedelta(days=30), t),
+    "this_month": lambda t: (t.replace(day=1), t),
+    "last_month": _last_month,
+    "year_to_date": lambda t: (t.replace(month=1, day=1), t),
+}
+
+
+def _default_range(today: date) -> Tuple[date, date]:
+    return today - timedelta(days=7), today
+
+
+def _month_before_last(today: date) -> Tuple[date, date]:
+    return _last_month(_last_month(today)[0])
+
+
+# preset -> (today -> comparison (start, end)).
+_PRESET_COMPARISONS = {
+    "today": lambda t: (t - ONE_DAY, t - ONE_DAY),
+    "yesterday": lambda t: (t - timedelta(days=2), t - timedelta(days=2)),
+    "last_7_days": lambda t: (t - timedelta(days=13), t - timedelta(days=7)),
+    "this_week": _last_week,
+    "last_week": lambda t: _last_week(t - timedelta(days=7)),
+    # Previous 31-day period
+    "last_30_days": lambda t: (t - timedelta(days=61), t - timedelta(days=31)),
+    "this_month": _last_month,
+    "last_month": _month_before_last,
+    "year_to_date": lambda t: (date(t.year - 1, 1, 1), date(t.year - 1, 12, 31)),
+}
+
+
+def _default_comparison(today: date) -> Tuple[date, date]:
+    start, end = _default_range(today)
+    duration = end - start + ONE_DAY
+    return start - duration, start - ONE_DAY
+
+
 def get_date_range(
     preset: str,
     marketplace: Optional[str] = None,
@@ -80,35 +307,7 @@ def get_date_range(
     advertiser's reporting timezone instead of UTC.
     """
     today = marketplace_today(marketplace, region)
-
-    if preset == "today":
-        return today, today
-    elif preset == "yesterday":
-        d = today - timedelta(days=1)
-        return d, d
-    elif preset == "last_7_days":
-        return today - timedelta(days=6), today
-    elif preset == "this_week":
-        monday = today - timedelta(days=today.weekday())
-        return monday, today
-    elif preset == "last_week":
-        monday = today - timedelta(days=today.weekday() + 7)
-        sunday = monday + timedelta(days=6)
-        return monday, sunday
-    elif preset == "last_30_days":
-        # Match Amazon Ads dashboard: 31 days (today - 30 through today)
-        return today - timedelta(days=30), today
-    elif preset == "this_month":
-        return today.replace(day=1), today
-    elif preset == "last_month":
-        first_this = today.replace(day=1)
-        last_day_prev = first_this - timedelta(days=1)
-        first_prev = last_day_prev.replace(day=1)
-        return first_prev, last_day_prev
-    elif preset == "year_to_date":
-        return today.replace(month=1, day=1), today
-    else:
-        return today - timedelta(days=7), today
+    return _PRESET_RANGES.get(preset, _default_range)(today)
 
 
 def get_comparison_range(
@@ -118,39 +317,7 @@ def get_comparison_range(
 ) -> Tuple[date, date]:
     """Return the comparison period for the given preset (marketplace-aware)."""
     today = marketplace_today(marketplace, region)
-
-    if preset == "today":
-        d = today - timedelta(days=1)
-        return d, d
-    elif preset == "yesterday":
-        d = today - timedelta(days=2)
-        return d, d
-    elif preset == "last_7_days":
-        return today - timedelta(days=13), today - timedelta(days=7)
-    elif preset == "this_week":
-        return get_date_range("last_week", marketplace=marketplace, region=region)
-    elif preset == "last_week":
-        monday = today - timedelta(days=today.weekday() + 14)
-        sunday = monday + timedelta(days=6)
-        return monday, sunday
-    elif preset == "last_30_days":
-        # Previous 31-day period
-        return today - timedelta(days=61), today - timedelta(days=31)
-    elif preset == "this_month":
-        return get_date_range("last_month", marketplace=marketplace, region=region)
-    elif preset == "last_month":
-        first_this = today.replace(day=1)
-        last_prev = first_this - timedelta(days=1)
-        first_prev = last_prev.replace(day=1)
-        month_before_last = first_prev - timedelta(days=1)
-        first_month_before = month_before_last.replace(day=1)
-        return first_month_before, month_before_last
-    elif preset == "year_to_date":
-        return today.replace(year=today.year - 1, month=1, day=1), today.replace(year=today.year - 1, month=12, day=31)
-    else:
-        start, end = get_date_range(preset, marketplace=marketplace, region=region)
-        duration = (end - start).days + 1
-        return start - timedelta(days=duration), start - timedelta(days=1)
+    return _PRESET_COMPARISONS.get(preset, _default_comparison)(today)
 
 
 def get_comparison_range_for_dates(start_date: date, end_date: date) -> Tuple[date, date]:
@@ -165,20 +332,26 @@ def get_comparison_range_for_dates(start_date: date, end_date: date) -> Tuple[da
 
 def compute_metrics(campaigns: list) -> dict:
     """Aggregate metrics across a list of campaign dicts."""
-    total_spend = sum(float(c.get("spend") or 0) for c in campaigns)
-    total_sales = sum(float(c.get("sales") or 0) for c in campaigns)
-    total_impressions = sum(int(c.get("impressions") or 0) for c in campaigns)
-    total_clicks = sum(int(c.get("clicks") or 0) for c in campaigns)
-    total_orders = sum(int(c.get("orders") or 0) for c in campaigns)
+    total_spend = 0.0
+    total_sales = 0.0
+    total_impressions = 0
+    total_clicks = 0
+    total_orders = 0
     weighted_top_search = 0.0
     weighted_top_search_den = 0.0
     for c in campaigns:
-        tos = c.get("top_of_search_impression_share")
-        if tos is None:
-            continue
-        weight = int(c.get("impressions") or 0) or 1
-        weighted_top_search += float(tos) * weight
-        weighted_top_search_den += weight
+        get = c.get
+        total_spend += float(get("spend") or 0)
+        total_sales += float(get("sales") or 0)
+        impressions = int(get("impressions") or 0)
+        total_impressions += impressions
+        total_clicks += int(get("clicks") or 0)
+        total_orders += int(get("orders") or 0)
+        tos = get("top_of_search_impression_share")
+        if tos is not None:
+            weight = impressions or 1
+            weighted_top_search += float(tos) * weight
+            weighted_top_search_den += weight
 
     acos = (total_spend / total_sales * 100) if total_sales > 0 else 0
     roas = (total_sales / total_spend) if total_spend > 0 else 0
@@ -201,46 +374,51 @@ def compute_metrics(campaigns: list) -> dict:
     }
 
 
+def _delta_number(value) -> float:
+    """Coerce a summary value to float for delta maths (None/garbage → 0)."""
+    if value is None:
+        return 0.0
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def compute_deltas(current: dict, previous: dict) -> dict:
     """Compute percentage change between two metric dicts."""
     deltas = {}
-
-    def _to_num(value) -> float:
-        if value is None:
-            return 0.0
-        if isinstance(value, (int, float)):
-            return float(value)
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
-
-    for key in current:
-        curr = _to_num(current.get(key))
-        prev = _to_num(previous.get(key))
-        if prev != 0:
+    prev_get = previous.get
+    for key, value in current.items():
+        curr = _delta_number(value)
+        prev = _delta_number(prev_get(key))
+        if prev:
             deltas[key] = round(((curr - prev) / abs(prev)) * 100, 1)
         else:
             deltas[key] = 0.0 if curr == 0 else 100.0
     return deltas
 
 
-def enrich_campaigns(campaigns: list) -> list:
+def enrich_campaigns(campaigns: Iterable[dict]) -> list:
     """Add derived metrics (acos, roas, ctr, cpc, cvr) to each campaign dict."""
     enriched = []
     for c in campaigns:
-        row = dict(c)
-        spend = float(row.get("spend") or 0)
-        sales = float(row.get("sales") or 0)
-        impressions = int(row.get("impressions") or 0)
-        clicks = int(row.get("clicks") or 0)
-        orders = int(row.get("orders") or 0)
-        row["acos"] = round(spend / sales * 100, 2) if sales > 0 else 0
-        row["roas"] = round(sales / spend, 2) if spend > 0 else 0
-        row["ctr"] = round(clicks / impressions * 100, 2) if impressions > 0 else 0
-        row["cpc"] = round(spend / clicks, 2) if clicks > 0 else 0
-        row["cvr"] = round(orders / clicks * 100, 2) if clicks > 0 else 0
-        tos = row.get("top_of_search_impression_share")
+        get = c.get
+        spend = float(get("spend") or 0)
+        sales = float(get("sales") or 0)
+        impressions = int(get("impressions") or 0)
+        clicks = int(get("clicks") or 0)
+        orders = int(get("orders") or 0)
+        row = {
+            **c,
+            "acos": round(spend / sales * 100, 2) if sales > 0 else 0,
+            "roas": round(sales / spend, 2) if spend > 0 else 0,
+            "ctr": round(clicks / impressions * 100, 2) if impressions > 0 else 0,
+            "cpc": round(spend / clicks, 2) if clicks > 0 else 0,
+            "cvr": round(orders / clicks * 100, 2) if clicks > 0 else 0,
+        }
+        tos = get("top_of_search_impression_share")
         if tos is not None:
             try:
                 row["top_of_search_impression_share"] = round(float(tos), 2)
@@ -275,6 +453,30 @@ async def sync_campaigns_to_db(
         campaign_list = []
     synced = 0
 
+    # One IN-query for every campaign already cached under this credential,
+    # instead of a SELECT per row.
+    amazon_ids = []
+    for camp_data in campaign_list:
+        amazon_id = (
+            camp_data.get("campaignId") or camp_data.get("id")
+            or camp_data.get("campaign_id")
+        )
+        if amazon_id:
+            amazon_ids.append(str(amazon_id))
+    existing_by_id: dict[str, Campaign] = {}
+    unique_ids = list(dict.fromkeys(amazon_ids))
+    for i in range(0, len(unique_ids), SYNC_LOOKUP_CHUNK):
+        result = await db.execute(
+            select(Campaign).where(
+                Campaign.credential_id == credential_id,
+                Campaign.amazon_campaign_id.in_(unique_ids[i:i + SYNC_LOOKUP_CHUNK]),
+            )
+        )
+        for campaign in result.scalars():
+            existing_by_id[campaign.amazon_campaign_id] = campaign
+
+    now = utcnow()
+    new_rows: dict[str, dict] = {}
     for camp_data in campaign_list:
         amazon_id = (
             camp_data.get("campaignId") or camp_data.get("id")
@@ -282,13 +484,8 @@ async def sync_campaigns_to_db(
         )
         if not amazon_id:
             continue
-
-        lookup = [
-            Campaign.credential_id == credential_id,
-            Campaign.amazon_campaign_id == str(amazon_id),
-        ]
-        result = await db.execute(select(Campaign).where(and_(*lookup)))
-        campaign = result.scalar_one_or_none()
+        amazon_id = str(amazon_id)
+        campaign = existing_by_id.get(amazon_id)
 
         camp_name = camp_data.get("name") or camp_data.get("campaignName") or camp_data.get("campaign_name")
         camp_type = camp_data.get("adProduct") or camp_data.get("campaignType") or camp_data.get("type")
@@ -316,24 +513,52 @@ async def sync_campaigns_to_db(
             campaign.start_date = normalize_amazon_date(camp_data.get("startDate") or camp_data.get("startDateTime")) or campaign.start_date
             campaign.end_date = normalize_amazon_date(camp_data.get("endDate") or camp_data.get("endDateTime")) or campaign.end_date
             campaign.raw_data = camp_data
-            campaign.synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            campaign.synced_at = now
         else:
-            new_campaign = Campaign(
-                credential_id=credential_id,
-                profile_id=profile_id,
-                amazon_campaign_id=str(amazon_id),
-                campaign_name=camp_name,
-                campaign_type=camp_type,
-                targeting_type=targeting,
-                state=state,
-                daily_budget=float(budget) if budget else None,
-                start_date=normalize_amazon_date(camp_data.get("startDate") or camp_data.get("startDateTime")),
-                end_date=normalize_amazon_date(camp_data.get("endDate") or camp_data.get("endDateTime")),
-                raw_data=camp_data,
-            )
-            db.add(new_campaign)
+            # A repeated id in one payload keeps the last copy, as the old
+            # add-then-update path did.
+            new_rows[amazon_id] = {
+                "id": uuid.uuid4(),
+                "credential_id": credential_id,
+                "profile_id": profile_id,
+                "amazon_campaign_id": amazon_id,
+                "campaign_name": camp_name,
+                "campaign_type": camp_type,
+                "targeting_type": targeting,
+                "state": state,
+                "daily_budget": float(budget) if budget else None,
+                "start_date": normalize_amazon_date(camp_data.get("startDate") or camp_data.get("startDateTime")),
+                "end_date": normalize_amazon_date(camp_data.get("endDate") or camp_data.get("endDateTime")),
+                "raw_data": camp_data,
+                "synced_at": now,
+                "created_at": now,
+            }
         synced += 1
 
+    if new_rows:
+        rows = list(new_rows.values())
+        for i in range(0, len(rows), SYNC_INSERT_CHUNK):
+            stmt = pg_insert(Campaign).values(rows[i:i + SYNC_INSERT_CHUNK])
+            # A concurrent sync may have inserted the same campaign since the
+            # lookup; merge into it the way the update branch above does.
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["credential_id", "amazon_campaign_id"],
+                set_={
+                    "profile_id": excluded.profile_id,
+                    "campaign_name": func.coalesce(excluded.campaign_name, Campaign.campaign_name),
+                    "campaign_type": func.coalesce(excluded.campaign_type, Campaign.campaign_type),
+                    "targeting_type": func.coalesce(excluded.targeting_type, Campaign.targeting_type),
+                    "state": func.coalesce(excluded.state, Campaign.state),
+                    "daily_budget": func.coalesce(excluded.daily_budget, Campaign.daily_budget),
+                    "start_date": func.coalesce(excluded.start_date, Campaign.start_date),
+                    "end_date": func.coalesce(excluded.end_date, Campaign.end_date),
+                    "raw_data": excluded.raw_data,
+                    "synced_at": excluded.synced_at,
+                },
+            )
+            await db.execute(stmt)
+
     await db.flush()
     logger.info(f"Synced {synced} campaigns to Campaign table")
     return synced
@@ -343,6 +568,24 @@ async def sync_campaigns_to_db(
 #  HISTORICAL DATA — Store & Query daily performance from DB
 # ══════════════════════════════════════════════════════════════════════
 
+# Metric columns a re-synced campaign daily row always overwrites.
+_CAMPAIGN_DAILY_METRIC_FIELDS = (
+    "spend", "sales", "impressions", "clicks", "orders",
+    "acos", "roas", "ctr", "cpc", "cvr",
+    "top_of_search_impression_share", "source", "synced_at",
+)
+
+
+def _scoped_conflict_target(model, *columns) -> list:
+    """
+    ON CONFLICT target matching the profile-scoped unique indexes
+    (uq_cpd_scoped_unique / uq_apd_scoped_unique), which key NULL profiles
+    as '' so they conflict too. The '' is inlined: index inference compares
+    expressions, and a bound parameter would not match the index's constant.
+    """
+    return [model.credential_id, func.coalesce(model.profile_id, literal_column("''")), *columns, model.date]
+
+
 async def store_campaign_daily_data(
     db: AsyncSession,
     credential_id: uuid.UUID,
@@ -355,88 +598,87 @@ async def store_campaign_daily_data(
     Upsert campaign performance rows for a given date.
     If a row already exists for (credential, campaign, date), update it.
     """
+    now = utcnow()
     stored = 0
+    rows_by_id: dict[str, dict] = {}
     for c in campaigns:
         campaign_id = c.get("campaign_id") or c.get("amazon_campaign_id") or ""
         if not campaign_id:
             continue
 
-        # Check for existing row
-        lookup = [
-            CampaignPerformanceDaily.credential_id == credential_id,
-            CampaignPerformanceDaily.amazon_campaign_id == campaign_id,
-            CampaignPerformanceDaily.date == report_date,
-        ]
-        if profile_id is not None:
-            lookup.append(CampaignPerformanceDaily.profile_id == profile_id)
-        else:
-            lookup.append(CampaignPerformanceDaily.profile_id.is_(None))
-        result = await db.execute(
-            select(CampaignPerformanceDaily).where(and_(*lookup))
-        )
-        existing = result.scalar_one_or_none()
-
         spend = float(c.get("spend") or 0)
         sales = float(c.get("sales") or 0)
         impressions = int(c.get("impressions") or 0)
         clicks = int(c.get("clicks") or 0)
         orders = int(c.get("orders") or 0)
-        acos = round(spend / sales * 100, 2) if sales > 0 else 0
-        roas = round(sales / spend, 2) if spend > 0 else 0
-        ctr = round(clicks / impressions * 100, 2) if impressions > 0 else 0
-        cpc = round(spend / clicks, 2) if clicks > 0 else 0
-        cvr = round(orders / clicks * 100, 2) if clicks > 0 else 0
         top_share = c.get("top_of_search_impression_share")
         if top_share is not None:
             try:
                 top_share = float(str(top_share).replace("%", ""))
             except (TypeError, ValueError):
                 top_share = None
+        values = {
+            "spend": spend,
+            "sales": sales,
+            "impressions": impressions,
+            "clicks": clicks,
+            "orders": orders,
+            "acos": round(spend / sales * 100, 2) if sales > 0 else 0,
+            "roas": round(sales / spend, 2) if spend > 0 else 0,
+            "ctr": round(clicks / impressions * 100, 2) if impressions > 0 else 0,
+            "cpc": round(spend / clicks, 2) if clicks > 0 else 0,
+            "cvr": round(orders / clicks * 100, 2) if clicks > 0 else 0,
+            "top_of_search_impression_share": top_share,
+            "source": source,
+            "synced_at": now,
+        }
 
-        if existing:
-            existing.spend = spend
-            existing.sales = sales
-            existing.impressions = impressions
-            existing.clicks = clicks
-            existing.orders = orders
-            existing.acos = acos
-            existing.roas = roas
-            existing.ctr = ctr
-            existing.cpc = cpc
-            existing.cvr = cvr
-            existing.top_of_search_impression_share = top_share
-            existing.campaign_name = c.get("campaign_name") or existing.campaign_name
-            existing.state = c.get("state") or existing.state
-            existing.daily_budget = c.get("daily_budget") or existing.daily_budget
-            existing.source = source
-            existing.synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        pending = rows_by_id.get(campaign_id)
+        if pending:
+            # A repeated campaign id later in the batch updates the pending row
+            # (one statement cannot upsert the same key twice).
+            pending.update(values)
+            pending["campaign_name"] = c.get("campaign_name") or pending["campaign_name"]
+            pending["state"] = c.get("state") or pending["state"]
+            pending["daily_budget"] = c.get("daily_budget") or pending["daily_budget"]
         else:
-            row = CampaignPerformanceDaily(
-                credential_id=credential_id,
-                profile_id=profile_id,
-                amazon_campaign_id=campaign_id,
-                campaign_name=c.get("campaign_name"),
-                campaign_type=c.get("campaign_type"),
-                targeting_type=c.get("targeting_type"),
-                state=c.get("state"),
-                date=report_date,
-                spend=spend,
-                sales=sales,
-                impressions=impressions,
-                clicks=clicks,
-                orders=orders,
-                acos=acos,
-                roas=roas,
-                ctr=ctr,
-                cpc=cpc,
-                cvr=cvr,
-                top_of_search_impression_share=top_share,
-                daily_budget=c.get("daily_budget"),
-                source=source,
-            )
-            db.add(row)
+            rows_by_id[campaign_id] = {
+                "id": uuid.uuid4(),
+                "credential_id": credential_id,
+                "profile_id": profile_id,
+                "amazon_campaign_id": campaign_id,
+                "campaign_name": c.get("campaign_name") or None,
+                "campaign_type": c.get("campaign_type"),
+                "targeting_type": c.get("targeting_type"),
+                "state": c.get("state") or None,
+                "date": report_date,
+                "daily_budget": c.get("daily_budget") or None,
+                **values,
+            }
         stored += 1
 
+    # INSERT ... ON CONFLICT against uq_cpd_scoped_unique replaces the
+    # existence SELECT: new rows are inserted and existing ones updated in
+    # the same multi-row statement. Name/state/budget keep the stored value
+    # when the report omits them; campaign/targeting type are insert-only.
+    rows = list(rows_by_id.values())
+    for i in range(0, len(rows), SYNC_INSERT_CHUNK):
+        stmt = pg_insert(CampaignPerformanceDaily).values(rows[i:i + SYNC_INSERT_CHUNK])
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=_scoped_conflict_target(
+                CampaignPerformanceDaily,
+                CampaignPerformanceDaily.amazon_campaign_id,
+            ),
+            set_={
+                **{key: getattr(excluded, key) for key in _CAMPAIGN_DAILY_METRIC_FIELDS},
+                "campaign_name": func.coalesce(excluded.campaign_name, CampaignPerformanceDaily.campaign_name),
+                "state": func.coalesce(excluded.state, CampaignPerformanceDaily.state),
+                "daily_budget": func.coalesce(excluded.daily_budget, CampaignPerformanceDaily.daily_budget),
+            },
+        )
+        await db.execute(stmt)
+
     await db.flush()
     logger.info(f"Stored {stored} campaign daily rows for {report_date}")
     return stored
@@ -454,61 +696,44 @@ async def store_account_daily_summary(
     Compute and upsert the account-level aggregate row for a given date.
     """
     metrics = compute_metrics(campaigns)
-    active = len([c for c in campaigns if (c.get("state") or "").lower() in ("enabled", "active")])
-    paused = len([c for c in campaigns if (c.get("state") or "").lower() == "paused"])
-
-    lookup = [
-        AccountPerformanceDaily.credential_id == credential_id,
-        AccountPerformanceDaily.date == report_date,
-    ]
-    if profile_id is not None:
-        lookup.append(AccountPerformanceDaily.profile_id == profile_id)
-    else:
-        lookup.append(AccountPerformanceDaily.profile_id.is_(None))
-    result = await db.execute(
-        select(AccountPerformanceDaily).where(and_(*lookup))
+    active = paused = 0
+    for c in campaigns:
+        state = (c.get("state") or "").lower()
+        if state in ACTIVE_STATES:
+            active += 1
+        elif state == "paused":
+            paused += 1
+
+    values = {
+        "total_spend": metrics["spend"],
+        "total_sales": metrics["sales"],
+        "total_impressions": metrics["impressions"],
+        "total_clicks": metrics["clicks"],
+        "total_orders": metrics["orders"],
+        "avg_acos": metrics["acos"],
+        "avg_roas": metrics["roas"],
+        "avg_ctr": metrics["ctr"],
+        "avg_cpc": metrics["cpc"],
+        "avg_cvr": metrics["cvr"],
+        "avg_top_of_search_impression_share": metrics.get("top_of_search_impression_share"),
+        "total_campaigns": len(campaigns),
+        "active_campaigns": active,
+        "paused_campaigns": paused,
+        "source": source,
+        "synced_at": utcnow(),
+    }
+    stmt = pg_insert(AccountPerformanceDaily).values(
+        id=uuid.uuid4(),
+        credential_id=credential_id,
+        profile_id=profile_id,
+        date=report_date,
+        **values,
     )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        existing.total_spend = metrics["spend"]
-        existing.total_sales = metrics["sales"]
-        existing.total_impressions = metrics["impressions"]
-        existing.total_clicks = metrics["clicks"]
-        existing.total_orders = metrics["orders"]
-        existing.avg_acos = metrics["acos"]
-        existing.avg_roas = metrics["roas"]
-        existing.avg_ctr = metrics["ctr"]
-        existing.avg_cpc = metrics["cpc"]
-        existing.avg_cvr = metrics["cvr"]
-        existing.avg_top_of_search_impression_share = metrics.get("top_of_search_impression_share")
-        existing.total_campaigns = len(campaigns)
-        existing.active_campaigns = active
-        existing.paused_campaigns = paused
-        existing.source = source
-        existing.synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
-    else:
-        row = AccountPerformanceDaily(
-            credential_id=credential_id,
-            profile_id=profile_id,
-            date=report_date,
-            total_spend=metrics["spend"],
-            total_sales=metrics["sales"],
-            total_impressions=metrics["impressions"],
-            total_clicks=metrics["clicks"],
-            total_orders=metrics["orders"],
-            avg_acos=metrics["acos"],
-            avg_roas=metrics["roas"],
-            avg_ctr=metrics["ctr"],
-            avg_cpc=metrics["cpc"],
-            avg_cvr=metrics["cvr"],
-            avg_top_of_search_impression_share=metrics.get("top_of_search_impression_share"),
-            total_campaigns=len(campaigns),
-            active_campaigns=active,
-            paused_campaigns=paused,
-            source=source,
-        )
-        db.add(row)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=_scoped_conflict_target(AccountPerformanceDaily),
+        set_={key: getattr(stmt.excluded, key) for key in values},
+    )
+    await db.execute(stmt)
 
     await db.flush()
     logger.info(f"Stored account daily summary for {report_date}")
@@ -555,13 +780,47 @@ async def persist_campaign_daily(
     Convenience wrapper: store campaign + account daily data.
     If report_date is not provided, uses today's date.
     """
-    from datetime import date as date_type
     if not report_date:
-        report_date = date_type.today().isoformat()
+        report_date = date.today().isoformat()
+    # Sequential on purpose: both writes share the caller's session and
+    # transaction, and an AsyncSession cannot run statements concurrently.
     await store_campaign_daily_data(db, credential_id, campaigns, report_date, source="audit", profile_id=profile_id)
     await store_account_daily_summary(db, credential_id, campaigns, report_date, source="audit", profile_id=profile_id)
 
 
+def _campaign_daily_columns() -> tuple:
+    """Per-campaign aggregate columns, including the derived ratios.
+
+    acos/roas/ctr/cpc/cvr are computed from the sums in the same SELECT (0
+    when the denominator is not positive, as in :func:`enrich_campaigns`),
+    so callers only round them.
+    """
+    spend = func.sum(CampaignPerformanceDaily.spend)
+    sales = func.sum(CampaignPerformanceDaily.sales)
+    impressions = func.sum(CampaignPerformanceDaily.impressions)
+    clicks = func.sum(CampaignPerformanceDaily.clicks)
+    orders = func.sum(CampaignPerformanceDaily.orders)
+    return (
+        CampaignPerformanceDaily.amazon_campaign_id,
+        func.max(CampaignPerformanceDaily.campaign_name).label("campaign_name"),
+        func.max(CampaignPerformanceDaily.campaign_type).label("campaign_type"),
+        func.max(CampaignPerformanceDaily.targeting_type).label("targeting_type"),
+        func.max(CampaignPerformanceDaily.state).label("state"),
+        spend.label("spend"),
+        sales.label("sales"),
+        impressions.label("impressions"),
+        clicks.label("clicks"),
+        orders.label("orders"),
+        func.avg(CampaignPerformanceDaily.top_of_search_impression_share).label("top_of_search_impression_share"),
+        func.max(CampaignPerformanceDaily.daily_budget).label("daily_budget"),
+        case((sales > 0, spend / sales * 100), else_=0).label("acos"),
+        case((spend > 0, sales / spend), else_=0).label("roas"),
+        case((impressions > 0, clicks * 100.0 / impressions), else_=0).label("ctr"),
+        case((clicks > 0, spend / clicks), else_=0).label("cpc"),
+        case((clicks > 0, orders * 100.0 / clicks), else_=0).label("cvr"),
+    )
+
+
 async def query_campaign_daily(
     db: AsyncSession,
     credential_id: uuid.UUID,
@@ -578,127 +837,166 @@ async def query_campaign_daily(
     keys (e.g. "2026-02-13") in the same query — that would double-count metrics.
     For range queries, prefer exact range key match; otherwise use single-day rows only.
     """
+    (campaigns,) = await query_campaign_daily_periods(
+        db, credential_id, [(start_date, end_date)], profile_id=profile_id
+    )
+    return campaigns
+
+
+async def query_campaign_daily_periods(
+    db: AsyncSession,
+    credential_id: uuid.UUID,
+    periods: List[Tuple[str, str]],
+    profile_id: Optional[str] = None,
+) -> List[list]:
+    """
+    :func:`query_campaign_daily` for several (start, end) periods at once.
+
+    All periods are aggregated by one conditional GROUP BY (e.g. current and
+    comparison range of a report), joined to the Campaign metadata, so a
+    comparison costs no extra round-trip.
+    Returns one campaign list per period, in the order given.
+    """
     base_where = [
         CampaignPerformanceDaily.credential_id == credential_id,
         CampaignPerformanceDaily.profile_id == profile_id
         if profile_id is not None
         else CampaignPerformanceDaily.profile_id.is_(None),
     ]
+    date_col = CampaignPerformanceDaily.date
+
+    # Campaign metadata (state/type/budget that reports don't include) comes in
+    # through the same query; (credential_id, amazon_campaign_id) is unique on
+    # campaigns, so the join never multiplies the summed rows.
+    campaign_join = and_(
+        Campaign.credential_id == CampaignPerformanceDaily.credential_id,
+        Campaign.amazon_campaign_id == CampaignPerformanceDaily.amazon_campaign_id,
+        Campaign.profile_id == profile_id if profile_id is not None else Campaign.profile_id.is_(None),
+    )
 
-    # Range query: prefer true single-day rows when they exist.
-    # Fall back to exact legacy range keys only when daily data is unavailable.
-    if start_date != end_date:
-        range_where = base_where + [
-            CampaignPerformanceDaily.date >= start_date,
-            CampaignPerformanceDaily.date <= end_date,
-            func.strpos(CampaignPerformanceDaily.date, "__") <= 0,  # single-day only
-        ]
-        result = await db.execute(
+    def _grouped(period_col, where):
+        # Group on the output alias: repeating the CASE would repeat its
+        # bind parameters, which PostgreSQL does not treat as the same expression.
+        period = literal_column("period")
+        return (
             select(
-                CampaignPerformanceDaily.amazon_campaign_id,
-                func.max(CampaignPerformanceDaily.campaign_name).label("campaign_name"),
-                func.max(CampaignPerformanceDaily.campaign_type).label("campaign_type"),
-                func.max(CampaignPerformanceDaily.targeting_type).label("targeting_type"),
-                func.max(CampaignPerformanceDaily.state).label("state"),
-                func.sum(CampaignPerformanceDaily.spend).label("spend"),
-                func.sum(CampaignPerformanceDaily.sales).label("sales"),
-                func.sum(CampaignPerformanceDaily.impressions).label("impressions"),
-                func.sum(CampaignPerformanceDaily.clicks).label("clicks"),
-                func.sum(CampaignPerformanceDaily.orders).label("orders"),
-                func.avg(CampaignPerformanceDaily.top_of_search_impression_share).label("top_of_search_impression_share"),
-                func.max(CampaignPerformanceDaily.daily_budget).label("daily_budget"),
+                period_col.label("period"),
+                *_campaign_daily_columns(),
+                func.max(Campaign.state).label("meta_state"),
+                func.max(Campaign.campaign_type).label("meta_campaign_type"),
+                func.max(Campaign.targeting_type).label("meta_targeting_type"),
+                func.max(Campaign.daily_budget).label("meta_daily_budget"),
             )
-            .where(and_(*range_where))
-            .group_by(CampaignPerformanceDaily.amazon_campaign_id)
-            .order_by(func.sum(CampaignPerformanceDaily.spend).desc())
+            .select_from(CampaignPerformanceDaily)
+            .outerjoin(Campaign, campaign_join)
+            .where(and_(*base_where, where))
+            .group_by(period, CampaignPerformanceDaily.amazon_campaign_id)
+            .order_by(period, func.sum(CampaignPerformanceDaily.spend).desc())
         )
-        rows = result.all()
-        if not rows:
-            range_key = f"{start_date}__{end_date}"
-            exact_result = await db.execute(
-                select(
-                    CampaignPerformanceDaily.amazon_campaign_id,
-                    func.max(CampaignPerformanceDaily.campaign_name).label("campaign_name"),
-                    func.max(CampaignPerformanceDaily.campaign_type).label("campaign_type"),
-                    func.max(CampaignPerformanceDaily.targeting_type).label("targeting_type"),
-                    func.max(CampaignPerformanceDaily.state).label("state"),
-                    func.sum(CampaignPerformanceDaily.spend).label("spend"),
-                    func.sum(CampaignPerformanceDaily.sales).label("sales"),
-                    func.sum(CampaignPerformanceDaily.impressions).label("impressions"),
-                    func.sum(CampaignPerformanceDaily.clicks).label("clicks"),
-                    func.sum(CampaignPerformanceDaily.orders).label("orders"),
-                    func.avg(CampaignPerformanceDaily.top_of_search_impression_share).label("top_of_search_impression_share"),
-                    func.max(CampaignPerformanceDaily.daily_budget).label("daily_budget"),
-                )
-                .where(and_(*base_where, CampaignPerformanceDaily.date == range_key))
-                .group_by(CampaignPerformanceDaily.amazon_campaign_id)
-                .order_by(func.sum(CampaignPerformanceDaily.spend).desc())
-            )
-            rows = exact_result.all()
-    else:
-        # Single-day or exact key match — use exact date to avoid mixing with range keys
-        result = await db.execute(
-            select(
-                CampaignPerformanceDaily.amazon_campaign_id,
-                func.max(CampaignPerformanceDaily.campaign_name).label("campaign_name"),
-                func.max(CampaignPerformanceDaily.campaign_type).label("campaign_type"),
-                func.max(CampaignPerformanceDaily.targeting_type).label("targeting_type"),
-                func.max(CampaignPerformanceDaily.state).label("state"),
-                func.sum(CampaignPerformanceDaily.spend).label("spend"),
-                func.sum(CampaignPerformanceDaily.sales).label("sales"),
-                func.sum(CampaignPerformanceDaily.impressions).label("impressions"),
-                func.sum(CampaignPerformanceDaily.clicks).label("clicks"),
-                func.sum(CampaignPerformanceDaily.orders).label("orders"),
-                func.avg(CampaignPerformanceDaily.top_of_search_impression_share).label("top_of_search_impression_share"),
-                func.max(CampaignPerformanceDaily.daily_budget).label("daily_budget"),
+
+    # Range periods: prefer true single-day rows when they exist.
+    # Single-day periods: exact date match, so range keys never mix in.
+    whens = []
+    for idx, (start_date, end_date) in enumerate(periods):
+        if start_date != end_date:
+            cond = and_(
+                date_col >= start_date,
+                date_col <= end_date,
+                single_day_key(date_col),  # single-day only
             )
-            .where(and_(*base_where, CampaignPerformanceDaily.date == start_date))
-            .group_by(CampaignPerformanceDaily.amazon_campaign_id)
-            .order_by(func.sum(CampaignPerformanceDaily.spend).desc())
-        )
-        rows = result.all()
-
-    # Build a lookup of campaign state/type from the Campaign table
-    campaign_ids = [r.amazon_campaign_id for r in rows]
-    state_lookup = {}
-    if campaign_ids:
-        camp_lookup = [
-            Campaign.credential_id == credential_id,
-            Campaign.amazon_campaign_id.in_(campaign_ids),
-        ]
-        if profile_id is not None:
-            camp_lookup.append(Campaign.profile_id == profile_id)
         else:
-            camp_lookup.append(Campaign.profile_id.is_(None))
-        camp_result = await db.execute(
-            select(Campaign).where(and_(*camp_lookup))
-        )
-        for c in camp_result.scalars().all():
-            state_lookup[c.amazon_campaign_id] = {
-                "state": c.state,
-                "campaign_type": c.campaign_type,
-                "targeting_type": c.targeting_type,
-                "daily_budget": c.daily_budget,
-            }
+            cond = date_col == start_date
+        whens.append((cond, idx))
+    period_col = case(*whens, else_=None)
+    result = await db.execute(_grouped(period_col, or_(*(cond for cond, _ in whens))))
+    rows_by_period: List[list] = [[] for _ in periods]
+    for r in result.all():
+        rows_by_period[r.period].append(r)
 
-    campaigns = []
-    for r in rows:
-        camp_meta = state_lookup.get(r.amazon_campaign_id, {})
-        campaigns.append({
-            "campaign_id": r.amazon_campaign_id,
-            "campaign_name": r.campaign_name or "Unknown",
-            "campaign_type": r.campaign_type or camp_meta.get("campaign_type"),
-            "targeting_type": r.targeting_type or camp_meta.get("targeting_type"),
-            "state": r.state or camp_meta.get("state", ""),
-            "spend": float(r.spend or 0),
-            "sales": float(r.sales or 0),
-            "impressions": int(r.impressions or 0),
-            "clicks": int(r.clicks or 0),
-            "orders": int(r.orders or 0),
-            "top_of_search_impression_share": float(r.top_of_search_impression_share) if r.top_of_search_impression_share is not None else None,
-            "daily_budget": float(r.daily_budget or 0) or camp_meta.get("daily_budget", 0),
-        })
-    return enrich_campaigns(campaigns)
+    # Fall back to exact legacy range keys only when daily data is unavailable.
+    range_keys = {
+        f"{start_date}__{end_date}": idx
+        for idx, (start_date, end_date) in enumerate(periods)
+        if start_date != end_date and not rows_by_period[idx]
+    }
+    if range_keys:
+        key_col = case(*((date_col == key, idx) for key, idx in range_keys.items()), else_=None)
+        exact_result = await db.execute(_grouped(key_col, date_col.in_(list(range_keys))))
+        for r in exact_result.all():
+            rows_by_period[r.period].append(r)
+
+    out = []
+    for rows in rows_by_period:
+        campaigns = []
+        for r in rows:
+            tos = r.top_of_search_impression_share
+            campaigns.append({
+                "campaign_id": r.amazon_campaign_id,
+                "campaign_name": r.campaign_name or "Unknown",
+                "campaign_type": r.campaign_type or r.meta_campaign_type,
+                "targeting_type": r.targeting_type or r.meta_targeting_type,
+                "state": r.state or r.meta_state or "",
+                "spend": float(r.spend or 0),
+                "sales": float(r.sales or 0),
+                "impressions": int(r.impressions or 0),
+                "clicks": int(r.clicks or 0),
+                "orders": int(r.orders or 0),
+                "top_of_search_impression_share": round(float(tos), 2) if tos is not None else None,
+                "daily_budget": float(r.daily_budget or 0) or r.meta_daily_budget or 0,
+                "acos": round(float(r.acos or 0), 2),
+                "roas": round(float(r.roas or 0), 2),
+                "ctr": round(float(r.ctr or 0), 2),
+                "cpc": round(float(r.cpc or 0), 2),
+                "cvr": round(float(r.cvr or 0), 2),
+            })
+        out.append(campaigns)
+    return out
+
+
+# Trend point columns, selected as plain Core columns (no ORM hydration) and
+# already under their output names, so each row maps straight to its dict.
+_TREND_COLUMNS = (
+    AccountPerformanceDaily.date.label("date"),
+    func.coalesce(AccountPerformanceDaily.total_spend, 0).label("spend"),
+    func.coalesce(AccountPerformanceDaily.total_sales, 0).label("sales"),
+    func.coalesce(AccountPerformanceDaily.total_impressions, 0).label("impressions"),
+    func.coalesce(AccountPerformanceDaily.total_clicks, 0).label("clicks"),
+    func.coalesce(AccountPerformanceDaily.total_orders, 0).label("orders"),
+    func.coalesce(AccountPerformanceDaily.avg_acos, 0).label("acos"),
+    func.coalesce(AccountPerformanceDaily.avg_roas, 0).label("roas"),
+    func.coalesce(AccountPerformanceDaily.avg_ctr, 0).label("ctr"),
+    func.coalesce(AccountPerformanceDaily.avg_cpc, 0).label("cpc"),
+    AccountPerformanceDaily.avg_top_of_search_impression_share.label("top_of_search_impression_share"),
+    func.coalesce(AccountPerformanceDaily.total_campaigns, 0).label("campaigns"),
+    func.coalesce(AccountPerformanceDaily.active_campaigns, 0).label("active"),
+)
+
+
+def with_account_day_filters(
+    stmt: StatementLambdaElement,
+    credential_id: uuid.UUID,
+    start_date: str,
+    end_date: str,
+    profile_id: Optional[str] = None,
+) -> StatementLambdaElement:
+    """
+    Restrict a ``lambda_stmt`` over account_performance_daily to the
+    single-day rows of [start_date, end_date] for one credential/profile.
+
+    Built from lambdas so SQLAlchemy caches the statement construction and
+    compilation per shape; only the bound values change between calls.
+    """
+    stmt += lambda s: s.where(
+        AccountPerformanceDaily.credential_id == credential_id,
+        AccountPerformanceDaily.date >= start_date,
+        AccountPerformanceDaily.date <= end_date,
+        single_day_key(AccountPerformanceDaily.date),
+    )
+    if profile_id is not None:
+        stmt += lambda s: s.where(AccountPerformanceDaily.profile_id == profile_id)
+    else:
+        stmt += lambda s: s.where(AccountPerformanceDaily.profile_id.is_(None))
+    return stmt
 
 
 async def query_account_daily_trend(
@@ -713,40 +1011,11 @@ async def query_account_daily_trend(
     ideal for trend charts. Excludes range keys (date contains '__') since
     string comparison fails for them and trends require daily granularity.
     """
-    trend_where = [
-        AccountPerformanceDaily.credential_id == credential_id,
-        AccountPerformanceDaily.date >= start_date,
-        AccountPerformanceDaily.date <= end_date,
-        func.strpos(AccountPerformanceDaily.date, "__") <= 0,  # single-day only
-    ]
-    if profile_id is not None:
-        trend_where.append(AccountPerformanceDaily.profile_id == profile_id)
-    else:
-        trend_where.append(AccountPerformanceDaily.profile_id.is_(None))
-    result = await db.execute(
-        select(AccountPerformanceDaily)
-        .where(and_(*trend_where))
-        .order_by(AccountPerformanceDaily.date.asc())
-    )
-    rows = result.scalars().all()
-    return [
-        {
-            "date": r.date,
-            "spend": r.total_spend or 0,
-            "sales": r.total_sales or 0,
-            "impressions": r.total_impressions or 0,
-            "clicks": r.total_clicks or 0,
-            "orders": r.total_orders or 0,
-            "acos": r.avg_acos or 0,
-            "roas": r.avg_roas or 0,
-            "ctr": r.avg_ctr or 0,
-            "cpc": r.avg_cpc or 0,
-            "top_of_search_impression_share": r.avg_top_of_search_impression_share,
-            "campaigns": r.total_campaigns or 0,
-            "active": r.active_campaigns or 0,
-        }
-        for r in rows
-    ]
+    stmt = lambda_stmt(lambda: select(*_TREND_COLUMNS))
+    stmt = with_account_day_filters(stmt, credential_id, start_date, end_date, profile_id)
+    stmt += lambda s: s.order_by(AccountPerformanceDaily.date.asc())
+    result = await db.execute(stmt)
+    return [dict(r._mapping) for r in result]
 
 
 def _parse_range_key(date_key: str) -> tuple[Optional[str], Optional[str]]:
@@ -780,7 +1049,7 @@ async def query_account_range_key_trend(
     """
     where = [
         AccountPerformanceDaily.credential_id == credential_id,
-        func.strpos(AccountPerformanceDaily.date, "__") > 0,
+        range_key(AccountPerformanceDaily.date),
     ]
     if profile_id is not None:
         where.append(AccountPerformanceDaily.profile_id == profile_id)
@@ -806,8 +1075,8 @@ async def query_account_range_key_trend(
         if not rk_start or not rk_end:
             continue
         try:
-            rs = date.fromisoformat(rk_start)
-            re = date.fromisoformat(rk_end)
+            rs = _fromiso(rk_start)
+            re = _fromiso(rk_end)
         except ValueError:
             continue
         if re < req_start or rs > req_end:
@@ -882,7 +1151,7 @@ async def resolve_perf_date_source(
     single_where = base_where + [
         CampaignPerformanceDaily.date >= perf_start,
         CampaignPerformanceDaily.date <= perf_end,
-        func.strpos(CampaignPerformanceDaily.date, "__") <= 0,
+        single_day_key(CampaignPerformanceDaily.date),
     ]
     check = await db.execute(
         select(func.count()).select_from(CampaignPerformanceDaily).where(and_(*single_where))
@@ -892,63 +1161,105 @@ async def resolve_perf_date_source(
 
     # 2. Exact legacy range key exists?
     if perf_start != perf_end:
-        range_key = f"{perf_start}__{perf_end}"
+        exact_key = f"{perf_start}__{perf_end}"
         check = await db.execute(
             select(func.count()).select_from(CampaignPerformanceDaily).where(
-                and_(*base_where, CampaignPerformanceDaily.date == range_key)
+                and_(*base_where, CampaignPerformanceDaily.date == exact_key)
             )
         )
         if (check.scalar() or 0) > 0:
-            return ("exact_range", range_key, None)
+            return ("exact_range", exact_key, None)
 
     # 3. Best overlapping range key?
-    range_where = base_where + [func.strpos(CampaignPerformanceDaily.date, "__") > 0]
+    try:
+        req_start = date.fromisoformat(perf_start)
+        req_end = date.fromisoformat(perf_end)
+    except (ValueError, TypeError):
+        return ("single_day", perf_start, perf_end)
     result = await db.execute(
-        select(CampaignPerformanceDaily.date).where(and_(*range_where)).distinct()
+        select(CampaignPerformanceDaily.date)
+        .where(and_(*base_where, *candidate_range_key_filters(req_start, req_end)))
+        .distinct()
     )
-    range_keys = [r[0] for r in result.all()]
+    match = _pick_range_key(req_start, req_end, tuple(r[0] for r in result.all()))
+    if match:
+        return ("best_range", match[0], None)
 
-    parsed = []
-    for rk in range_keys:
-        parts = rk.split("__")
-        if len(parts) == 2:
-            parsed.append((rk, parts[0], parts[1]))
+    # Fallback: single_day (may return empty)
+    return ("single_day", perf_start, perf_end)
 
-    # Exact encompassing
-    for rk, rs, re in parsed:
-        if rs <= perf_start and re >= perf_end:
-            return ("best_range", rk, None)
 
-    # Best overlap (≥70%)
-    try:
-        req_start = date.fromisoformat(perf_start)
-        req_end = date.fromisoformat(perf_end)
-        req_days = (req_end - req_start).days + 1
-        best_match, best_overlap = None, 0
+def candidate_range_key_filters(req_start: date, req_end: date) -> list:
+    """
+    SQL bounds on range keys that could satisfy ``_pick_range_key``.
 
-        for rk, rs, re in parsed:
-            try:
-                r_start = date.fromisoformat(rs)
-                r_end = date.fromisoformat(re)
-            except ValueError:
-                continue
-            overlap_start = max(r_start, req_start)
-            overlap_end = min(r_end, req_end)
-            overlap_days = (overlap_end - overlap_start).days + 1
-            if overlap_days <= 0:
-                continue
-            ratio = overlap_days / req_days if req_days > 0 else 0
-            if ratio >= 0.7 and overlap_days > best_overlap:
-                best_overlap = overlap_days
-                best_match = rk
+    A key needs at least ``RANGE_MIN_OVERLAP`` of the requested days in common
+    (an encompassing key has all of them), so its start can be no later than
+    ``req_end - min_overlap + 1`` and its end no earlier than
+    ``req_start + min_overlap - 1``. ISO dates compare correctly as strings,
+    so PostgreSQL discards the rest before they reach Python.
+    """
+    req_days = (req_end - req_start).days + 1
+    # floor keeps the bound a superset of what the ratio test accepts.
+    slack = timedelta(days=max(1, math.floor(RANGE_MIN_OVERLAP * req_days)) - 1)
+    date_col = CampaignPerformanceDaily.date
+    return [
+        range_key(date_col),
+        func.split_part(date_col, "__", 1) <= (req_end - slack).isoformat(),
+        func.split_part(date_col, "__", 2) >= (req_start + slack).isoformat(),
+    ]
 
-        if best_match:
-            return ("best_range", best_match, None)
-    except (ValueError, TypeError):
-        pass
 
-    # Fallback: single_day (may return empty)
-    return ("single_day", perf_start, perf_end)
+@lru_cache(maxsize=1024)
+def _pick_range_key(
+    req_start: date, req_end: date, keys: Tuple[str, ...]
+) -> Optional[Tuple[str, bool, int]]:
+    """
+    Choose the stored range key to serve ``req_start``–``req_end`` from.
+
+    Returns ``(key, encompassing, overlap_days)`` or None. Pure in its
+    arguments, so repeat lookups (users flipping presets) skip re-parsing
+    every key; the key tuple is part of the cache key, so newly stored
+    ranges are picked up without invalidation.
+    """
+    req_days = (req_end - req_start).days + 1
+    # One pass: each key is parsed once and scored for both strategies.
+    encompassing = None  # (span_days, rk) — tightest stored range covering the request
+    best_match = None
+    best_overlap = 0
+    for rk in keys:
+        parts = rk.split("__")
+        if len(parts) != 2:
+            continue
+        try:
+            rs = _fromiso(parts[0])
+            re_ = _fromiso(parts[1])
+        except ValueError:
+            continue
+
+        # Priority 1: Exact encompassing — stored range fully covers requested
+        if rs <= req_start and re_ >= req_end:
+            span = (re_ - rs).days
+            if encompassing is None or span < encompassing[0]:
+                encompassing = (span, rk)
+            continue
+
+        # Priority 2: Best overlap — same start (or very close), end within a
+        # few days of requested end.  This handles "This Month" rolling forward:
+        # yesterday's "Feb 1–Feb 10" is still useful for today's "Feb 1–Feb 11".
+        overlap_days = (min(re_, req_end) - max(rs, req_start)).days + 1
+        if overlap_days <= 0:
+            continue
+        # Accept if ≥70% of the requested range is covered
+        if overlap_days / req_days >= RANGE_MIN_OVERLAP and overlap_days > best_overlap:
+            best_overlap = overlap_days
+            best_match = rk
+
+    if encompassing:
+        return encompassing[1], True, req_days
+    if best_match:
+        return best_match, False, best_overlap
+    return None
 
 
 async def find_encompassing_range_data(
@@ -964,6 +1275,7 @@ async def find_encompassing_range_data(
 
     Matching strategy (in priority order):
     1. Exact encompassing — stored range fully covers requested range
+       (the tightest such range when several do)
     2. Best overlap — stored range shares the same start and its end is
        within a few days of the requested end (handles rolling "This Month"
        advancing by 1 day each day without needing to re-generate)
@@ -973,76 +1285,41 @@ async def find_encompassing_range_data(
     Note: Returns aggregated data from the matched range — best-effort fallback
     until the user generates fresh data for the exact range.
     """
-    # Use strpos for literal "__" — SQL LIKE treats _ as wildcard, so contains("__") would match incorrectly
+    try:
+        req_start = date.fromisoformat(start_date)
+        req_end = date.fromisoformat(end_date)
+    except (ValueError, TypeError):
+        return []
+
+    date_col = CampaignPerformanceDaily.date
     range_where = [
         CampaignPerformanceDaily.credential_id == credential_id,
-        func.strpos(CampaignPerformanceDaily.date, "__") > 0,
+        *candidate_range_key_filters(req_start, req_end),
     ]
     if profile_id is not None:
         range_where.append(CampaignPerformanceDaily.profile_id == profile_id)
     else:
         range_where.append(CampaignPerformanceDaily.profile_id.is_(None))
-    result = await db.execute(
-        select(CampaignPerformanceDaily.date).where(and_(*range_where)).distinct()
+    result = await db.stream(
+        select(date_col)
+        .where(and_(*range_where))
+        .distinct()
+        .execution_options(yield_per=RANGE_KEY_FETCH_BATCH)
     )
-    range_keys = [r[0] for r in result.all()]
-
-    # Parse all valid range keys
-    parsed_keys = []
-    for rk in range_keys:
-        parts = rk.split("__")
-        if len(parts) == 2:
-            parsed_keys.append((rk, parts[0], parts[1]))
-
-    # Priority 1: Exact encompassing — stored range fully covers requested
-    for rk, rk_start, rk_end in parsed_keys:
-        if rk_start <= start_date and rk_end >= end_date:
-            logger.info(f"Found encompassing range key: {rk} for requested {start_date}–{end_date}")
-            return await query_campaign_daily(db, credential_id, rk, rk, profile_id=profile_id)
-
-    # Priority 2: Best overlap — same start (or very close), end within a
-    # few days of requested end.  This handles "This Month" rolling forward:
-    # yesterday's "Feb 1–Feb 10" is still useful for today's "Feb 1–Feb 11".
-    best_match = None
-    best_overlap = 0
-    try:
-        req_start = date.fromisoformat(start_date)
-        req_end = date.fromisoformat(end_date)
-        req_days = (req_end - req_start).days + 1
-
-        for rk, rk_start, rk_end in parsed_keys:
-            try:
-                rs = date.fromisoformat(rk_start)
-                re_ = date.fromisoformat(rk_end)
-            except ValueError:
-                continue
-
-            # Compute overlap between stored range and requested range
-            overlap_start = max(rs, req_start)
-            overlap_end = min(re_, req_end)
-            overlap_days = (overlap_end - overlap_start).days + 1
-
-            if overlap_days <= 0:
-                continue
 
-            # Overlap ratio: what fraction of the requested range is covered?
-            overlap_ratio = overlap_days / req_days if req_days > 0 else 0
-
-            # Accept if ≥70% overlap (handles rolling ranges like This Month)
-            if overlap_ratio >= 0.7 and overlap_days > best_overlap:
-                best_overlap = overlap_days
-                best_match = rk
-    except (ValueError, TypeError):
-        pass
-
-    if best_match:
+    keys = tuple([rk async for (rk,) in result])
+    match = _pick_range_key(req_start, req_end, keys)
+    if match is None:
+        return []
+    rk, encompassing, overlap_days = match
+    if encompassing:
+        logger.info(f"Found encompassing range key: {rk} for requested {start_date}–{end_date}")
+    else:
         logger.info(
-            f"Found best-match range key: {best_match} ({best_overlap} day overlap) "
+            f"Found best-match range key: {rk} ({overlap_days} day overlap) "
             f"for requested {start_date}–{end_date}"
         )
-        return await query_campaign_daily(db, credential_id, best_match, best_match, profile_id=profile_id)
-
-    return []
+    return await query_campaign_daily(db, credential_id, rk, rk, profile_id=profile_id)
 
 
 async def has_daily_data(
@@ -1062,17 +1339,194 @@ async def has_daily_data(
         has_where.append(AccountPerformanceDaily.profile_id == profile_id)
     else:
         has_where.append(AccountPerformanceDaily.profile_id.is_(None))
-    result = await db.execute(
-        select(func.count(AccountPerformanceDaily.id)).where(and_(*has_where))
-    )
-    count = result.scalar() or 0
-    return count > 0
+    # EXISTS stops at the first matching row of ix_apd_credential_date
+    # (credential_id, date), checking profile_id on the fetched row, instead
+    # of counting them all.
+    result = await db.execute(select(exists().where(and_(*has_where))))
+    return bool(result.scalar())
 
 
 # ══════════════════════════════════════════════════════════════════════
 #  MCP REPORT — Create & retrieve from Amazon Ads API
 # ══════════════════════════════════════════════════════════════════════
 
+# Report column aliases per metric, most specific first.
+_SPEND_KEYS = ("metric.totalCost", "metric.supplyCost", "cost", "spend")
+_SALES_KEYS = ("metric.sales", "sales", "attributedSales14d", "revenue")
+_IMPRESSIONS_KEYS = ("metric.impressions", "impressions")
+_CLICKS_KEYS = ("metric.clicks", "clicks")
+_ORDERS_KEYS = ("metric.purchases", "orders", "attributedConversions14d", "conversions")
+_BUDGET_KEYS = ("dailyBudget", "daily_budget", "budget")
+
+
+@lru_cache(maxsize=4096)
+def _parse_share_text(text: str) -> Optional[float]:
+    """Parse a share like "12.5%" (cached: reports repeat a few values)."""
+    try:
+        return round(float(text.replace("%", "").strip()), 2)
+    except ValueError:
+        return None
+
+
+def _parse_share(value) -> Optional[float]:
+    """Normalise a top-of-search impression share to a 2dp float, or None."""
+    if isinstance(value, str):
+        return _parse_share_text(value)
+    try:
+        return round(float(value), 2)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class _CampaignTotals:
+    """Running per-campaign sums for ``aggregate_campaign_rows``."""
+
+    campaign_id: str
+    campaign_name: str
+    state: str = ""
+    spend: float = 0.0
+    sales: float = 0.0
+    impressions: int = 0
+    clicks: int = 0
+    orders: int = 0
+    daily_budget: float = 0.0
+    targeting_type: str = ""
+    campaign_type: str = ""
+    tos_weighted_sum: float = 0.0
+    tos_weighted_den: int = 0
+
+    def as_row(self) -> dict:
+        den = self.tos_weighted_den
+        return {
+            "campaign_id": self.campaign_id,
+            "campaign_name": self.campaign_name,
+            "state": self.state,
+            "spend": self.spend,
+            "sales": self.sales,
+            "impressions": self.impressions,
+            "clicks": self.clicks,
+            "orders": self.orders,
+            "daily_budget": self.daily_budget,
+            "targeting_type": self.targeting_type,
+            "campaign_type": self.campaign_type,
+            "top_of_search_impression_share": (
+                round(self.tos_weighted_sum / den, 2) if den > 0 else None
+            ),
+        }
+
+
+# ── Report id extraction: one function per MCP response format ──────
+
+
+def _ids_from_success(result: dict) -> list:
+    """Format 1: {"success": [{"report": {"reportId": "..."}}]}"""
+    for entry in result.get("success") or ():
+        if isinstance(entry, dict):
+            report = entry.get("report")
+            if isinstance(report, dict) and "reportId" in report:
+                return [report["reportId"]]
+    return []
+
+
+def _ids_direct(result: dict) -> list:
+    """Format 2: {"reportIds": [...]}"""
+    return result.get("reportIds") or []
+
+
+def _ids_from_reports(result: dict) -> list:
+    """Format 3: {"reports": [{"reportId": "..."}, ...]}"""
+    reports = result.get("reports")
+    if not isinstance(reports, list):
+        return []
+    return [r["reportId"] for r in reports if isinstance(r, dict) and "reportId" in r]
+
+
+def _ids_single(result: dict) -> list:
+    """Format 4: {"reportId": "..."}"""
+    return [result["reportId"]] if "reportId" in result else []
+
+
+_REPORT_ID_EXTRACTORS = (_ids_from_success, _ids_direct, _ids_from_reports, _ids_single)
+
+
+class _PendingReportBatcher:
+    """
+    Coalesce concurrent pending-report checks into one ``retrieve_report``.
+
+    The first caller for an account scope opens a batch and waits
+    ``PENDING_REPORT_BATCH_WINDOW`` for others to join (up to
+    ``PENDING_REPORT_BATCH_SIZE`` ids), then issues one call and hands each
+    caller the response entry for its report. Scopes include the access
+    token, so clients only share a call when they carry the same credentials.
+    """
+
+    def __init__(self):
+        self._open: Dict[tuple, list] = {}
+
+    @staticmethod
+    def _scope(client: AmazonAdsMCP) -> tuple:
+        return (
+            client.client_id, client.access_token, client.region,
+            client.profile_id, client.account_id, client.advertiser_account_id,
+        )
+
+    async def retrieve(self, client: AmazonAdsMCP, report_id: str) -> dict:
+        scope = self._scope(client)
+        batch = self._open.get(scope)
+        if batch is not None:
+            fut = asyncio.get_running_loop().create_future()
+            batch.append((report_id, fut))
+            if len(batch) >= PENDING_REPORT_BATCH_SIZE:
+                # Full: later callers start a new batch.
+                self._open.pop(scope, None)
+            result = await fut
+            if result is None:
+                # The batch was abandoned (its opener was cancelled).
+                return await client.retrieve_report([report_id])
+            return result
+
+        batch = [(report_id, None)]
+        self._open[scope] = batch
+        result = None
+        try:
+            await asyncio.sleep(PENDING_REPORT_BATCH_WINDOW)
+            if self._open.get(scope) is batch:
+                del self._open[scope]
+            ids = list(dict.fromkeys(rid for rid, _ in batch))
+            result = await client.retrieve_report(ids)
+        except Exception as e:
+            for _, fut in batch[1:]:
+                if not fut.done():
+                    fut.set_exception(e)
+            raise
+        finally:
+            if self._open.get(scope) is batch:
+                del self._open[scope]
+            for rid, fut in batch[1:]:
+                if not fut.done():
+                    fut.set_result(
+                        None if result is None else self._entry_for(result, rid, len(ids))
+                    )
+        return self._entry_for(result, report_id, len(ids))
+
+    @staticmethod
+    def _entry_for(result: dict, report_id: str, batch_len: int) -> dict:
+        """Slice one report's entry out of a batched retrieve_report response."""
+        if batch_len == 1 or not isinstance(result, dict):
+            return result
+        for entry in result.get("success", []):
+            if not isinstance(entry, dict):
+                continue
+            report = entry.get("report")
+            if isinstance(report, dict) and report.get("reportId") == report_id:
+                return {"success": [entry]}
+        return {"success": []}
+
+
+_pending_reports = _PendingReportBatcher()
+
+
 class ReportingService:
     """Wraps the MCP client to create & retrieve Amazon Ads reports."""
 
@@ -1114,7 +1568,7 @@ class ReportingService:
             if pending_report_id:
                 logger.info(f"Checking pending report: {pending_report_id}")
                 try:
-                    check = await self.client.retrieve_report([pending_report_id])
+                    check = await _pending_reports.retrieve(self.client, pending_report_id)
                     status = self.client._get_report_status(check)
                     if status == "COMPLETED":
                         rows = await self._download_report_data(check)
@@ -1147,16 +1601,22 @@ class ReportingService:
                 )
                 logger.info(f"MCP create_campaign_report response keys: {list(result.keys()) if isinstance(result, dict) else type(result)}")
 
-                report_ids = self._extract_report_ids(result)
+                report_ids = self.extract_report_ids(result)
                 logger.info(f"Extracted report IDs: {report_ids}")
 
             if not report_ids:
                 logger.warning(f"No report IDs extracted from creation response")
                 return {}
 
-            # Phase 3: Poll for completion
+            # Phase 3: Poll for completion. Reports take minutes, so back off
+            # from a short first wait instead of polling every 10s throughout.
             completed = await self.client.poll_report(
-                report_ids, max_wait=max_wait, interval=10
+                report_ids,
+                max_wait=max_wait,
+                interval=REPORT_POLL_INITIAL,
+                backoff=REPORT_POLL_BACKOFF,
+                max_interval=REPORT_POLL_MAX_INTERVAL,
+                jitter=REPORT_POLL_JITTER,
             )
 
             # Phase 4: Download data if completed
@@ -1271,7 +1731,7 @@ class ReportingService:
                     report_config,
                     advertiser_account_id=self.advertiser_account_id,
                 )
-                report_ids = self._extract_report_ids(result)
+                report_ids = self.extract_report_ids(result)
                 if not report_ids:
                     continue
                 completed = await self.client.poll_report(
@@ -1412,28 +1872,25 @@ class ReportingService:
                     day_str,
                 )
                 return []
-            day_rows = self.parse_report_campaign_rows(day_result)
-            for row in day_rows:
-                row["report_date"] = row.get("report_date") or day_str
-            daily_rows.extend(day_rows)
+            daily_rows.extend(self.parse_report_campaign_rows(day_result, default_date=day_str))
             current += timedelta(days=1)
 
         return daily_rows
 
-    @staticmethod
-    async def _download_report_data(report_response: dict) -> list:
+    @classmethod
+    async def _download_report_data(cls, report_response: dict) -> list:
         """
         Download and decompress report data from completedReportParts S3 URLs.
-        Returns a flat list of campaign rows.
+        Parts are fetched concurrently over the shared client; a failed part is logged
+        and skipped. Returns a flat list of campaign rows in part order.
         """
         all_rows = []
         if not isinstance(report_response, dict):
             return all_rows
 
-        for entry in report_response.get("success", []):
-            if not isinstance(entry, dict):
-                continue
-            report = entry.get("report", {})
+        urls = []
+        for entry in report_response.get("success") or ():
+            report = entry.get("report") if isinstance(entry, dict) else None
             if not isinstance(report, dict):
                 continue
 
@@ -1442,74 +1899,48 @@ class ReportingService:
                 logger.info(f"Report status is {status}, skipping download")
                 continue
 
-            parts = report.get("completedReportParts", [])
-            for part in parts:
-                url = part.get("url")
-                if not url:
-                    continue
-                try:
-                    async with httpx.AsyncClient(timeout=30.0) as http:
-                        resp = await http.get(url)
-                        resp.raise_for_status()
-
-                    # Decompress gzip data
-                    try:
-                        data = gzip.decompress(resp.content)
-                        text = data.decode("utf-8")
-                    except Exception:
-                        # Maybe not gzipped
-                        text = resp.content.decode("utf-8")
-
-                    import json
-                    parsed = json.loads(text)
-                    if isinstance(parsed, list):
-                        all_rows.extend(parsed)
-                        logger.info(f"Downloaded report part: {len(parsed)} rows")
-                    elif isinstance(parsed, dict):
-                        # Some formats wrap rows in a key
-                        for key in ("rows", "data", "campaigns", "results"):
-                            if key in parsed and isinstance(parsed[key], list):
-                                all_rows.extend(parsed[key])
-                                break
-                        else:
-                            all_rows.append(parsed)
-                except Exception as e:
-                    logger.warning(f"Failed to download report part: {e}")
+            for part in report.get("completedReportParts") or ():
+                url = part.get("url") if isinstance(part, dict) else None
+                if url:
+                    urls.append(url)
+
+        if not urls:
+            return all_rows
+
+        http = report_http()
+        results = await asyncio.gather(
+            *(fetch_report_part(http, url) for url in urls),
+            return_exceptions=True,
+        )
+
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning(f"Failed to download report part: {res}")
+                continue
+            logger.info(f"Downloaded report part: {len(res)} rows")
+            if not all_rows:
+                # Usually a single part: keep its list rather than copying it.
+                all_rows = res
+                continue
+            all_rows.extend(res)
 
         logger.info(f"Total downloaded report rows: {len(all_rows)}")
         return all_rows
 
     @staticmethod
-    def _extract_report_ids(result: dict) -> list:
+    def extract_report_ids(result: dict) -> list:
         """Extract report IDs from various MCP response formats."""
+        # Common case: one report in the success list.
+        try:
+            return [result["success"][0]["report"]["reportId"]]
+        except (KeyError, IndexError, TypeError):
+            pass
         if not isinstance(result, dict):
             return []
-
-        # Format 1: {"success": [{"report": {"reportId": "..."}}]}
-        for entry in result.get("success", []):
-            if isinstance(entry, dict):
-                report = entry.get("report", {})
-                if isinstance(report, dict) and "reportId" in report:
-                    return [report["reportId"]]
-
-        # Format 2: Direct reportIds
-        if "reportIds" in result:
-            return result["reportIds"]
-
-        # Format 3: reports array with reportId
-        if "reports" in result and isinstance(result["reports"], list):
-            ids = [
-                r["reportId"]
-                for r in result["reports"]
-                if isinstance(r, dict) and "reportId" in r
-            ]
+        for extractor in _REPORT_ID_EXTRACTORS:
+            ids = extractor(result)
             if ids:
                 return ids
-
-        # Format 4: Single reportId
-        if "reportId" in result:
-            return [result["reportId"]]
-
         return []
 
     @staticmethod
@@ -1517,35 +1948,43 @@ class ReportingService:
         """Extract a concrete YYYY-MM-DD date from a report row when present."""
         for key in ("date", "metric.date", "reportDate", "date.value"):
             value = row.get(key)
-            if isinstance(value, str):
-                try:
-                    date.fromisoformat(value)
-                    return value
-                except ValueError:
-                    continue
+            if isinstance(value, str) and _is_iso_day(value):
+                return value
 
         date_range_value = row.get("dateRange.value") or row.get("dateRange")
         if isinstance(date_range_value, str) and "/" in date_range_value:
             start, end = date_range_value.split("/", 1)
-            try:
-                date.fromisoformat(start)
-                date.fromisoformat(end)
-            except ValueError:
-                return None
-            if start == end:
+            if start == end and _is_iso_day(start):
                 return start
         return None
 
     @classmethod
-    def parse_report_campaign_rows(cls, report_data: dict) -> list:
+    def parse_report_campaign_rows(
+        cls,
+        report_data: dict,
+        enrich: bool = True,
+        default_date: Optional[str] = None,
+    ) -> list:
         """
         Normalise MCP report data into campaign rows.
-        Preserves report_date when Amazon returns daily-granularity data.
+        Preserves report_date when Amazon returns daily-granularity data;
+        rows without one get ``default_date`` (e.g. the day a single-day
+        report was requested for).
+        Pass ``enrich=False`` to skip the per-row derived metrics when the
+        rows are only going to be aggregated.
         Handles:
          - {"success": [{"report": {"completedReportParts": [{"url": ...}], ...}}]}
          - {"campaigns": [...]} or {"results": [...]} etc.
          - Raw list of campaign dicts
         """
+        # Enrichment copies each row, so feed it lazily: the normalised dict
+        # is dropped as soon as its enriched copy exists.
+        rows = cls._iter_normalised_rows(cls._raw_report_rows(report_data), default_date)
+        return enrich_campaigns(rows) if enrich else list(rows)
+
+    @staticmethod
+    def _raw_report_rows(report_data) -> list:
+        """Collect the raw row dicts from any supported report payload shape."""
         raw = []
 
         if isinstance(report_data, dict):
@@ -1589,7 +2028,11 @@ class ReportingService:
         else:
             logger.info("No report rows found to parse")
 
-        normalised = []
+        return raw
+
+    @classmethod
+    def _iter_normalised_rows(cls, raw: list, default_date: Optional[str] = None) -> Iterator[dict]:
+        """Yield one normalised campaign dict per raw report row."""
         for c in raw:
             if not isinstance(c, dict):
                 continue
@@ -1604,34 +2047,21 @@ class ReportingService:
                 c.get("campaign.name") or c.get("campaignName")
                 or c.get("campaign_name") or "Unknown"
             )
-            spend = float(
-                c.get("metric.totalCost") or c.get("metric.supplyCost")
-                or c.get("cost") or c.get("spend") or 0
-            )
-            sales = float(
-                c.get("metric.sales") or c.get("sales")
-                or c.get("attributedSales14d") or c.get("revenue") or 0
-            )
-            impressions = int(c.get("metric.impressions") or c.get("impressions") or 0)
-            clicks = int(c.get("metric.clicks") or c.get("clicks") or 0)
-            orders = int(
-                c.get("metric.purchases") or c.get("orders")
-                or c.get("attributedConversions14d") or c.get("conversions") or 0
-            )
+            # Metrics take the first alias present, so a real 0 is kept
+            # rather than falling through to a differently-scoped column.
+            spend = float(first_present(c, _SPEND_KEYS) or 0)
+            sales = float(first_present(c, _SALES_KEYS) or 0)
+            impressions = int(first_present(c, _IMPRESSIONS_KEYS) or 0)
+            clicks = int(first_present(c, _CLICKS_KEYS) or 0)
+            orders = int(first_present(c, _ORDERS_KEYS) or 0)
             top_share = None
             for key in ("metric.topOfSearchImpressionShare", "topOfSearchImpressionShare", "top_of_search_impression_share"):
                 val = c.get(key)
                 if val is not None:
-                    top_share = val
+                    top_share = _parse_share(val)
                     break
-            if isinstance(top_share, str):
-                top_share = top_share.replace("%", "").strip()
-            try:
-                top_share = float(top_share) if top_share is not None else None
-            except (TypeError, ValueError):
-                top_share = None
 
-            normalised.append({
+            yield {
                 "campaign_id": campaign_id,
                 "campaign_name": campaign_name,
                 "state": c.get("state", c.get("status", "")),
@@ -1641,15 +2071,11 @@ class ReportingService:
                 "clicks": clicks,
                 "orders": orders,
                 "top_of_search_impression_share": top_share,
-                "daily_budget": float(
-                    c.get("dailyBudget") or c.get("daily_budget")
-                    or c.get("budget") or 0
-                ),
+                "daily_budget": float(first_present(c, _BUDGET_KEYS) or 0),
                 "targeting_type": c.get("targetingType") or c.get("targeting_type") or "",
                 "campaign_type": c.get("campaignType") or c.get("campaign_type") or "",
-                "report_date": cls._extract_report_date(c),
-            })
-        return enrich_campaigns(normalised)
+                "report_date": cls._extract_report_date(c) or default_date,
+            }
 
     @classmethod
     def parse_report_campaigns(cls, report_data: dict) -> list:
@@ -1657,64 +2083,39 @@ class ReportingService:
         Aggregate normalised report rows into one entry per campaign.
         This keeps summaries/top-performers stable even when the report is daily.
         """
-        rows = cls.parse_report_campaign_rows(report_data)
+        rows = cls._iter_normalised_rows(cls._raw_report_rows(report_data))
         return cls.aggregate_campaign_rows(rows)
 
     @staticmethod
-    def aggregate_campaign_rows(rows: list[dict]) -> list:
-        """Aggregate normalised campaign rows into one entry per campaign."""
-        if not rows:
-            return []
-
-        grouped: dict[str, dict] = {}
+    def aggregate_campaign_rows(rows: Iterable[dict]) -> list:
+        """Aggregate normalised campaign rows (any iterable) into one entry per campaign."""
+        grouped: dict[str, _CampaignTotals] = {}
         for row in rows:
-            campaign_id = row.get("campaign_id") or ""
-            key = campaign_id or f"__name__:{row.get('campaign_name') or 'Unknown'}"
-            existing = grouped.get(key)
-            if not existing:
-                grouped[key] = {
-                    "campaign_id": campaign_id,
-                    "campaign_name": row.get("campaign_name") or "Unknown",
-                    "state": row.get("state") or "",
-                    "spend": float(row.get("spend") or 0),
-                    "sales": float(row.get("sales") or 0),
-                    "impressions": int(row.get("impressions") or 0),
-                    "clicks": int(row.get("clicks") or 0),
-                    "orders": int(row.get("orders") or 0),
-                    "daily_budget": float(row.get("daily_budget") or 0),
-                    "targeting_type": row.get("targeting_type") or "",
-                    "campaign_type": row.get("campaign_type") or "",
-                    "_tos_weighted_sum": float(row.get("top_of_search_impression_share") or 0)
-                    * max(int(row.get("impressions") or 0), 1)
-                    if row.get("top_of_search_impression_share") is not None
-                    else 0.0,
-                    "_tos_weighted_den": max(int(row.get("impressions") or 0), 1)
-                    if row.get("top_of_search_impression_share") is not None
-                    else 0,
-                }
-                continue
-
-            existing["spend"] += float(row.get("spend") or 0)
-            existing["sales"] += float(row.get("sales") or 0)
-            existing["impressions"] += int(row.get("impressions") or 0)
-            existing["clicks"] += int(row.get("clicks") or 0)
-            existing["orders"] += int(row.get("orders") or 0)
-            existing["state"] = existing["state"] or row.get("state") or ""
-            existing["campaign_type"] = existing["campaign_type"] or row.get("campaign_type") or ""
-            existing["targeting_type"] = existing["targeting_type"] or row.get("targeting_type") or ""
-            existing["daily_budget"] = existing["daily_budget"] or float(row.get("daily_budget") or 0)
-            if row.get("top_of_search_impression_share") is not None:
-                weight = max(int(row.get("impressions") or 0), 1)
-                existing["_tos_weighted_sum"] += float(row.get("top_of_search_impression_share") or 0) * weight
-                existing["_tos_weighted_den"] += weight
-
-        aggregated = []
-        for row in grouped.values():
-            den = row.pop("_tos_weighted_den", 0)
-            weighted_sum = row.pop("_tos_weighted_sum", 0.0)
-            row["top_of_search_impression_share"] = round(weighted_sum / den, 2) if den > 0 else None
-            aggregated.append(row)
-        return enrich_campaigns(aggregated)
+            get = row.get
+            campaign_id = get("campaign_id") or ""
+            key = campaign_id or f"__name__:{get('campaign_name') or 'Unknown'}"
+            impressions = int(get("impressions") or 0)
+            tos = get("top_of_search_impression_share")
+            totals = grouped.get(key)
+            if totals is None:
+                totals = grouped[key] = _CampaignTotals(
+                    campaign_id, get("campaign_name") or "Unknown"
+                )
+            totals.spend += float(get("spend") or 0)
+            totals.sales += float(get("sales") or 0)
+            totals.impressions += impressions
+            totals.clicks += int(get("clicks") or 0)
+            totals.orders += int(get("orders") or 0)
+            totals.state = totals.state or get("state") or ""
+            totals.campaign_type = totals.campaign_type or get("campaign_type") or ""
+            totals.targeting_type = totals.targeting_type or get("targeting_type") or ""
+            totals.daily_budget = totals.daily_budget or float(get("daily_budget") or 0)
+            if tos is not None:
+                weight = max(impressions, 1)
+                totals.tos_weighted_sum += float(tos or 0) * weight
+                totals.tos_weighted_den += weight
+
+        return enrich_campaigns(t.as_row() for t in grouped.values())
 
 
 def targeting_perf_acos(spend: float, sales: float) -> Optional[float]:
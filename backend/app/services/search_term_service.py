@@ -8,20 +8,22 @@ Search term data enables the AI assistant to answer questions like:
 - What customer queries should be harvested to manual campaigns?
 """
 
-import gzip
-import json
+import asyncio
 import logging
+import os
+import reprlib
 import uuid
 from datetime import date, datetime, timedelta
 from typing import Optional
 
-import httpx
-from sqlalchemy import and_, delete, select
+from sqlalchemy import and_, delete, func, insert, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.mcp_client import AmazonAdsMCP
 from app.models import AdGroup, SearchTermPerformance, Target
-from app.utils import marketplace_today
+from app.services.reporting_service import ReportingService, fetch_report_part, report_http
+from app.utils import marketplace_today, utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +31,153 @@ logger = logging.getLogger(__name__)
 # wide date ranges, queue load). Shorter windows cause spurious timeouts while
 # the report would have completed shortly after.
 SEARCH_TERM_REPORT_POLL_MAX_WAIT_SEC = 420
-SEARCH_TERM_REPORT_POLL_INTERVAL_SEC = 10
+# Status is checked right away, then after 0.5s, 0.85s, 1.4s, ... capped at 15s,
+# so reports that finish quickly are picked up without a fixed 10s wait.
+SEARCH_TERM_REPORT_POLL_INITIAL_SEC = 0.5
+SEARCH_TERM_REPORT_POLL_BACKOFF = 1.7
+SEARCH_TERM_REPORT_POLL_MAX_INTERVAL_SEC = 15.0
+
+# Report parts downloaded at once per sync.
+SEARCH_TERM_PART_CONCURRENCY = 8
+
+# Keys a downloaded part may wrap its row list in.
+SEARCH_TERM_ROW_KEYS = ("rows", "data", "searchTerms", "results")
+
+# Rows per executemany batch. Tunable with SEARCH_TERM_BATCH_SIZE; values are
+# clamped so a batch rendered as one multi-VALUES page (~29 columns per row)
+# stays under asyncpg's 32767 bind-parameter cap.
+_MAX_INSERT_CHUNK = 32767 // len(SearchTermPerformance.__table__.columns)
+
+
+def _insert_chunk_from_env(default: int = 1000) -> int:
+    raw = os.getenv("SEARCH_TERM_BATCH_SIZE", "").strip()
+    try:
+        size = int(raw) if raw else default
+    except ValueError:
+        logger.warning(f"Ignoring invalid SEARCH_TERM_BATCH_SIZE={raw!r}")
+        size = default
+    return max(1, min(size, _MAX_INSERT_CHUNK))
+
+
+SEARCH_TERM_INSERT_CHUNK = _insert_chunk_from_env()
+
+
+# Search term summary categories. Rendered with inline literals so PostgreSQL
+# can match them against the partial ix_stp_top_* indexes, which serve each
+# top-N list as an ordered index scan (bound parameters would not match).
+_ZERO = literal_column("0")
+STP_CONVERTING = SearchTermPerformance.purchases > _ZERO
+STP_NON_CONVERTING = and_(
+    SearchTermPerformance.clicks > _ZERO,
+    func.coalesce(SearchTermPerformance.purchases, _ZERO) == _ZERO,
+)
+STP_HIGH_ACOS = and_(
+    SearchTermPerformance.acos > literal_column("50"),
+    SearchTermPerformance.cost > _ZERO,
+)
+
+
+# Bounded repr for logging API responses without serialising all of them.
+_LOG_REPR = reprlib.Repr()
+_LOG_REPR.maxlevel = 4
+_LOG_REPR.maxdict = 10
+_LOG_REPR.maxlist = 10
+_LOG_REPR.maxstring = 200
+_LOG_REPR.maxother = 200
+
+
+def _truncated_repr(obj, limit: int = 1000) -> str:
+    return _LOG_REPR.repr(obj)[:limit]
+
+
+def _str_id(val) -> Optional[str]:
+    """Amazon returns IDs as integers; the model stores strings."""
+    return str(val) if val is not None else None
+
+
+def _build_mappings(
+    rows: list[dict],
+    credential_id: uuid.UUID,
+    profile_id: Optional[str],
+    start_date: str,
+    end_date: str,
+    ad_product: str,
+) -> list[dict]:
+    """Coerce raw report rows into SearchTermPerformance insert mappings."""
+    synced_at = utcnow()
+    mappings = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+
+        search_term = row.get("searchTerm") or row.get("search_term") or ""
+        if not search_term:
+            continue
+
+        cost = float(row.get("cost") or row.get("spend") or 0)
+        clicks = int(row.get("clicks") or 0)
+        impressions = int(row.get("impressions") or 0)
+        purchases = int(
+            row.get("purchases7d") or row.get("purchases14d")
+            or row.get("purchases") or row.get("orders") or 0
+        )
+        sales = float(
+            row.get("sales7d") or row.get("sales14d")
+            or row.get("sales") or 0
+        )
+        units = int(
+            row.get("unitsSoldClicks7d") or row.get("unitsSoldClicks14d")
+            or row.get("units_sold") or 0
+        )
+
+        acos = round(cost / sales * 100, 2) if sales > 0 else None
+        roas = round(sales / cost, 2) if cost > 0 else None
+        ctr = round(clicks / impressions * 100, 2) if impressions > 0 else None
+        cpc = round(cost / clicks, 2) if clicks > 0 else None
+
+        row_date = row.get("date")
+        if isinstance(row_date, str) and row_date.strip():
+            stored_date = row_date.strip()
+            row_time_unit = "DAILY"
+        else:
+            # Range-aggregate row — keep date as the range end so
+            # date-bound queries still find it; flag with time_unit so
+            # readers can filter daily vs aggregate explicitly.
+            stored_date = end_date
+            row_time_unit = "SUMMARY"
+
+        mappings.append({
+            "id": uuid.uuid4(),
+            "credential_id": credential_id,
+            "profile_id": profile_id,
+            "search_term": search_term,
+            "keyword": row.get("keyword") or row.get("targeting"),
+            "keyword_id": _str_id(row.get("keywordId") or row.get("keyword_id")),
+            "keyword_type": row.get("keywordType") or row.get("keyword_type"),
+            "match_type": row.get("matchType") or row.get("match_type"),
+            "targeting": row.get("targeting"),
+            "amazon_campaign_id": _str_id(row.get("campaignId") or row.get("campaign_id")),
+            "campaign_name": row.get("campaignName") or row.get("campaign_name"),
+            "amazon_ad_group_id": _str_id(row.get("adGroupId") or row.get("ad_group_id")),
+            "ad_group_name": row.get("adGroupName") or row.get("ad_group_name"),
+            "date": stored_date,
+            "time_unit": row_time_unit,
+            "impressions": impressions,
+            "clicks": clicks,
+            "cost": cost,
+            "ctr": ctr,
+            "cpc": cpc,
+            "purchases": purchases,
+            "sales": sales,
+            "units_sold": units,
+            "acos": acos,
+            "roas": roas,
+            "ad_product": ad_product,
+            "report_date_start": start_date,
+            "report_date_end": end_date,
+            "synced_at": synced_at,
+        })
+    return mappings
 
 
 class SearchTermService:
@@ -85,17 +233,9 @@ class SearchTermService:
                     check = await self.client.retrieve_report_v3(pending_report_id)
                     status = self.client._get_report_status(check)
                     if status == "COMPLETED":
-                        rows = await self._download_report_data(check)
-                        if rows is not None:
-                            try:
-                                stored = await self._store_rows(
-                                    db, credential_id, rows, start_date, end_date, ad_product, profile_id
-                                )
-                                return {"status": "completed", "rows_stored": stored}
-                            except Exception as store_err:
-                                logger.error(f"Failed to store search term rows: {store_err}")
-                                await db.rollback()
-                                return {"status": "error", "message": f"Downloaded {len(rows)} rows but failed to store: {str(store_err)[:200]}"}
+                        return await self._download_and_store(
+                            db, credential_id, check, start_date, end_date, ad_product, profile_id
+                        )
                     elif status in ("PENDING", "PROCESSING"):
                         report_ids = [pending_report_id]
                 except Exception as e:
@@ -115,8 +255,9 @@ class SearchTermService:
                     advertiser_account_id=self.advertiser_account_id,
                     time_unit="SUMMARY",
                 )
-                logger.info(f"Search term report create response: {json.dumps(result, default=str)[:1000]}")
-                report_ids = self._extract_report_ids(result)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Search term report create response: %s", _truncated_repr(result))
+                report_ids = ReportingService.extract_report_ids(result)
                 logger.info(f"Search term report IDs: {report_ids}")
 
             if not report_ids:
@@ -124,24 +265,13 @@ class SearchTermService:
 
             # Phase 3: Poll for completion using v3 API
             report_id = report_ids[0]
-            completed = await self._poll_report_v3(
-                report_id, max_wait, interval=SEARCH_TERM_REPORT_POLL_INTERVAL_SEC
-            )
+            completed = await self._poll_report_v3(report_id, max_wait)
 
             status = self.client._get_report_status(completed)
             if status == "COMPLETED":
-                rows = await self._download_report_data(completed)
-                if rows is not None:
-                    try:
-                        stored = await self._store_rows(
-                            db, credential_id, rows, start_date, end_date, ad_product, profile_id
-                        )
-                        return {"status": "completed", "rows_stored": stored}
-                    except Exception as store_err:
-                        logger.error(f"Failed to store search term rows: {store_err}")
-                        await db.rollback()
-                        return {"status": "error", "message": f"Downloaded {len(rows)} rows but failed to store: {str(store_err)[:200]}"}
-                return {"status": "completed", "rows_stored": 0, "message": "Report completed but no data"}
+                return await self._download_and_store(
+                    db, credential_id, completed, start_date, end_date, ad_product, profile_id
+                )
 
             # Still pending — return ID for later
             logger.info(f"Search term report still {status} after polling")
@@ -162,31 +292,93 @@ class SearchTermService:
     async def _poll_report_v3(
         self,
         report_id: str,
-        max_wait: int = SEARCH_TERM_REPORT_POLL_MAX_WAIT_SEC,
-        interval: int = SEARCH_TERM_REPORT_POLL_INTERVAL_SEC,
+        max_wait: float = SEARCH_TERM_REPORT_POLL_MAX_WAIT_SEC,
+        interval: float = SEARCH_TERM_REPORT_POLL_INITIAL_SEC,
+        max_interval: float = SEARCH_TERM_REPORT_POLL_MAX_INTERVAL_SEC,
     ) -> dict:
-        """Poll for search term report completion using v3 API."""
-        import asyncio
-        elapsed = 0
-        last_result = {}
-
-        while elapsed < max_wait:
-            await asyncio.sleep(interval)
-            elapsed += interval
+        """Poll for search term report completion using v3 API, backing off between checks."""
+        elapsed = 0.0
+        delay = interval
 
+        while True:
             result = await self.client.retrieve_report_v3(report_id)
-            last_result = result
             status = self.client._get_report_status(result)
-            logger.info(f"Search term report poll ({elapsed}s): status={status}")
+            logger.info(f"Search term report poll ({elapsed:.1f}s): status={status}")
 
             if status == "COMPLETED":
                 return result
             elif status in ("FAILED", "CANCELLED"):
                 logger.warning(f"Search term report ended with status: {status}")
                 return result
+            if elapsed >= max_wait:
+                break
+
+            wait = min(delay, max_wait - elapsed)
+            await asyncio.sleep(wait)
+            elapsed += wait
+            delay = min(delay * SEARCH_TERM_REPORT_POLL_BACKOFF, max_interval)
 
         logger.warning(f"Search term report polling timed out after {max_wait}s")
-        return last_result
+        return result
+
+    async def _download_and_store(
+        self,
+        db: AsyncSession,
+        credential_id: uuid.UUID,
+        report_response: dict,
+        start_date: str,
+        end_date: str,
+        ad_product: str,
+        profile_id: Optional[str] = None,
+    ) -> dict:
+        """
+        Download a completed report and store its rows, inserting each part
+        while others download. A producer task fetches parts onto a queue;
+        this coroutine drains it into the database, so the sync takes
+        roughly max(download, insert) rather than their sum.
+        """
+        urls = self._report_part_urls(report_response)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def fetch(http, url, limit):
+            async with limit:
+                try:
+                    rows = await fetch_report_part(http, url, SEARCH_TERM_ROW_KEYS)
+                except Exception as e:
+                    logger.warning(f"Failed to download report part: {e}")
+                    return
+            logger.info(f"Downloaded search term report part: {len(rows)} rows")
+            queue.put_nowait(rows)
+
+        async def produce():
+            # Parts download concurrently over the shared report client and
+            # are queued in completion order.
+            limit = asyncio.Semaphore(SEARCH_TERM_PART_CONCURRENCY)
+            try:
+                http = report_http()
+                await asyncio.gather(*(fetch(http, url, limit) for url in urls))
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        downloaded = 0
+        stored = 0
+        try:
+            await self._clear_stored_rows(db, credential_id, start_date, end_date, ad_product, profile_id)
+            while (rows := await queue.get()) is not None:
+                downloaded += len(rows)
+                stored += await self._insert_rows(
+                    db, credential_id, rows, start_date, end_date, ad_product, profile_id
+                )
+        except Exception as store_err:
+            logger.error(f"Failed to store search term rows: {store_err}")
+            await db.rollback()
+            return {"status": "error", "message": f"Downloaded {downloaded} rows but failed to store: {str(store_err)[:200]}"}
+        finally:
+            producer.cancel()
+
+        logger.info(f"Stored {stored} search term rows for {start_date}–{end_date}")
+        return {"status": "completed", "rows_stored": stored}
 
     async def _store_rows(
         self,
@@ -198,7 +390,24 @@ class SearchTermService:
         ad_product: str,
         profile_id: Optional[str] = None,
     ) -> int:
-        """Parse and upsert search term rows into the database."""
+        """Replace the stored rows for this report range with ``rows``."""
+        await self._clear_stored_rows(db, credential_id, start_date, end_date, ad_product, profile_id)
+        stored = await self._insert_rows(
+            db, credential_id, rows, start_date, end_date, ad_product, profile_id
+        )
+        logger.info(f"Stored {stored} search term rows for {start_date}–{end_date}")
+        return stored
+
+    @staticmethod
+    async def _clear_stored_rows(
+        db: AsyncSession,
+        credential_id: uuid.UUID,
+        start_date: str,
+        end_date: str,
+        ad_product: str,
+        profile_id: Optional[str] = None,
+    ) -> None:
+        """Delete rows from an earlier sync of the same report range."""
         # Clear existing data for this credential + profile + date range + ad product
         # to avoid duplicates on re-sync
         delete_conds = [
@@ -211,170 +420,59 @@ class SearchTermService:
             delete_conds.append(SearchTermPerformance.profile_id == profile_id)
         else:
             delete_conds.append(SearchTermPerformance.profile_id.is_(None))
-        await db.execute(delete(SearchTermPerformance).where(and_(*delete_conds)))
-
-        stored = 0
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
+        # Rows are written with Core inserts and never loaded into the
+        # session, so there is nothing for the ORM to synchronise.
+        await db.execute(
+            delete(SearchTermPerformance)
+            .where(and_(*delete_conds))
+            .execution_options(synchronize_session=False)
+        )
 
-            search_term = row.get("searchTerm") or row.get("search_term") or ""
-            if not search_term:
-                continue
+    @staticmethod
+    async def _insert_rows(
+        db: AsyncSession,
+        credential_id: uuid.UUID,
+        rows: list[dict],
+        start_date: str,
+        end_date: str,
+        ad_product: str,
+        profile_id: Optional[str] = None,
+    ) -> int:
+        """Parse report rows and insert them; returns how many were stored."""
+        # Row coercion is pure Python; keep it off the event loop.
+        mappings = await asyncio.to_thread(
+            _build_mappings, rows, credential_id, profile_id, start_date, end_date, ad_product
+        )
 
-            cost = float(row.get("cost") or row.get("spend") or 0)
-            clicks = int(row.get("clicks") or 0)
-            impressions = int(row.get("impressions") or 0)
-            purchases = int(
-                row.get("purchases7d") or row.get("purchases14d")
-                or row.get("purchases") or row.get("orders") or 0
-            )
-            sales = float(
-                row.get("sales7d") or row.get("sales14d")
-                or row.get("sales") or 0
-            )
-            units = int(
-                row.get("unitsSoldClicks7d") or row.get("unitsSoldClicks14d")
-                or row.get("units_sold") or 0
-            )
-
-            acos = round(cost / sales * 100, 2) if sales > 0 else None
-            roas = round(sales / cost, 2) if cost > 0 else None
-            ctr = round(clicks / impressions * 100, 2) if impressions > 0 else None
-            cpc = round(cost / clicks, 2) if clicks > 0 else None
-
-            # Amazon returns IDs as integers; model expects strings
-            def _str(val):
-                return str(val) if val is not None else None
-
-            row_date = row.get("date")
-            if isinstance(row_date, str) and row_date.strip():
-                stored_date = row_date.strip()
-                row_time_unit = "DAILY"
-            else:
-                # Range-aggregate row — keep date as the range end so
-                # date-bound queries still find it; flag with time_unit so
-                # readers can filter daily vs aggregate explicitly.
-                stored_date = end_date
-                row_time_unit = "SUMMARY"
-
-            stp = SearchTermPerformance(
-                credential_id=credential_id,
-                profile_id=profile_id,
-                search_term=search_term,
-                keyword=row.get("keyword") or row.get("targeting"),
-                keyword_id=_str(row.get("keywordId") or row.get("keyword_id")),
-                keyword_type=row.get("keywordType") or row.get("keyword_type"),
-                match_type=row.get("matchType") or row.get("match_type"),
-                targeting=row.get("targeting"),
-                amazon_campaign_id=_str(row.get("campaignId") or row.get("campaign_id")),
-                campaign_name=row.get("campaignName") or row.get("campaign_name"),
-                amazon_ad_group_id=_str(row.get("adGroupId") or row.get("ad_group_id")),
-                ad_group_name=row.get("adGroupName") or row.get("ad_group_name"),
-                date=stored_date,
-                time_unit=row_time_unit,
-                impressions=impressions,
-                clicks=clicks,
-                cost=cost,
-                ctr=ctr,
-                cpc=cpc,
-                purchases=purchases,
-                sales=sales,
-                units_sold=units,
-                acos=acos,
-                roas=roas,
-                ad_product=ad_product,
-                report_date_start=start_date,
-                report_date_end=end_date,
-            )
-            db.add(stp)
-            stored += 1
-
-        await db.flush()
-        logger.info(f"Stored {stored} search term rows for {start_date}–{end_date}")
-        return stored
+        # One INSERT executed over each batch (executemany): the statement
+        # compiles once and is cached, no RETURNING is requested, and no ORM
+        # instances are built or tracked.
+        stmt = insert(SearchTermPerformance)
+        for i in range(0, len(mappings), SEARCH_TERM_INSERT_CHUNK):
+            await db.execute(stmt, mappings[i:i + SEARCH_TERM_INSERT_CHUNK])
+        return len(mappings)
 
     @staticmethod
-    async def _download_report_data(report_response: dict) -> Optional[list]:
-        """Download and decompress report data from completed report S3 URLs."""
-        all_rows = []
+    def _report_part_urls(report_response: dict) -> list[str]:
+        """Download URLs of every completed report in the response."""
+        urls = []
         if not isinstance(report_response, dict):
-            return all_rows
+            return urls
 
-        for entry in report_response.get("success", []):
-            if not isinstance(entry, dict):
-                continue
-            report = entry.get("report", {})
-            if not isinstance(report, dict):
-                continue
-            if report.get("status") != "COMPLETED":
+        for entry in report_response.get("success") or ():
+            report = entry.get("report") if isinstance(entry, dict) else None
+            if not isinstance(report, dict) or report.get("status") != "COMPLETED":
                 continue
 
-            # Collect download URLs — v3 API uses 'url' at report level,
-            # MCP uses 'completedReportParts' array
-            urls = []
-            if report.get("url"):
-                urls.append(report["url"])
-            for part in report.get("completedReportParts", []):
-                if isinstance(part, dict) and part.get("url"):
-                    urls.append(part["url"])
-
-            for url in urls:
-                try:
-                    async with httpx.AsyncClient(timeout=60.0) as http:
-                        resp = await http.get(url)
-                        resp.raise_for_status()
-
-                    # Decompress
-                    try:
-                        data = gzip.decompress(resp.content)
-                        text = data.decode("utf-8")
-                    except Exception:
-                        text = resp.content.decode("utf-8")
-
-                    parsed = json.loads(text)
-                    if isinstance(parsed, list):
-                        all_rows.extend(parsed)
-                    elif isinstance(parsed, dict):
-                        for key in ("rows", "data", "searchTerms", "results"):
-                            if key in parsed and isinstance(parsed[key], list):
-                                all_rows.extend(parsed[key])
-                                break
-                        else:
-                            all_rows.append(parsed)
-
-                    logger.info(f"Downloaded search term report part: {len(all_rows)} rows so far")
-                except Exception as e:
-                    logger.warning(f"Failed to download report part: {e}")
-
-        return all_rows
-
-    @staticmethod
-    def _extract_report_ids(result: dict) -> list:
-        """Extract report IDs from MCP response."""
-        if not isinstance(result, dict):
-            return []
-
-        # Format: {"success": [{"report": {"reportId": "..."}}]}
-        for entry in result.get("success", []):
-            if isinstance(entry, dict):
-                report = entry.get("report", {})
-                if isinstance(report, dict) and "reportId" in report:
-                    return [report["reportId"]]
-
-        if "reportIds" in result:
-            return result["reportIds"]
-        if "reports" in result and isinstance(result["reports"], list):
-            ids = [
-                r["reportId"] for r in result["reports"]
-                if isinstance(r, dict) and "reportId" in r
-            ]
-            if ids:
-                return ids
-        if "reportId" in result:
-            return [result["reportId"]]
-
-        return []
+            # v3 API uses 'url' at report level, MCP uses 'completedReportParts' array
+            url = report.get("url")
+            if url:
+                urls.append(url)
+            for part in report.get("completedReportParts") or ():
+                url = part.get("url") if isinstance(part, dict) else None
+                if url:
+                    urls.append(url)
+        return urls
 
 
 async def get_search_term_summary(
@@ -391,24 +489,62 @@ async def get_search_term_summary(
     Returns categorized search terms: top by sales, non-converting, high ACOS, etc.
     Filters by profile_id when provided (multi-account credentials).
     """
-    q = select(SearchTermPerformance).where(SearchTermPerformance.credential_id == credential_id)
+    stp = SearchTermPerformance
+    conds = [stp.credential_id == credential_id]
     if profile_id is not None:
-        q = q.where(SearchTermPerformance.profile_id == profile_id)
+        conds.append(stp.profile_id == profile_id)
     else:
-        q = q.where(SearchTermPerformance.profile_id.is_(None))
+        conds.append(stp.profile_id.is_(None))
     if start_date and end_date:
-        q = q.where(SearchTermPerformance.report_date_start <= end_date)
-        q = q.where(SearchTermPerformance.report_date_end >= start_date)
-    result = await db.execute(q)
-    all_terms = result.scalars().all()
-
-    if not all_terms:
+        conds.append(stp.report_date_start <= end_date)
+        conds.append(stp.report_date_end >= start_date)
+
+    # Totals and category counts in one pass; the row lists below are
+    # ordered and limited in the database so only displayed rows load.
+    totals = (await db.execute(
+        select(
+            func.count(),
+            func.count().filter(STP_CONVERTING),
+            func.count().filter(STP_NON_CONVERTING),
+            func.count().filter(STP_HIGH_ACOS),
+            func.coalesce(func.sum(stp.cost), 0.0),
+            func.coalesce(func.sum(stp.sales), 0.0),
+            func.coalesce(func.sum(stp.clicks), 0),
+            func.coalesce(func.sum(stp.purchases), 0),
+            func.min(stp.report_date_start),
+            func.max(stp.report_date_end),
+        ).where(*conds)
+    )).one()
+    (
+        total, with_sales_count, non_converting_count, high_acos_count,
+        total_cost, total_sales, total_clicks, total_purchases,
+        date_range_start, date_range_end,
+    ) = totals
+
+    if not total:
         return {"total": 0, "has_data": False}
 
-    # Categorize
-    with_sales = [t for t in all_terms if (t.purchases or 0) > 0]
-    non_converting = [t for t in all_terms if (t.clicks or 0) > 0 and (t.purchases or 0) == 0]
-    high_acos = [t for t in all_terms if (t.acos or 0) > 50 and (t.cost or 0) > 0]
+    # Only the columns _term_dict reads; skips targeting, dates, sync metadata.
+    summary_columns = load_only(
+        stp.search_term, stp.keyword, stp.keyword_id, stp.keyword_type, stp.match_type,
+        stp.amazon_campaign_id, stp.campaign_name, stp.amazon_ad_group_id, stp.ad_group_name,
+        stp.impressions, stp.clicks, stp.cost, stp.purchases, stp.sales,
+        stp.acos, stp.roas, stp.ctr, stp.cpc,
+    )
+
+    # One AsyncSession cannot run statements concurrently, so these run in turn.
+    async def _top(extra, order, limit):
+        q = (
+            select(stp).options(summary_columns)
+            .where(*conds, *extra).order_by(order.desc().nulls_last()).limit(limit)
+        )
+        return (await db.execute(q)).scalars().all()
+
+    top_by_sales = await _top([STP_CONVERTING], stp.sales, max_results)
+    top_non_converting = await _top([STP_NON_CONVERTING], stp.cost, max_results)
+    top_high_acos = await _top([STP_HIGH_ACOS], stp.cost, 50)
+    top_by_clicks = await _top([], stp.clicks, 50)
+    shown = [*top_by_sales, *top_non_converting, *top_high_acos, *top_by_clicks]
 
     # Enrich each search-term row so the AI can emit valid mutations:
     #   - target_id + current_bid → update_target_bid (per-keyword cuts)
@@ -417,7 +553,7 @@ async def get_search_term_summary(
     #     (no matching keyword target exists).
     # Without these, the AI emits `bid: 0.0` for relative changes and the
     # action validator rejects every row. See ai_action_validator MIN_BID.
-    keyword_ids = {t.keyword_id for t in all_terms if t.keyword_id}
+    keyword_ids = {t.keyword_id for t in shown if t.keyword_id}
     target_lookup: dict[str, tuple[str, Optional[float], Optional[str]]] = {}
     if keyword_ids:
         tq = select(
@@ -432,7 +568,7 @@ async def get_search_term_summary(
         for tid, bid, state in tres.all():
             target_lookup[str(tid)] = (str(tid), bid, state)
 
-    ag_ids = {t.amazon_ad_group_id for t in all_terms if t.amazon_ad_group_id}
+    ag_ids = {t.amazon_ad_group_id for t in shown if t.amazon_ad_group_id}
     ag_lookup: dict[str, tuple[str, Optional[float]]] = {}
     if ag_ids:
         agq = select(
@@ -477,32 +613,15 @@ async def get_search_term_summary(
             "cpc": t.cpc,
         }
 
-    # Sort by relevant metrics
-    top_by_sales = sorted(with_sales, key=lambda t: t.sales or 0, reverse=True)[:max_results]
-    top_non_converting = sorted(non_converting, key=lambda t: t.cost or 0, reverse=True)[:max_results]
-    top_high_acos = sorted(high_acos, key=lambda t: t.cost or 0, reverse=True)[:50]
-    top_by_clicks = sorted(all_terms, key=lambda t: t.clicks or 0, reverse=True)[:50]
-
-    # Date range info
-    dates = [t.report_date_start for t in all_terms if t.report_date_start]
-    date_range_start = min(dates) if dates else None
-    dates_end = [t.report_date_end for t in all_terms if t.report_date_end]
-    date_range_end = max(dates_end) if dates_end else None
-
-    total_cost = sum(t.cost or 0 for t in all_terms)
-    total_sales = sum(t.sales or 0 for t in all_terms)
-    total_clicks = sum(t.clicks or 0 for t in all_terms)
-    total_purchases = sum(t.purchases or 0 for t in all_terms)
-
     return {
         "has_data": True,
-        "total": len(all_terms),
+        "total": total,
         "date_range": f"{date_range_start} to {date_range_end}" if date_range_start else None,
         "summary": {
-            "total_search_terms": len(all_terms),
-            "with_sales": len(with_sales),
-            "non_converting": len(non_converting),
-            "high_acos_count": len(high_acos),
+            "total_search_terms": total,
+            "with_sales": with_sales_count,
+            "non_converting": non_converting_count,
+            "high_acos_count": high_acos_count,
             "total_cost": total_cost,
             "total_sales": total_sales,
             "total_clicks": total_clicks,
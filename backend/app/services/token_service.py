@@ -3,12 +3,17 @@ Token Service — Automatic OAuth token refresh for Amazon Ads.
 Checks token expiry before every MCP call and refreshes if needed.
 """
 
+import asyncio
 import logging
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.http_client import SharedAsyncClient
 from app.models import Account, Credential
 from app.mcp_client import create_mcp_client, AmazonAdsMCP
 from app.crypto import decrypt_value
@@ -20,6 +25,36 @@ TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 # Refresh 5 minutes before actual expiry to avoid race conditions
 REFRESH_BUFFER = timedelta(minutes=5)
 
+TOKEN_TIMEOUT_SECONDS = 30
+
+# Refreshes all go to one host, so a kept-alive connection skips the TCP and
+# TLS handshakes a fresh client would pay on every refresh.
+_HTTP = SharedAsyncClient(
+    http2=True,
+    timeout=TOKEN_TIMEOUT_SECONDS,
+    limits=httpx.Limits(max_keepalive_connections=10),
+)
+
+
+def _http() -> httpx.AsyncClient:
+    """Return the shared LwA token client, creating it on first use."""
+    return _HTTP.get()
+
+
+async def close_http_client() -> None:
+    """Close the shared token client (called from app shutdown)."""
+    await _HTTP.aclose()
+
+
+@lru_cache(maxsize=1024)
+def _decrypt_cached(ciphertext: Optional[str]) -> Optional[str]:
+    """decrypt_value memoised on the stored ciphertext.
+
+    Fernet tokens embed a random IV, so a rotated secret is a new key and
+    needs no invalidation; stale entries simply age out of the LRU.
+    """
+    return decrypt_value(ciphertext)
+
 
 async def refresh_access_token(
     client_id: str,
@@ -30,36 +65,69 @@ async def refresh_access_token(
     Exchange a refresh token for a new access token via Amazon LwA.
     Returns dict with access_token, expires_in, token_type.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": client_id,
-                "client_secret": client_secret,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await _http().post(
+        TOKEN_URL,
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": client_id,
+            "client_secret": client_secret,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 def _make_aware(dt: datetime) -> datetime:
-    """Ensure a datetime is timezone-aware (UTC). DB may return naive datetimes."""
+    """Ensure a datetime is timezone-aware (UTC).
+
+    Migration 015 makes the column timestamptz, but a database it has not run
+    on still returns naive UTC values.
+    """
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt
 
 
+@lru_cache(maxsize=512)
+def _refresh_deadline(expires_at: datetime) -> float:
+    """Epoch seconds after which a token expiring at ``expires_at`` is refreshed.
+
+    Memoised per expiry so each check is one ``time.time()`` comparison
+    rather than building an aware ``now`` and subtracting a timedelta.
+    """
+    return (_make_aware(expires_at) - REFRESH_BUFFER).timestamp()
+
+
 def _token_is_expired(cred: Credential) -> bool:
     """Check if the access token is expired or about to expire."""
     if not cred.token_expires_at:
         # No expiry tracked — assume it might be expired, try refresh if we can
         return cred.client_secret is not None and cred.refresh_token is not None
-    expires_at = _make_aware(cred.token_expires_at)
-    return datetime.now(timezone.utc) >= (expires_at - REFRESH_BUFFER)
+    return time.time() >= _refresh_deadline(cred.token_expires_at)
+
+
+# One refresh per credential at a time. Requests that queue behind a refresh
+# adopt its result (kept here as the encrypted values) instead of calling LwA
+# again; their own session still holds the pre-refresh row until commit.
+_refresh_locks: dict[uuid.UUID, asyncio.Lock] = {}
+_recent_refresh: dict[uuid.UUID, tuple[str, datetime, str]] = {}
+
+
+def _adopt_recent_refresh(cred: Credential) -> bool:
+    """Copy a concurrent refresh's token onto ``cred`` if it is still fresh."""
+    recent = _recent_refresh.get(cred.id)
+    if recent is None:
+        return False
+    access_token, expires_at, refresh_token = recent
+    if time.time() >= _refresh_deadline(expires_at):
+        return False
+    cred.access_token = access_token
+    cred.token_expires_at = expires_at
+    cred.refresh_token = refresh_token
+    cred.status = "active"
+    return True
 
 
 async def ensure_fresh_token(cred: Credential, db: AsyncSession) -> Credential:
@@ -67,6 +135,7 @@ async def ensure_fresh_token(cred: Credential, db: AsyncSession) -> Credential:
     Check if token is expired and refresh if needed.
     Updates the credential in the database with the new token.
     Returns the credential (possibly updated).
+    Concurrent calls for one credential share a single refresh.
     """
     # Can't auto-refresh without client_secret and refresh_token
     if not cred.client_secret or not cred.refresh_token:
@@ -75,20 +144,30 @@ async def ensure_fresh_token(cred: Credential, db: AsyncSession) -> Credential:
     if not _token_is_expired(cred):
         return cred
 
+    async with _refresh_locks.setdefault(cred.id, asyncio.Lock()):
+        # Re-check: another request may have refreshed while we waited.
+        if not _token_is_expired(cred) or _adopt_recent_refresh(cred):
+            return cred
+        await _refresh_credential(cred, db)
+
+    return cred
+
+
+async def _refresh_credential(cred: Credential, db: AsyncSession) -> None:
     logger.info(f"Token expired for credential '{cred.name}', refreshing...")
 
     try:
         token_data = await refresh_access_token(
             client_id=cred.client_id,
-            client_secret=decrypt_value(cred.client_secret),
-            refresh_token=decrypt_value(cred.refresh_token),
+            client_secret=_decrypt_cached(cred.client_secret),
+            refresh_token=_decrypt_cached(cred.refresh_token),
         )
 
         # Update credential with new token (encrypted)
         from app.crypto import encrypt_value as _encrypt
         cred.access_token = _encrypt(token_data["access_token"])
         expires_in = token_data.get("expires_in", 3600)
-        cred.token_expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=expires_in)
+        cred.token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
         cred.status = "active"
         cred.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
@@ -97,6 +176,7 @@ async def ensure_fresh_token(cred: Credential, db: AsyncSession) -> Credential:
             cred.refresh_token = _encrypt(token_data["refresh_token"])
 
         await db.flush()
+        _recent_refresh[cred.id] = (cred.access_token, cred.token_expires_at, cred.refresh_token)
         logger.info(f"Token refreshed for '{cred.name}', expires in {expires_in}s")
 
     except httpx.HTTPStatusError as e:
@@ -106,8 +186,6 @@ async def ensure_fresh_token(cred: Credential, db: AsyncSession) -> Credential:
     except Exception as e:
         logger.error(f"Token refresh failed for '{cred.name}': {e}")
 
-    return cred
-
 
 async def get_mcp_client_with_fresh_token(
     cred: Credential,
@@ -124,7 +202,7 @@ async def get_mcp_client_with_fresh_token(
     profile_id = profile_id_override if profile_id_override is not None else cred.profile_id
     client = create_mcp_client(
         client_id=cred.client_id,
-        access_token=decrypt_value(cred.access_token),
+        access_token=_decrypt_cached(cred.access_token),
         region=cred.region,
         profile_id=profile_id,
         account_id=cred.account_id,
@@ -2,9 +2,11 @@
 
 import logging
 import re
+import time
 from typing import Any, Optional
 import uuid as uuid_mod
-from datetime import date, datetime, timezone
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from fastapi import HTTPException
@@ -104,12 +106,20 @@ def marketplace_today(
     return marketplace_now(marketplace, region).date()
 
 
+@lru_cache(maxsize=2048)
+def _parse_uuid_cached(value: str) -> uuid_mod.UUID:
+    # Path params repeat the same few account/campaign ids; UUIDs are immutable.
+    return uuid_mod.UUID(value)
+
+
 def parse_uuid(value: str, field_name: str = "id") -> uuid_mod.UUID:
     """
     Parse a string as UUID, raising a 400 HTTPException on invalid input
     instead of letting a bare ValueError bubble up as a 500.
     """
     try:
+        if isinstance(value, str):
+            return _parse_uuid_cached(value)
         return uuid_mod.UUID(value)
     except (ValueError, AttributeError):
         raise HTTPException(
@@ -123,17 +133,22 @@ def safe_error_detail(exc: Exception, fallback: str = "An internal error occurre
     Return a sanitized error message safe for client consumption.
     Logs the real exception detail server-side.
     """
-    logger.error(f"Operation failed: {exc}", exc_info=True)
+    logger.error("Operation failed: %s", exc, exc_info=True)
     return fallback
 
 
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
 def utcnow() -> datetime:
     """
     Return the current UTC time as a naive datetime (no tzinfo).
     Replaces the deprecated ``datetime.utcnow()``.
     Naive datetimes are used because our DB columns are TIMESTAMP WITHOUT TIME ZONE.
     """
-    return datetime.now(timezone.utc).replace(tzinfo=None)
+    # Built from the epoch offset: one datetime allocation and no tzinfo
+    # round-trip, without the deprecated ``utcfromtimestamp``.
+    return _NAIVE_EPOCH + timedelta(seconds=time.time())
 
 
 def normalize_amazon_date(value: Optional[str]) -> Optional[str]:
@@ -189,6 +204,44 @@ def normalize_mcp_tool_name(tool_name: str) -> str:
     return tool
 
 
+# Keys MCP list tools use for their row array, in lookup order.
+MCP_LIST_KEYS: tuple[str, ...] = ("targets", "result", "results", "items")
+
+
+def first_list(data: Any, keys: tuple[str, ...] = MCP_LIST_KEYS) -> list:
+    """Return ``data`` if it is a list, else the first list found under ``keys``."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in keys:
+            value = data.get(key)
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def first_present(row: dict, keys: tuple[str, ...], default: Any = None) -> Any:
+    """First value under ``keys`` that is not None (a real 0 or "" is kept).
+
+    For metrics, where a legitimate 0 must not fall through to a
+    differently-defined fallback field (e.g. ``spend`` 0 vs ``cost``).
+    """
+    for key in keys:
+        value = row.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def first_truthy(row: dict, keys: tuple[str, ...], default: Any = None) -> Any:
+    """Same result as ``row.get(k1) or row.get(k2) or ... or default``."""
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return value
+    return default
+
+
 def _to_float(value: Any) -> Any:
     """Best-effort currency/number parsing."""
     if isinstance(value, (int, float)):
@@ -481,15 +534,96 @@ def build_mcp_fallback_call(
     return None
 
 
-def _is_keyword_like(s: str) -> bool:
-    """True if string looks like keyword text, not an ID."""
-    if not s or not isinstance(s, str) or len(s) > 200:
+# Target fields that may hold keyword text, checked on the target itself
+# (falling back to targetDetails) and on each targetDetails entry.
+_DIRECT_KEYS = ("keywordText", "keyword", "expression", "text", "value", "targetingClause")
+_DETAIL_KEYS = ("keyword", "expression", "value", "theme", "asin", "productCategoryId")
+
+
+@lru_cache(maxsize=4096)
+def _keyword_like(s: str) -> bool:
+    if not s or len(s) > 200:
         return False
-    if s.isdigit() or (len(s) > 10 and s.replace("-", "").replace("_", "").isdigit()):
+    # Separated IDs never start with a letter, while keyword text usually
+    # does, so the two replace() copies are only made for plausible IDs.
+    if s.isdigit() or (
+        len(s) > 10 and not s[0].isalpha() and s.replace("-", "").replace("_", "").isdigit()
+    ):
         return False
     return True
 
 
+def _is_keyword_like(s: str) -> bool:
+    """True if string looks like keyword text, not an ID."""
+    # Non-strings are rejected before the memoised check so they never
+    # occupy cache slots (or fail to hash).
+    return isinstance(s, str) and _keyword_like(s)
+
+
+def _product_target_label(detail: dict) -> Optional[str]:
+    # productTarget: product.productId (ASIN) nested — MCP format
+    product = detail.get("product")
+    if isinstance(product, dict):
+        pid = product.get("productId") or product.get("product_id")
+        ptype = (product.get("productIdType") or product.get("product_id_type") or "").upper()
+        pid_str = str(pid) if pid else ""
+        if _is_keyword_like(pid_str):
+            return f"ASIN: {pid_str}" if ptype == "ASIN" else pid_str
+    if detail.get("matchType"):
+        return f"Product: {detail['matchType']}"
+    return None
+
+
+def _theme_target_label(detail: dict) -> Optional[str]:
+    # themeTarget has matchType (e.g. KEYWORDS_CLOSE_MATCH) — use as fallback label
+    if detail.get("matchType"):
+        return f"Theme: {detail['matchType']}"
+    return None
+
+
+def _category_target_label(detail: dict) -> Optional[str]:
+    # productCategoryTarget: productCategoryRefinement.productCategoryRefinement.productCategoryId (nested)
+    cat_id = _extract_product_category_id(detail)
+    if cat_id:
+        return f"Category: {cat_id}"
+    if detail.get("matchType"):
+        return f"Category: {detail['matchType']}"
+    return None
+
+
+# Type-specific labels for targetDetails entries, tried after the common keys.
+_TARGET_DETAIL_LABELS = {
+    "productTarget": _product_target_label,
+    "themeTarget": _theme_target_label,
+    "productCategoryTarget": _category_target_label,
+}
+
+
+def _expressions_label(tgt_data: dict, target_details: dict) -> Optional[str]:
+    """Join expression/expressions arrays into a readable label."""
+    expressions = tgt_data.get("expressions") or tgt_data.get("expression") or target_details.get("expression")
+    if isinstance(expressions, list):
+        parts = []
+        for ex in expressions:
+            if isinstance(ex, dict):
+                val = ex.get("value") or ex.get("targeting")
+                if isinstance(val, dict):
+                    val = val.get("value")
+                val = str(val) if val else ""
+                if _is_keyword_like(val):
+                    parts.append(val)
+            elif ex:
+                ex = str(ex)
+                if _is_keyword_like(ex):
+                    parts.append(ex)
+        if parts:
+            return " | ".join(parts)
+    expr = tgt_data.get("expression") or target_details.get("expression")
+    if isinstance(expr, list) and expr:
+        return str(expr[0]) if len(expr) == 1 else " | ".join(str(x) for x in expr)
+    return None
+
+
 def extract_target_expression(tgt_data: dict) -> Optional[str]:
     """
     Extract human-readable keyword/expression from Amazon Ads target data.
@@ -497,8 +631,9 @@ def extract_target_expression(tgt_data: dict) -> Optional[str]:
     """
     if not tgt_data or not isinstance(tgt_data, dict):
         return None
-    if "target" in tgt_data and isinstance(tgt_data["target"], dict):
-        tgt_data = tgt_data["target"]
+    inner = tgt_data.get("target")
+    if isinstance(inner, dict):
+        tgt_data = inner
     target_details = tgt_data.get("targetDetails") or {}
 
     # Structured keyword targets (incl. negative): keyword may be numeric-only;
@@ -512,71 +647,40 @@ def extract_target_expression(tgt_data: dict) -> Optional[str]:
                 return s
 
     # Direct fields
-    for key in ("keywordText", "keyword", "expression", "text", "value", "targetingClause"):
-        val = tgt_data.get(key) or target_details.get(key)
+    tgt_get = tgt_data.get
+    details_get = target_details.get
+    for key in _DIRECT_KEYS:
+        val = tgt_get(key) or details_get(key)
         if val and isinstance(val, str) and _is_keyword_like(val):
             return val
 
+    # Flat (pre-MCP) targets: only the expression arrays can still match.
+    if not target_details:
+        return _expressions_label(tgt_data, target_details)
+
     # MCP targetDetails: keywordTarget, themeTarget, productTarget, productCategoryTarget, etc.
+    # This single pass also covers nested keywordTarget.keyword / productTarget.asin,
+    # since _DETAIL_KEYS is checked on every dict entry.
     for detail_key, detail_val in target_details.items():
         if not isinstance(detail_val, dict):
             continue
-        for k in ("keyword", "expression", "value", "theme", "asin", "productCategoryId"):
+        for k in _DETAIL_KEYS:
             v = detail_val.get(k)
             if v and isinstance(v, str) and _is_keyword_like(v):
                 return v
-        # productTarget: product.productId (ASIN) nested — MCP format
-        if detail_key == "productTarget":
-            product = detail_val.get("product")
-            if isinstance(product, dict):
-                pid = product.get("productId") or product.get("product_id")
-                ptype = (product.get("productIdType") or product.get("product_id_type") or "").upper()
-                if pid and _is_keyword_like(str(pid)):
-                    return f"ASIN: {pid}" if ptype == "ASIN" else str(pid)
-            if detail_val.get("matchType"):
-                return f"Product: {detail_val['matchType']}"
-        # themeTarget has matchType (e.g. KEYWORDS_CLOSE_MATCH) — use as fallback label
-        if detail_key == "themeTarget" and detail_val.get("matchType"):
-            return f"Theme: {detail_val['matchType']}"
-        # productCategoryTarget: productCategoryRefinement.productCategoryRefinement.productCategoryId (nested)
-        if detail_key == "productCategoryTarget":
-            cat_id = _extract_product_category_id(detail_val)
-            if cat_id:
-                return f"Category: {cat_id}"
-            if detail_val.get("matchType"):
-                return f"Category: {detail_val['matchType']}"
+        label = _TARGET_DETAIL_LABELS.get(detail_key)
+        if label is not None:
+            found = label(detail_val)
+            if found:
+                return found
         # productTarget / category may have resolvedExpression
         resolved = detail_val.get("resolvedExpression") or detail_val.get("productCategoryResolved")
         if resolved and isinstance(resolved, str):
             return resolved
 
-    # Nested keywordTarget.keyword, productTarget.asin
-    for nest in ("keywordTarget", "productTarget", "targeting"):
-        nested = target_details.get(nest)
-        if isinstance(nested, dict):
-            for k in ("keyword", "expression", "value", "asin"):
-                v = nested.get(k)
-                if v and isinstance(v, str) and _is_keyword_like(v):
-                    return v
-
-    # expression/expressions arrays
-    expressions = tgt_data.get("expressions") or tgt_data.get("expression") or target_details.get("expression")
-    if isinstance(expressions, list):
-        parts = []
-        for ex in expressions:
-            if isinstance(ex, dict):
-                val = ex.get("value") or ex.get("targeting")
-                if isinstance(val, dict):
-                    val = val.get("value")
-                if val and _is_keyword_like(str(val)):
-                    parts.append(str(val))
-            elif ex and _is_keyword_like(str(ex)):
-                parts.append(str(ex))
-        if parts:
-            return " | ".join(parts)
-    expr = tgt_data.get("expression") or target_details.get("expression")
-    if isinstance(expr, list) and expr:
-        return str(expr[0]) if len(expr) == 1 else " | ".join(str(x) for x in expr)
+    found = _expressions_label(tgt_data, target_details)
+    if found is not None:
+        return found
 
     # Resolved human-readable
     for k in ("resolvedExpression", "productCategoryResolved", "productBrandResolved"):
@@ -587,23 +691,63 @@ def extract_target_expression(tgt_data: dict) -> Optional[str]:
     return None
 
 
-def _extract_product_category_id(obj: dict, depth: int = 0) -> Optional[str]:
-    """Recursively find productCategoryId in productCategoryTarget nested structure."""
-    if not obj or not isinstance(obj, dict) or depth > 5:
-        return None
-    if "productCategoryId" in obj and obj["productCategoryId"]:
-        return str(obj["productCategoryId"])
-    for v in obj.values():
-        if isinstance(v, dict):
-            found = _extract_product_category_id(v, depth + 1)
-            if found:
-                return found
+def _extract_product_category_id(obj: dict) -> Optional[str]:
+    """Find productCategoryId in productCategoryTarget nested structure (depth-first, max depth 5)."""
+    stack = [(obj, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if not node or not isinstance(node, dict) or depth > 5:
+            continue
+        cat_id = node.get("productCategoryId")
+        if cat_id:
+            return str(cat_id)
+        # Reversed so the first value is visited first, as a recursive walk would.
+        stack.extend((v, depth + 1) for v in reversed(node.values()) if isinstance(v, dict))
     return None
 
 
+# Keys that may carry an ASIN on an ad, creative or product entry; the deep
+# scan also probes the resolved id. productAd may list them under "asins".
+_ASIN_KEYS = ("asin", "productId", "product_id")
+_ASIN_SCAN_KEYS = _ASIN_KEYS + ("resolvedProductId",)
+_PRODUCT_AD_ASIN_KEYS = ("asin", "productId", "asins")
+
+
+def _find_asin(obj: Any) -> Optional[str]:
+    """Depth-first scan (max depth 6, first element of lists) for an ASIN-like value."""
+    keys = _ASIN_SCAN_KEYS
+    stack = [(obj, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if depth > 6:
+            continue
+        if isinstance(node, dict):
+            for key in keys:
+                v = node.get(key)
+                if v:
+                    v = str(v)
+                    if _looks_like_asin(v):
+                        return v
+            stack.extend(
+                (v, depth + 1) for v in reversed(node.values()) if isinstance(v, (dict, list))
+            )
+        elif isinstance(node, list) and node:
+            stack.append((node[0], depth + 1))
+    return None
+
+
+# ASINs (and ISBN-10s used as ASINs) are ten upper-case ASCII letters/digits.
+_ASIN_RE = re.compile(r"[A-Z0-9]{10}").fullmatch
+
+
+@lru_cache(maxsize=4096)
+def _asin_like(s: str) -> bool:
+    return _ASIN_RE(s) is not None
+
+
 def _looks_like_asin(s: str) -> bool:
-    """True if string looks like an Amazon ASIN (10 alphanumeric chars)."""
-    return bool(s and isinstance(s, str) and len(s) == 10 and s.isalnum())
+    """True if string looks like an Amazon ASIN (10 upper-case alphanumeric chars)."""
+    return isinstance(s, str) and _asin_like(s)
 
 
 def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
@@ -613,10 +757,14 @@ def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
     """
     if not ad_data or not isinstance(ad_data, dict):
         return (None, None)
-    if "ad" in ad_data and isinstance(ad_data["ad"], dict):
-        ad_data = ad_data["ad"]
+    inner = ad_data.get("ad")
+    if isinstance(inner, dict):
+        ad_data = inner
     asin = ad_data.get("asin")
     sku = ad_data.get("sku")
+    # Later stages only fill in whichever of the two is still missing.
+    if asin and sku:
+        return (asin, sku)
     creative = ad_data.get("creative") or ad_data.get("productAd") or {}
     # SP product ads: productCreative → advertisedProduct (SKU + resolved ASIN)
     prod_creative = creative.get("productCreative")
@@ -626,8 +774,9 @@ def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
         if isinstance(adv, dict):
             rid = adv.get("resolvedProductId")
             rtype = (adv.get("resolvedProductIdType") or "").upper()
-            if rid and (rtype == "ASIN" or _looks_like_asin(str(rid))):
-                asin = asin or str(rid)
+            rid = str(rid) if rid else ""
+            if rid and (rtype == "ASIN" or _looks_like_asin(rid)):
+                asin = asin or rid
             pid = adv.get("productId")
             ptype = (adv.get("productIdType") or "").upper()
             if pid:
@@ -641,14 +790,20 @@ def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
                         asin = pid_str
                     else:
                         sku = pid_str
+        if asin and sku:
+            return (asin, sku)
     # Top-level productId (some MCP formats)
-    if not asin and _looks_like_asin(str(ad_data.get("productId", ""))):
-        asin = str(ad_data["productId"])
+    if not asin:
+        pid_str = str(ad_data.get("productId", ""))
+        if _looks_like_asin(pid_str):
+            asin = pid_str
     # creative.asin, creative.productId
     if not asin and creative.get("asin"):
         asin = creative.get("asin")
-    if not asin and _looks_like_asin(str(creative.get("productId", ""))):
-        asin = str(creative["productId"])
+    if not asin:
+        pid_str = str(creative.get("productId", ""))
+        if _looks_like_asin(pid_str):
+            asin = pid_str
     # creative.asins (SB - array)
     asins = creative.get("asins")
     if isinstance(asins, list) and asins and not asin:
@@ -670,14 +825,21 @@ def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
                 sku = sku or pid
             elif not asin and not sku:
                 asin = pid
+            if asin and sku:
+                break
+    # Every remaining stage only looks for a missing ASIN.
+    if asin:
+        return (asin, sku)
     # Fallback: scan creative for any ASIN-like value (handles unknown MCP nesting)
     if not asin and not sku:
-        for key in ("asin", "productId", "product_id"):
+        for key in _ASIN_KEYS:
             for obj in (creative, ad_data):
                 v = obj.get(key) if isinstance(obj, dict) else None
-                if v and _looks_like_asin(str(v)):
-                    asin = str(v)
-                    break
+                if v:
+                    v = str(v)
+                    if _looks_like_asin(v):
+                        asin = v
+                        break
             if asin:
                 break
     # Deep scan: creative.products[].productId, creative.product.asin, etc.
@@ -690,11 +852,13 @@ def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
             for item in container:
                 if not isinstance(item, dict):
                     continue
-                for k in ("asin", "productId", "product_id"):
+                for k in _ASIN_KEYS:
                     v = item.get(k)
-                    if v and _looks_like_asin(str(v)):
-                        asin = asin or str(v)
-                        break
+                    if v:
+                        v = str(v)
+                        if _looks_like_asin(v):
+                            asin = asin or v
+                            break
                 if asin:
                     break
             if asin:
@@ -702,32 +866,17 @@ def extract_ad_asin_sku(ad_data: dict) -> tuple[Optional[str], Optional[str]]:
     # productAd at top level (some MCP formats)
     product_ad = ad_data.get("productAd")
     if isinstance(product_ad, dict) and not asin:
-        for k in ("asin", "productId", "asins"):
+        for k in _PRODUCT_AD_ASIN_KEYS:
             v = product_ad.get(k)
             if isinstance(v, list) and v:
                 v = v[0]
-            if v and _looks_like_asin(str(v)):
-                asin = str(v)
-                break
+            if v:
+                v = str(v)
+                if _looks_like_asin(v):
+                    asin = v
+                    break
     # Recursive scan for ASIN-like values (handles unknown MCP nesting)
     if not asin and not sku:
-
-        def _find_asin(obj, depth: int = 0) -> Optional[str]:
-            if depth > 6:
-                return None
-            if isinstance(obj, dict):
-                for key in ("asin", "productId", "product_id", "resolvedProductId"):
-                    v = obj.get(key)
-                    if v and _looks_like_asin(str(v)):
-                        return str(v)
-                for v in obj.values():
-                    found = _find_asin(v, depth + 1)
-                    if found:
-                        return found
-            elif isinstance(obj, list) and obj:
-                return _find_asin(obj[0], depth + 1)
-            return None
-
         asin = _find_asin(ad_data)
     return (asin, sku)
 
@@ -739,8 +888,9 @@ def extract_ad_display_name(ad_data: dict, asin: Optional[str] = None, sku: Opti
     """
     if not ad_data or not isinstance(ad_data, dict):
         return None
-    if "ad" in ad_data and isinstance(ad_data["ad"], dict):
-        ad_data = ad_data["ad"]
+    inner = ad_data.get("ad")
+    if isinstance(inner, dict):
+        ad_data = inner
     name = ad_data.get("name") or ad_data.get("adName")
     if name and _is_keyword_like(str(name)):
         return str(name)
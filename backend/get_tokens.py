@@ -45,55 +45,40 @@ AUTH_URL = (
 TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 
 
-def exchange_code(auth_code: str) -> dict:
-    """Exchange authorization code for access + refresh tokens."""
-    data = urllib.parse.urlencode({
-        "grant_type": "authorization_code",
-        "code": auth_code,
-        "redirect_uri": REDIRECT_URI,
-        "client_id": CLIENT_ID,
-        "client_secret": CLIENT_SECRET,
-    }).encode()
-
-    req = urllib.request.Request(
-        TOKEN_URL,
-        data=data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-    )
+# Form fields shared by every token request; only the grant varies per call.
+_CLIENT_FORM = (("client_id", CLIENT_ID), ("client_secret", CLIENT_SECRET))
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def _request_tokens(grant: tuple) -> dict:
+    """POST a grant (plus client credentials) to the LwA token endpoint."""
+    data = urllib.parse.urlencode(grant + _CLIENT_FORM).encode()
+    req = urllib.request.Request(TOKEN_URL, data=data, headers=_FORM_HEADERS)
 
     try:
         with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode())
-            return result
+            return json.loads(response.read())
     except urllib.error.HTTPError as e:
         error_body = e.read().decode()
         print(f"\nError {e.code}: {error_body}")
         return {}
 
 
+def exchange_code(auth_code: str) -> dict:
+    """Exchange authorization code for access + refresh tokens."""
+    return _request_tokens((
+        ("grant_type", "authorization_code"),
+        ("code", auth_code),
+        ("redirect_uri", REDIRECT_URI),
+    ))
+
+
 def refresh_access_token(refresh_token: str) -> dict:
     """Use refresh token to get a new access token."""
-    data = urllib.parse.urlencode({
-        "grant_type": "refresh_token",
-        "refresh_token": refresh_token,
-        "client_id": CLIENT_ID,
-        "client_secret": CLIENT_SECRET,
-    }).encode()
-
-    req = urllib.request.Request(
-        TOKEN_URL,
-        data=data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-    )
-
-    try:
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode())
-            return result
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
-        print(f"\nError {e.code}: {error_body}")
-        return {}
+    return _request_tokens((
+        ("grant_type", "refresh_token"),
+        ("refresh_token", refresh_token),
+    ))
 
 
 if __name__ == "__main__":
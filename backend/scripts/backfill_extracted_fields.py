@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Backfill targets.expression_value and ads.asin/sku from raw_data.
+
+Sync extracts these fields once at ingest, but rows written before the
+extractors learned the MCP payload shapes were stored without them, so the
+target and ad list endpoints re-parse raw_data for those rows on every
+request. This runs the current extractors once over those rows. Rows are
+walked in id order and each page is committed on its own, so a large table
+never holds one long transaction and an interrupted run resumes where it
+stopped.
+
+Run from backend directory:
+  python scripts/backfill_extracted_fields.py
+
+Options:
+  --batch-size N   Rows read and committed per page (default: 1000)
+  --dry-run        Count the rows that would be filled without writing
+"""
+
+import asyncio
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure backend root is on path
+backend_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_root))
+
+from sqlalchemy import bindparam, func, or_, select, update
+from app.database import make_script_engine
+from app.models import Ad, Target
+from app.utils import extract_ad_asin_sku, extract_target_expression
+
+engine = make_script_engine()
+
+DEFAULT_BATCH_SIZE = 1000
+
+_ASIN_MAX = Ad.__table__.c.asin.type.length
+_SKU_MAX = Ad.__table__.c.sku.type.length
+
+
+def _fits(value, limit: int):
+    """``value`` as a str if it fits a VARCHAR(limit) column, else None."""
+    if not value:
+        return None
+    value = str(value)
+    return value if len(value) <= limit else None
+
+
+async def _pages(conn, columns, missing, batch_size: int):
+    """Yield pages of rows matching ``missing``, walking the table by id."""
+    id_col = columns[0]
+    last_id = None
+    while True:
+        stmt = (
+            select(*columns)
+            .where(missing, columns[1].isnot(None))
+            .order_by(id_col)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            stmt = stmt.where(id_col > last_id)
+        rows = (await conn.execute(stmt)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+async def backfill_targets(batch_size: int, dry_run: bool) -> int:
+    missing = or_(Target.expression_value.is_(None), Target.expression_value == "")
+    stmt = (
+        update(Target.__table__)
+        .where(Target.__table__.c.id == bindparam("target_id"))
+        .values(expression_value=bindparam("expression"))
+    )
+    filled = 0
+    async with engine.connect() as conn:
+        async for rows in _pages(conn, (Target.id, Target.raw_data), missing, batch_size):
+            params = []
+            for row in rows:
+                expression = extract_target_expression(row.raw_data)
+                if expression:
+                    params.append({"target_id": row.id, "expression": expression})
+            if params and not dry_run:
+                await conn.execute(stmt, params)
+            await conn.commit()
+            filled += len(params)
+    return filled
+
+
+async def backfill_ads(batch_size: int, dry_run: bool) -> int:
+    missing = or_(Ad.asin.is_(None), Ad.sku.is_(None))
+    table = Ad.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("ad_id"))
+        .values(
+            asin=func.coalesce(table.c.asin, bindparam("new_asin", type_=table.c.asin.type)),
+            sku=func.coalesce(table.c.sku, bindparam("new_sku", type_=table.c.sku.type)),
+        )
+    )
+    filled = 0
+    async with engine.connect() as conn:
+        columns = (Ad.id, Ad.raw_data, Ad.asin, Ad.sku)
+        async for rows in _pages(conn, columns, missing, batch_size):
+            params = []
+            for row in rows:
+                asin, sku = extract_ad_asin_sku(row.raw_data)
+                asin, sku = _fits(asin, _ASIN_MAX), _fits(sku, _SKU_MAX)
+                if (asin and not row.asin) or (sku and not row.sku):
+                    params.append({"ad_id": row.id, "new_asin": asin, "new_sku": sku})
+            if params and not dry_run:
+                await conn.execute(stmt, params)
+            await conn.commit()
+            filled += len(params)
+    return filled
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill extracted target expressions and ad ASIN/SKU from raw_data"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows read and committed per page",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count rows that would be filled without writing",
+    )
+    args = parser.parse_args()
+
+    verb = "Would fill" if args.dry_run else "Filled"
+    targets = await backfill_targets(args.batch_size, args.dry_run)
+    print(f"  {verb} targets.expression_value: {targets} rows")
+    ads = await backfill_ads(args.batch_size, args.dry_run)
+    print(f"  {verb} ads.asin/sku: {ads} rows")
+
+
+async def _run():
+    try:
+        await main()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_run())
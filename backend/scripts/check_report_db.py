@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Diagnostic script to inspect campaign_performance_daily and account_performance_daily.
-Helps debug report data not updating issues.
+Diagnostic script to inspect campaign_performance_daily and account_performance_daily
+for the first few credentials. Helps debug report data not updating issues.
 
 Run from backend directory:
   python scripts/check_report_db.py
@@ -9,6 +9,7 @@ Run from backend directory:
 
 import asyncio
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 # Ensure backend root is on path
@@ -16,84 +17,151 @@ backend_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(backend_root))
 
 from sqlalchemy import text
-from app.database import engine
+from app.database import make_script_engine
+
+engine = make_script_engine()
+
+
+CREDENTIALS_SQL = text("SELECT id, name, profile_id FROM credentials LIMIT 5")
+
+# Each query covers every listed credential in one statement; row_number()
+# keeps the per-credential LIMIT the single-credential queries had.
+# credential_id is selected last so the printed column positions are unchanged.
+# Access paths: ix_cpd_credential_date, ix_apd_credential_date and
+# ix_reports_credential_created, each read backwards for the DESC order.
+CPD_SQL = text("""
+    SELECT date, profile_id, rows, total_spend, total_sales, credential_id
+    FROM (
+        SELECT credential_id, date, profile_id, COUNT(*) as rows,
+               SUM(spend)::numeric(12,2) as total_spend, SUM(sales)::numeric(12,2) as total_sales,
+               row_number() OVER (PARTITION BY credential_id ORDER BY date DESC) AS rn
+        FROM campaign_performance_daily
+        WHERE credential_id = ANY(:cids)
+        GROUP BY credential_id, date, profile_id
+    ) t
+    WHERE rn <= 20
+    ORDER BY credential_id, date DESC
+""")
+
+APD_SQL = text("""
+    SELECT date, profile_id, total_spend, total_sales, total_clicks, total_impressions, source, credential_id
+    FROM (
+        SELECT *, row_number() OVER (PARTITION BY credential_id ORDER BY date DESC) AS rn
+        FROM account_performance_daily
+        WHERE credential_id = ANY(:cids)
+    ) t
+    WHERE rn <= 20
+    ORDER BY credential_id, date DESC
+""")
+
+REPORTS_SQL = text("""
+    SELECT id, date_range_start, date_range_end, status, created_at, credential_id
+    FROM (
+        SELECT *, row_number() OVER (PARTITION BY credential_id ORDER BY created_at DESC) AS rn
+        FROM reports
+        WHERE credential_id = ANY(:cids)
+    ) t
+    WHERE rn <= 10
+    ORDER BY credential_id, created_at DESC
+""")
+
+CAMPAIGNS_SQL = text("""
+    SELECT COUNT(*), SUM(spend)::numeric(12,2), SUM(sales)::numeric(12,2), credential_id
+    FROM campaigns
+    WHERE credential_id = ANY(:cids)
+    GROUP BY credential_id
+""")
+
+
+async def _fetch(sql, params=None):
+    """Run one read-only query on its own connection."""
+    async with engine.connect() as conn:
+        result = await conn.execute(sql, params or {})
+        return result.fetchall()
+
+
+def _by_credential(rows) -> dict:
+    grouped = defaultdict(list)
+    for r in rows:
+        grouped[str(r.credential_id)].append(r)
+    return grouped
+
+
+def _section(title: str, lines: list[str], empty: str) -> None:
+    """Print one output section with a single write instead of a print per row."""
+    sys.stdout.write(title + "\n" + "\n".join(lines or [empty]) + "\n")
 
 
 async def main():
-    async with engine.begin() as conn:
-        # Credentials
-        cred_result = await conn.execute(text("SELECT id, name, profile_id FROM credentials LIMIT 5"))
-        creds = cred_result.fetchall()
-        print("=== CREDENTIALS ===")
-        for c in creds:
-            print(f"  id={c[0]}, name={c[1]}, profile_id={c[2]}")
-        if not creds:
-            print("  (no credentials)")
-            return
-
-        cred_id = str(creds[0][0])
+    # Credentials
+    creds = await _fetch(CREDENTIALS_SQL)
+    _section(
+        "=== CREDENTIALS ===",
+        [f"  id={c[0]}, name={c[1]}, profile_id={c[2]}" for c in creds],
+        "  (no credentials)",
+    )
+    if not creds:
+        return
+
+    # The queries are independent, so they run concurrently on separate
+    # connections instead of paying one round trip each.
+    params = {"cids": [str(c[0]) for c in creds]}
+    cpd, apd, reports, campaigns = await asyncio.gather(
+        _fetch(CPD_SQL, params),
+        _fetch(APD_SQL, params),
+        _fetch(REPORTS_SQL, params),
+        _fetch(CAMPAIGNS_SQL, params),
+    )
+    cpd, apd, reports, campaigns = (_by_credential(x) for x in (cpd, apd, reports, campaigns))
+
+    for c in creds:
+        cred_id = str(c[0])
+        print(f"\n##### CREDENTIAL {cred_id} ({c[1]}) #####")
 
         # Campaign performance daily
-        cpd_result = await conn.execute(text("""
-            SELECT date, profile_id, COUNT(*) as rows, SUM(spend)::numeric(12,2) as total_spend, SUM(sales)::numeric(12,2) as total_sales
-            FROM campaign_performance_daily
-            WHERE credential_id = :cid
-            GROUP BY date, profile_id
-            ORDER BY date DESC
-            LIMIT 20
-        """), {"cid": cred_id})
-        rows = cpd_result.fetchall()
-        print("\n=== CAMPAIGN_PERFORMANCE_DAILY (by date range) ===")
-        if rows:
-            for r in rows:
-                print(f"  date={r[0]}, profile_id={r[1]}, rows={r[2]}, spend={r[3]}, sales={r[4]}")
-        else:
-            print("  (no rows for this credential)")
+        _section(
+            "\n=== CAMPAIGN_PERFORMANCE_DAILY (by date range) ===",
+            [
+                f"  date={r[0]}, profile_id={r[1]}, rows={r[2]}, spend={r[3]}, sales={r[4]}"
+                for r in cpd.get(cred_id, ())
+            ],
+            "  (no rows for this credential)",
+        )
 
         # Account performance daily
-        apd_result = await conn.execute(text("""
-            SELECT date, profile_id, total_spend, total_sales, total_clicks, total_impressions, source
-            FROM account_performance_daily
-            WHERE credential_id = :cid
-            ORDER BY date DESC
-            LIMIT 20
-        """), {"cid": cred_id})
-        apd_rows = apd_result.fetchall()
-        print("\n=== ACCOUNT_PERFORMANCE_DAILY ===")
-        if apd_rows:
-            for r in apd_rows:
-                print(f"  date={r[0]}, profile_id={r[1]}, spend={r[2]}, sales={r[3]}, clicks={r[4]}, impressions={r[5]}, source={r[6]}")
-        else:
-            print("  (no rows for this credential)")
+        _section(
+            "\n=== ACCOUNT_PERFORMANCE_DAILY ===",
+            [
+                f"  date={r[0]}, profile_id={r[1]}, spend={r[2]}, sales={r[3]}, clicks={r[4]}, impressions={r[5]}, source={r[6]}"
+                for r in apd.get(cred_id, ())
+            ],
+            "  (no rows for this credential)",
+        )
 
         # Reports table (recent)
-        rep_result = await conn.execute(text("""
-            SELECT id, date_range_start, date_range_end, status, created_at
-            FROM reports
-            WHERE credential_id = :cid
-            ORDER BY created_at DESC
-            LIMIT 10
-        """), {"cid": cred_id})
-        rep_rows = rep_result.fetchall()
-        print("\n=== RECENT REPORTS ===")
-        if rep_rows:
-            for r in rep_rows:
-                print(f"  id={r[0]}, range={r[1]} to {r[2]}, status={r[3]}, created={r[4]}")
-        else:
-            print("  (no reports)")
+        _section(
+            "\n=== RECENT REPORTS ===",
+            [
+                f"  id={r[0]}, range={r[1]} to {r[2]}, status={r[3]}, created={r[4]}"
+                for r in reports.get(cred_id, ())
+            ],
+            "  (no reports)",
+        )
 
         # Campaign table (fallback source)
-        camp_result = await conn.execute(text("""
-            SELECT COUNT(*), SUM(spend)::numeric(12,2), SUM(sales)::numeric(12,2)
-            FROM campaigns
-            WHERE credential_id = :cid
-        """), {"cid": cred_id})
-        camp = camp_result.fetchone()
+        camp = (campaigns.get(cred_id) or [(0, None, None)])[0]
         print("\n=== CAMPAIGNS TABLE (fallback) ===")
         print(f"  campaigns={camp[0]}, total_spend={camp[1]}, total_sales={camp[2]}")
 
     print("\nDone.")
 
 
+async def _run():
+    try:
+        await main()
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_run())
@@ -20,7 +20,10 @@ backend_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(backend_root))
 
 from sqlalchemy import text
-from app.database import engine
+from sqlalchemy.exc import DBAPIError
+from app.database import make_script_engine
+
+engine = make_script_engine()
 
 
 async def clear_old_data():
@@ -53,11 +56,38 @@ async def clear_stale_data():
 
 
 async def _clear_tables(tables):
-    async with engine.begin() as conn:
+    async with engine.connect() as conn:
+        # A single TRUNCATE naming every table clears them in one statement,
+        # and PostgreSQL accepts it when the only references into these
+        # tables come from tables in the same list (the stale set).
+        try:
+            async with conn.begin_nested():
+                await conn.execute(text(f"TRUNCATE TABLE {', '.join(tables)}"))
+        except DBAPIError:
+            pass
+        else:
+            await conn.commit()
+            for table in tables:
+                print(f"  Cleared {table}: truncated")
+            return
+
+        # One transaction per table: a failure part-way keeps earlier clears.
         for table in tables:
-            result = await conn.execute(text(f"DELETE FROM {table}"))
-            deleted = result.rowcount
-            print(f"  Cleared {table}: {deleted} rows")
+            # TRUNCATE drops the heap in one step instead of deleting and
+            # WAL-logging every row. PostgreSQL refuses it for tables another
+            # table references (e.g. campaigns <- ad_groups); those keep the
+            # row-wise DELETE so ON DELETE CASCADE still clears dependents.
+            try:
+                async with conn.begin_nested():
+                    await conn.execute(text(f"TRUNCATE TABLE {table}"))
+            except DBAPIError:
+                result = await conn.execute(text(f"DELETE FROM {table}"))
+                await conn.commit()
+                deleted = result.rowcount
+                print(f"  Cleared {table}: {deleted} rows")
+            else:
+                await conn.commit()
+                print(f"  Cleared {table}: truncated")
 
 
 async def main():
@@ -85,5 +115,12 @@ async def main():
         print("=" * 60)
 
 
+async def _run():
+    try:
+        await main()
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_run())
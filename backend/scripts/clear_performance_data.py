@@ -24,7 +24,36 @@ backend_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(backend_root))
 
 from sqlalchemy import text
-from app.database import engine
+from app.database import make_script_engine
+
+engine = make_script_engine()
+
+
+# Rows removed per transaction when clearing a single credential's data.
+DELETE_BATCH_SIZE = 10_000
+
+
+async def _delete_in_batches(table: str, id_col: str, credential_id: str) -> int:
+    """Delete one credential's rows from ``table`` in short committed batches.
+
+    A single ``DELETE ... WHERE credential_id = :cid`` over millions of daily
+    rows holds one huge transaction (WAL bloat, blocked autovacuum, timeouts);
+    batching by ctid keeps each transaction small.
+    """
+    batch_sql = text(
+        f"DELETE FROM {table} WHERE ctid = ANY(ARRAY("
+        f"SELECT ctid FROM {table} WHERE {id_col} = :cid LIMIT :batch))"
+    )
+    total = 0
+    async with engine.connect() as conn:
+        while True:
+            # Maintenance deletes can be replayed, so skip the per-commit fsync wait.
+            await conn.execute(text("SET LOCAL synchronous_commit = off"))
+            result = await conn.execute(batch_sql, {"cid": credential_id, "batch": DELETE_BATCH_SIZE})
+            await conn.commit()
+            if not result.rowcount:
+                return total
+            total += result.rowcount
 
 
 async def clear_performance_data(
@@ -44,7 +73,14 @@ async def clear_performance_data(
     if include_reports:
         tables.append(("reports", "credential_id"))
 
-    async with engine.begin() as conn:
+    if credential_id and not dry_run:
+        for table, id_col in tables:
+            deleted = await _delete_in_batches(table, id_col, credential_id)
+            print(f"  Cleared {table}: {deleted} rows (credential_id={credential_id})")
+
+    # Each clear commits on its own, so a failure on one table keeps the
+    # tables already cleared instead of rolling every clear back.
+    async with engine.connect() as conn:
         for table, id_col in tables:
             if dry_run:
                 if credential_id:
@@ -57,17 +93,11 @@ async def clear_performance_data(
                 count = result.scalar()
                 scope = f"credential_id={credential_id}" if credential_id else "all"
                 print(f"  [DRY-RUN] Would clear {table}: {count} rows ({scope})")
-            else:
-                if credential_id:
-                    result = await conn.execute(
-                        text(f"DELETE FROM {table} WHERE {id_col} = :cid"),
-                        {"cid": credential_id},
-                    )
-                else:
-                    result = await conn.execute(text(f"DELETE FROM {table}"))
+            elif not credential_id:
+                result = await conn.execute(text(f"DELETE FROM {table}"))
+                await conn.commit()
                 deleted = result.rowcount
-                scope = f"credential_id={credential_id}" if credential_id else "all"
-                print(f"  Cleared {table}: {deleted} rows ({scope})")
+                print(f"  Cleared {table}: {deleted} rows (all)")
 
         # Zero out Campaign table metrics — Reports page fallback uses campaigns when daily is empty
         has_metrics_where = (
@@ -99,6 +129,7 @@ async def clear_performance_data(
                     f"WHERE {has_metrics_where}"
                 )
                 result = await conn.execute(zero_sql)
+            await conn.commit()
             updated = result.rowcount
             scope = f"credential_id={credential_id}" if credential_id else "all"
             print(f"  Zeroed campaigns metrics: {updated} rows ({scope})")
@@ -150,5 +181,12 @@ async def main():
     print("\nDone. Run Audit + Generate Report in the app to repopulate.")
 
 
+async def _run():
+    try:
+        await main()
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_run())
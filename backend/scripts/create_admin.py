@@ -12,33 +12,39 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 async def main():
     from app.config import get_settings
-    from app.database import async_session
+    from app.database import make_script_engine
     from app.models import User
     from app.services.auth_service import hash_password
-    from sqlalchemy import select, func
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
 
     settings = get_settings()
     if not settings.first_admin_email or not settings.first_admin_password:
         print("Error: Set FIRST_ADMIN_EMAIL and FIRST_ADMIN_PASSWORD in .env")
         sys.exit(1)
 
-    async with async_session() as db:
-        r = await db.execute(select(func.count()).select_from(User))
-        count = r.scalar() or 0
-        if count > 0:
-            print(f"Users already exist ({count}). Bootstrap only creates first admin when no users exist.")
-            sys.exit(0)
-
-        admin = User(
-            email=settings.first_admin_email.lower(),
-            password_hash=hash_password(settings.first_admin_password),
-            name="Admin",
-            role="admin",
-            is_active=True,
-        )
-        db.add(admin)
-        await db.commit()
-        print(f"Created admin user: {admin.email}")
+    engine = make_script_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            # Existence probe: reads at most one index entry, unlike COUNT(*).
+            r = await db.execute(select(User.id).limit(1))
+            if r.scalar_one_or_none() is not None:
+                print("Users already exist. Bootstrap only creates first admin when no users exist.")
+                sys.exit(0)
+
+            password_hash = await asyncio.to_thread(hash_password, settings.first_admin_password)
+            admin = User(
+                email=settings.first_admin_email.lower(),
+                password_hash=password_hash,
+                name="Admin",
+                role="admin",
+                is_active=True,
+            )
+            db.add(admin)
+            await db.commit()
+            print(f"Created admin user: {admin.email}")
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
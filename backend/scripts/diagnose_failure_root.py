@@ -40,15 +40,17 @@ async def main() -> int:
 
         # Each row's "stuck date" lives inside raw_response.error per the
         # earlier diagnostic ("Amazon report fetch failed for 2026-03-28").
-        all_failed = await db.execute(
+        # Every failed report's raw_response is scanned, so stream them through
+        # a server-side cursor rather than loading the whole history at once.
+        all_failed = await db.stream(
             select(Report.created_at, Report.date_range_start, Report.date_range_end, Report.raw_response)
             .where(Report.status == "failed")
             .order_by(Report.created_at.asc())
+            .execution_options(yield_per=500)
         )
-        rows = all_failed.all()
 
         stuck_counter: Counter[str] = Counter()
-        for created, ds, de, raw in rows:
+        async for created, ds, de, raw in all_failed:
             if not isinstance(raw, dict):
                 continue
             err = raw.get("error") or raw.get("message") or ""
@@ -0,0 +1,24 @@
+"""Shared fixtures for the backend test suite."""
+
+import httpx
+import pytest
+
+from app.services import reporting_service
+
+
+@pytest.fixture
+def serve_parts(monkeypatch):
+    """Route the shared report client through a mock transport keyed by URL.
+
+    Returns ``(bodies, seen)``: responses to serve by URL, and the URLs requested.
+    """
+    bodies: dict[str, httpx.Response] = {}
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return bodies.get(str(request.url), httpx.Response(404))
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(reporting_service._HTTP, "client", client)
+    return bodies, seen
@@ -14,6 +14,7 @@ the contract:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import sys
 import types
 from pathlib import Path
@@ -36,7 +37,12 @@ if "mcp" not in sys.modules:
     streamable.streamablehttp_client = lambda *a, **kw: None
     sys.modules["mcp.client.streamable_http"] = streamable
 
-from app.services.campaign_creation_service import CampaignCreationService  # noqa: E402
+from app.services.campaign_creation_service import (  # noqa: E402
+    CampaignCreationService,
+    _extract_id,
+    _keyword_payloads,
+    _kw_to_payload,
+)
 
 
 def _run(coro):
@@ -62,6 +68,7 @@ def _plan():
 
 def _make_client(*, ag_fails: bool = False, ad_fails: bool = False, target_fails: bool = False):
     c = AsyncMock()
+    c.session = lambda: contextlib.nullcontext(c)
     c.create_campaign.return_value = {"campaigns": [{"campaignId": "camp-1"}]}
     if ag_fails:
         c.create_ad_group.side_effect = RuntimeError("ag boom")
@@ -129,3 +136,48 @@ def test_opt_out_rollback_keeps_orphans():
     res = _run(svc.execute_plan(_plan(), rollback_on_failure=False))
     assert res["rollback_performed"] is False
     client.delete_campaign.assert_not_awaited()
+
+
+def test_kw_to_payload_normalises_match_and_clamps_bid():
+    p = _kw_to_payload({"text": " shoes ", "matchType": "exact", "bid": 0}, "ag-1", None)
+    assert p["expression"] == "shoes"
+    assert p["matchType"] == "EXACT"
+    assert p["bid"] == 0.5
+    p = _kw_to_payload({"keyword": "boots", "match_type": "fuzzy", "bid": 0.01}, "ag-1", 0.3)
+    assert p["matchType"] == "BROAD"
+    assert p["bid"] == 0.02
+    assert _kw_to_payload({"text": "  "}, "ag-1", 0.3) is None
+
+
+def test_extract_id_shapes():
+    assert _extract_id({"success": [{"index": 0, "adGroupId": "ag-9"}]}, ["adGroups"]) == "ag-9"
+    assert _extract_id({"campaigns": [{"campaignId": "c-1"}]}, ["campaigns"]) == "c-1"
+    assert _extract_id({"campaignId": "c-2"}, ["campaigns", "campaignId"]) == "c-2"
+    assert _extract_id({"success": [{"index": 0}], "ads": [{"adId": "a-1"}]}, ["ads"]) == "a-1"
+    assert _extract_id(["not", "a", "dict"], ["ads"]) is None
+
+
+def test_hung_target_call_times_out_as_soft_error(monkeypatch):
+    import app.services.campaign_creation_service as ccs
+
+    monkeypatch.setattr(ccs, "MCP_STAGE_TIMEOUT_SECONDS", 0.05)
+    client = _make_client()
+
+    async def hang(_payloads):
+        await asyncio.sleep(10)
+
+    client.create_target.side_effect = hang
+    res = _run(CampaignCreationService(client).execute_plan(_plan()))
+    assert res["ad_ids"] == ["ad-1"]
+    assert res["target_ids"] == []
+    assert any("Target creation failed: timed out" in e for e in res["errors"])
+    assert res["rollback_performed"] is False
+
+
+def test_keyword_payloads_homogeneous_and_mixed_match_types():
+    same = [{"text": "a", "matchType": "phrase"}, {"text": "b", "matchType": "phrase"}]
+    assert [p["matchType"] for p in _keyword_payloads(same, "ag-1", 0.4)] == ["PHRASE", "PHRASE"]
+    unset = [{"text": "a"}, {"text": ""}, {"text": "c"}]
+    assert [p["matchType"] for p in _keyword_payloads(unset, "ag-1", 0.4)] == ["BROAD", "BROAD"]
+    mixed = [{"text": "a", "match_type": "EXACT"}, {"text": "b", "matchType": "bogus"}, {"text": "c"}]
+    assert [p["matchType"] for p in _keyword_payloads(mixed, "ag-1", 0.4)] == ["EXACT", "BROAD", "BROAD"]
@@ -2,53 +2,55 @@
 Tests for application configuration and settings validation.
 """
 
-import os
 import pytest
-from unittest.mock import patch
 
 
 def test_settings_loads_defaults():
     """Settings should load with sensible defaults in development."""
-    # Clear the lru_cache so we get a fresh Settings instance
-    from app.config import get_settings
-    get_settings.cache_clear()
-
-    with patch.dict(os.environ, {
-        "ENVIRONMENT": "development",
-        "DATABASE_URL": "postgresql+asyncpg://localhost/test",
-        "SECRET_KEY": "change-me-in-production",
-    }, clear=False):
-        get_settings.cache_clear()
-        settings = get_settings()
-        assert settings.environment == "development"
-        assert settings.is_production is False
-        assert settings.openai_model == "gpt-4o"
-        get_settings.cache_clear()
+    from app.config import Settings
+    settings = Settings(
+        _env_file=None,
+        environment="development",
+        database_url="postgresql+asyncpg://localhost/test",
+        secret_key="change-me-in-production",
+    )
+    assert settings.environment == "development"
+    assert settings.is_production is False
+    assert settings.openai_model == "gpt-4o"
 
 
 def test_settings_cors_origin_list():
     """CORS origins string should be split into a list."""
+    from app.config import Settings
+    settings = Settings(
+        _env_file=None,
+        environment="development",
+        database_url="postgresql+asyncpg://localhost/test",
+        cors_origins="http://localhost:3000, http://example.com",
+    )
+    origins = settings.cors_origin_list
+    assert len(origins) == 2
+    assert "http://localhost:3000" in origins
+    assert "http://example.com" in origins
+
+
+def test_get_settings_is_cached_per_environment(monkeypatch):
+    """get_settings() reads the environment once and then reuses the instance."""
     from app.config import get_settings
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    monkeypatch.setenv("CORS_ORIGINS", "http://cached.test")
     get_settings.cache_clear()
-
-    with patch.dict(os.environ, {
-        "ENVIRONMENT": "development",
-        "DATABASE_URL": "postgresql+asyncpg://localhost/test",
-        "CORS_ORIGINS": "http://localhost:3000, http://example.com",
-    }, clear=False):
-        get_settings.cache_clear()
-        settings = get_settings()
-        origins = settings.cors_origin_list
-        assert len(origins) == 2
-        assert "http://localhost:3000" in origins
-        assert "http://example.com" in origins
+    try:
+        first = get_settings()
+        assert first.cors_origin_list == ["http://cached.test"]
+        assert get_settings() is first
+    finally:
         get_settings.cache_clear()
 
 
 def test_production_rejects_default_secret():
     """Production mode should reject the default secret key."""
-    from app.config import get_settings, Settings
-    get_settings.cache_clear()
+    from app.config import Settings
 
     with pytest.raises(ValueError, match="SECRET_KEY must be set"):
         Settings(
@@ -56,7 +58,6 @@ def test_production_rejects_default_secret():
             secret_key="change-me-in-production",
             database_url="postgresql+asyncpg://prod-host/db",
         )
-    get_settings.cache_clear()
 
 
 def test_production_accepts_real_secret():
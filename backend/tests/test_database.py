@@ -0,0 +1,12 @@
+"""Engine configuration in app.database."""
+
+from sqlalchemy.pool import NullPool
+
+from app import database
+
+
+def test_script_engine_is_unpooled_and_separate_from_app_engine():
+    engine = database.make_script_engine()
+    assert isinstance(engine.pool, NullPool)
+    assert engine is not database.engine
+    assert engine.url == database.engine.url
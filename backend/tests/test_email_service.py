@@ -0,0 +1,134 @@
+"""
+Tests for the Resend email service (async REST path).
+"""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services import email_service
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def resend_settings(monkeypatch):
+    settings = SimpleNamespace(resend_api_key="re_test", from_email="noreply@example.com")
+    monkeypatch.setattr(email_service, "_SETTINGS", settings)
+    return settings
+
+
+@pytest.fixture
+def captured_requests(monkeypatch):
+    """Route the shared Resend client through a mock transport."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "email_1"})
+
+    client = httpx.AsyncClient(
+        base_url=email_service.RESEND_API_BASE,
+        transport=httpx.MockTransport(handler),
+    )
+    monkeypatch.setattr(email_service._HTTP, "client", client)
+    return seen
+
+
+@pytest.mark.anyio
+async def test_invite_email_async_posts_to_resend(resend_settings, captured_requests):
+    ok = await email_service.send_invite_email_async(
+        "new@example.com", "https://app.test/register?token=abc", "Alice"
+    )
+    assert ok is True
+    assert len(captured_requests) == 1
+    req = captured_requests[0]
+    assert req.url.path == "/emails"
+    body = json.loads(req.content)
+    assert body["to"] == ["new@example.com"]
+    assert body["from"] == "noreply@example.com"
+    assert "https://app.test/register?token=abc" in body["html"]
+    await email_service.close_http_client()
+
+
+@pytest.mark.anyio
+async def test_async_send_returns_false_on_http_error(resend_settings, monkeypatch):
+    client = httpx.AsyncClient(
+        base_url=email_service.RESEND_API_BASE,
+        transport=httpx.MockTransport(lambda request: httpx.Response(422, json={})),
+    )
+    monkeypatch.setattr(email_service._HTTP, "client", client)
+    ok = await email_service.send_password_reset_email_async("u@example.com", "https://x/reset")
+    assert ok is False
+    await email_service.close_http_client()
+
+
+@pytest.mark.anyio
+async def test_async_send_skipped_when_not_configured(monkeypatch, captured_requests):
+    monkeypatch.setattr(email_service, "_SETTINGS", None)
+    ok = await email_service.send_sync_complete_email_async("u@example.com", success=True)
+    assert ok is False
+    assert captured_requests == []
+
+
+def test_user_controlled_fields_are_html_escaped():
+    _, html = email_service._invite_message(
+        "https://app.test/register?token=a&b=1", "<script>x</script>"
+    )
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
+    assert 'href="https://app.test/register?token=a&amp;b=1"' in html
+
+    _, html = email_service._sync_complete_message(
+        False, None, 'Bad "quote" <b>', "Acme & Co"
+    )
+    assert "Acme &amp; Co" in html
+    assert "&lt;b&gt;" in html
+
+
+@pytest.mark.anyio
+async def test_sync_complete_fanout_uses_batch_endpoint(resend_settings, captured_requests, monkeypatch):
+    monkeypatch.setattr(email_service, "RESEND_BATCH_LIMIT", 2)
+    recipients = ["a@example.com", "b@example.com", "c@example.com"]
+    sent = await email_service.send_sync_complete_emails_async(
+        recipients, success=True, stats={"campaigns": 4}, account_name="Acme"
+    )
+    assert sent == 3
+    assert [r.url.path for r in captured_requests] == ["/emails/batch", "/emails/batch"]
+    batches = [json.loads(r.content) for r in captured_requests]
+    assert sorted(p["to"][0] for b in batches for p in b) == recipients
+    await email_service.close_http_client()
+
+
+def test_reload_email_config_tracks_settings(monkeypatch):
+    monkeypatch.setattr(email_service, "_SETTINGS", email_service._SETTINGS)  # restored after
+    monkeypatch.setattr(
+        "app.config.get_settings",
+        lambda: SimpleNamespace(resend_api_key="re_x", from_email="a@example.com"),
+    )
+    assert email_service.reload_email_config() is True
+    monkeypatch.setattr(
+        "app.config.get_settings",
+        lambda: SimpleNamespace(resend_api_key="", from_email="a@example.com"),
+    )
+    assert email_service.reload_email_config() is False
+    assert email_service.send_weekly_digest_email("u@example.com", "<p>hi</p>") is False
+
+
+@pytest.mark.anyio
+async def test_reloaded_api_key_applies_to_the_shared_client(monkeypatch, captured_requests):
+    monkeypatch.setattr(email_service, "_SETTINGS", email_service._SETTINGS)  # restored after
+    for key in ("re_old", "re_new"):
+        monkeypatch.setattr(
+            "app.config.get_settings",
+            lambda key=key: SimpleNamespace(resend_api_key=key, from_email="a@example.com"),
+        )
+        assert email_service.reload_email_config() is True
+        assert await email_service.send_password_reset_email_async("u@example.com", "https://x/r") is True
+    assert [r.headers["Authorization"] for r in captured_requests] == ["Bearer re_old", "Bearer re_new"]
+    await email_service.close_http_client()
@@ -53,3 +53,75 @@ def test_extract_product_creative_resolved_asin():
     asin, sku = extract_ad_asin_sku(ad)
     assert asin == "B00WT3PJ0W"
     assert sku == "3299-5"
+
+
+def test_extract_direct_field_falls_back_to_target_details():
+    # An empty top-level value defers to targetDetails for the same key.
+    tgt = {"keywordText": "", "targetDetails": {"keywordText": "running shoes"}}
+    assert extract_target_expression(tgt) == "running shoes"
+    assert extract_target_expression({"targetDetails": {"themeTarget": {"theme": "gifts"}}}) == "gifts"
+
+
+def test_keyword_and_asin_predicates_reject_non_strings():
+    from app.utils import _is_keyword_like, _looks_like_asin
+
+    assert _is_keyword_like("blue widget") is True
+    assert _is_keyword_like("123456789012") is False
+    assert _is_keyword_like("1234-5678-9012") is False
+    assert _is_keyword_like(None) is False and _is_keyword_like(["x"]) is False
+    assert _looks_like_asin("B00WT3PJ0W") is True
+    assert _looks_like_asin("3299-5") is False
+    assert _looks_like_asin({"asin": "B00WT3PJ0W"}) is False
+    # Lower-case or non-ASCII "alphanumerics" are SKUs, not ASINs.
+    assert _looks_like_asin("b00wt3pj0w") is False
+    assert _looks_like_asin("B00WT3PJ0\u0663") is False
+    assert extract_ad_asin_sku({"productId": "sku1234567"}) == (None, None)
+
+
+def test_deep_scans_find_nested_asin_and_category():
+    ad = {"sku": None, "extra": {"items": [{"meta": {"resolvedProductId": "B07XYZ1234"}}, {"asin": "B000000000"}]}}
+    assert extract_ad_asin_sku(ad) == ("B07XYZ1234", None)
+    tgt = {
+        "targetDetails": {
+            "productCategoryTarget": {
+                "productCategoryRefinement": {"productCategoryRefinement": {"productCategoryId": 1234}}
+            }
+        }
+    }
+    assert extract_target_expression(tgt) == "Category: 1234"
+
+
+def test_top_level_asin_and_sku_skip_creative_scans():
+    # A malformed creative is never inspected once both fields are known.
+    assert extract_ad_asin_sku({"asin": "B00WT3PJ0W", "sku": "3299-5", "creative": "junk"}) == (
+        "B00WT3PJ0W",
+        "3299-5",
+    )
+    ad = {"asin": "B00WT3PJ0W", "creative": {"products": [{"productId": "B0ZZZZZZZZ"}]}}
+    assert extract_ad_asin_sku(ad) == ("B00WT3PJ0W", None)
+
+
+def test_wrapped_target_and_ad_payloads_are_unwrapped():
+    assert extract_target_expression({"target": {"keywordText": "red mug"}}) == "red mug"
+    assert extract_target_expression({"target": "junk", "keywordText": "red mug"}) == "red mug"
+    assert extract_ad_asin_sku({"ad": {"asin": "B00WT3PJ0W", "sku": "S1"}}) == ("B00WT3PJ0W", "S1")
+
+
+def test_target_detail_type_labels():
+    def expr(details):
+        return extract_target_expression({"targetDetails": details})
+
+    assert expr({"productTarget": {"product": {"productId": "B00WT3PJ0W", "productIdType": "ASIN"}}}) == (
+        "ASIN: B00WT3PJ0W"
+    )
+    assert expr({"productTarget": {"matchType": "PRODUCT_EXACT"}}) == "Product: PRODUCT_EXACT"
+    assert expr({"themeTarget": {"matchType": "KEYWORDS_CLOSE_MATCH"}}) == "Theme: KEYWORDS_CLOSE_MATCH"
+    assert expr({"productCategoryTarget": {"matchType": "CATEGORY"}}) == "Category: CATEGORY"
+    assert expr({"otherTarget": {"resolvedExpression": "brand=\"Acme\""}}) == 'brand="Acme"'
+
+
+def test_flat_targets_use_expression_arrays():
+    tgt = {"expression": [{"type": "asinSameAs", "value": "B00WT3PJ0W"}, {"type": "x", "value": "123456789012"}]}
+    assert extract_target_expression(tgt) == "B00WT3PJ0W"
+    assert extract_target_expression({"expressions": ["red mug", "blue cup"]}) == "red mug | blue cup"
+    assert extract_target_expression({"targetId": "1"}) is None
@@ -100,3 +100,27 @@ def test_nested_recursion_still_works():
 def test_string_carrying_error_keyword():
     assert extract_mcp_error("operation failed: timeout") is not None
     assert extract_mcp_error("OK") is None
+
+
+def test_safe_error_detail_logs_lazily(caplog):
+    import logging
+
+    from app.utils import safe_error_detail
+
+    class _Loud(Exception):
+        rendered = 0
+
+        def __str__(self):
+            _Loud.rendered += 1
+            return "boom"
+
+    logger = logging.getLogger("app.utils")
+    logger.disabled = True
+    try:
+        assert safe_error_detail(_Loud(), "nope") == "nope"
+        assert _Loud.rendered == 0
+    finally:
+        logger.disabled = False
+    with caplog.at_level(logging.ERROR, logger="app.utils"):
+        safe_error_detail(_Loud())
+    assert "Operation failed: boom" in caplog.text
@@ -68,3 +68,32 @@ def test_acos_threshold_rejects_high_acos():
         match_type_filter=None,
     )
     assert [k["keyword"] for k in q] == ["lo"]
+
+
+def test_filter_reads_nested_metrics_and_field_fallbacks():
+    targets = [
+        {"expression": "nested kw", "metrics": {"attributedSales7d": 9, "clicks7d": 4, "cost": 3.5}},
+        {"text": "", "attributedSales7d": 9},
+    ]
+    out, window = hf.filter_target_list_for_harvest(
+        targets,
+        sales_threshold=1.0,
+        acos_threshold=None,
+        clicks_threshold=None,
+        lookback_days=7,
+        match_type_filter=None,
+    )
+    assert window == "7d"
+    assert [(k["keyword"], k["spend"], k["sales"]) for k in out] == [("nested kw", 3.5, 9.0)]
+
+
+def test_unparseable_threshold_qualifies_nothing():
+    out, _ = hf.filter_target_list_for_harvest(
+        [{"keywordText": "a", "attributedSales7d": 5, "clicks7d": 9}],
+        sales_threshold="lots",
+        acos_threshold=None,
+        clicks_threshold=None,
+        lookback_days=7,
+        match_type_filter=None,
+    )
+    assert out == []
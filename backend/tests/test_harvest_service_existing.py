@@ -131,3 +131,114 @@ def test_harvest_existing_proceeds_with_ad_group(monkeypatch):
     # The create_target call_tool fired; the silent fallback path did not.
     assert "call_tool" in client.calls
     assert "query_ad_groups" not in client.calls
+
+
+def test_harvest_existing_prefetches_source_ad_group_once(monkeypatch):
+    client = _FakeMCP()
+    tool_bodies: list[dict] = []
+
+    async def call_tool(_name, args):
+        client.calls.append("call_tool")
+        tool_bodies.append(args["body"])
+        return {"targets": []}
+
+    client.call_tool = call_tool
+    service = HarvestService(client)
+
+    async def _candidates(_self, _campaign_id):
+        return {"targets": []}
+
+    import app.services.harvest_service as hs_mod
+    monkeypatch.setattr(HarvestService, "get_harvest_candidates", _candidates)
+    monkeypatch.setattr(hs_mod, "normalize_target_list", lambda x: x or [])
+    monkeypatch.setattr(
+        hs_mod,
+        "filter_target_list_for_harvest",
+        lambda targets, **_: (
+            [{"keyword": "rugby tackle bag", "matchType": "EXACT", "bid": 0.5}],
+            {"window": "30d"},
+        ),
+    )
+
+    result = _run(
+        service._harvest_to_existing(
+            source_campaign_id="c-source",
+            target_campaign_id="c-target",
+            target_ad_group_id="ag-explicit",
+            sales_threshold=1.0,
+            acos_threshold=None,
+            match_type=None,
+            negate_in_source=True,
+        )
+    )
+
+    assert result["status"] == "success"
+    assert result["keywords_negated_in_source"] == 1
+    assert client.calls.count("query_ad_groups") == 1
+    negatives = tool_bodies[-1]["targets"]
+    assert negatives[0]["adGroupId"] == "fallback-ag"
+    assert negatives[0]["matchType"] == "NEGATIVE_EXACT"
+
+
+def test_create_targets_batched_chunks_and_reports_failures():
+    client = _FakeMCP()
+    sizes: list[int] = []
+
+    async def call_tool(_name, args):
+        chunk = args["body"]["targets"]
+        sizes.append(len(chunk))
+        if chunk[0]["keyword"] == "k2":
+            raise RuntimeError("chunk rejected")
+        return {"targets": chunk}
+
+    client.call_tool = call_tool
+    service = HarvestService(client)
+    targets = [{"keyword": f"k{i}"} for i in range(5)]
+
+    created, results, errors = _run(service._create_targets_batched(targets, chunk_size=2))
+
+    assert sorted(sizes) == [1, 2, 2]
+    assert [t["keyword"] for t in created] == ["k0", "k1", "k4"]
+    assert len(results) == 2
+    assert [str(e) for e in errors] == ["chunk rejected"]
+
+
+def test_result_extractors_check_top_level_then_result():
+    top = {"campaignId": "c1", "keywords": [{"keyword": "a"}], "count": "3"}
+    nested = {"result": {"manualCampaignId": "c2", "harvestedKeywords": [{"keyword": "b"}]}}
+
+    assert HarvestService._extract_target_id(top) == "c1"
+    assert HarvestService._extract_target_id(nested) == "c2"
+    assert HarvestService._extract_target_id({"result": "x"}) is None
+    # A null top-level id no longer hides the id under ``result``.
+    assert HarvestService._extract_target_id({"campaignId": None, "result": {"campaignId": "c3"}}) == "c3"
+    assert HarvestService._extract_keywords(top) == [{"keyword": "a"}]
+    assert HarvestService._extract_keywords(nested) == [{"keyword": "b"}]
+    assert HarvestService._extract_keywords([]) == []
+    assert HarvestService._extract_keyword_count(top) == 3
+    assert HarvestService._extract_keyword_count({"keywordsHarvested": "n/a", "count": 2}) == 2
+
+
+def test_first_ad_group_id_is_cached_and_invalidated_on_error():
+    client = _FakeMCP()
+    lookups: list[str] = []
+
+    async def query_ad_groups(campaign_id=None):
+        lookups.append(campaign_id)
+        return {"adGroups": [{"adGroupId": "ag-1"}]}
+
+    async def call_tool(_name, _args):
+        raise RuntimeError("rejected")
+
+    client.query_ad_groups = query_ad_groups
+    client.call_tool = call_tool
+    service = HarvestService(client)
+
+    assert _run(service._first_ad_group_id("src")) == "ag-1"
+    assert _run(service._first_ad_group_id("src")) == "ag-1"
+    assert lookups == ["src"]
+
+    _run(service._negate_keywords_in_source("src", [{"keyword": "kw"}]))
+    assert "src" not in service._ad_group_cache
+    _run(service._first_ad_group_id("src"))
+    assert lookups == ["src", "src"]
@@ -3,39 +3,68 @@ Tests for the FastAPI application and health endpoint.
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import AsyncMock
 from httpx import AsyncClient, ASGITransport
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(scope="module")
+async def client(anyio_backend):
+    """One ASGI client for the module; the app is stateless between requests."""
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def db_probe(monkeypatch):
+    """Replace the DB probe and start with no cached probe result."""
+    import app.main
+
+    probe = AsyncMock(return_value=True)
+    monkeypatch.setattr(app.main, "check_db_connection", probe)
+    monkeypatch.setattr(app.main, "_db_healthy_until", 0.0)
+    return probe
+
+
 @pytest.mark.anyio
-async def test_health_endpoint_healthy():
+async def test_health_endpoint_healthy(client, db_probe):
     """Health endpoint should return healthy when DB is connected."""
-    with patch("app.main.check_db_connection", new_callable=AsyncMock, return_value=True):
-        from app.main import app
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert data["database"] == "connected"
-            assert data["service"] == "Amazon Ads Optimizer"
+    response = await client.get("/api/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["database"] == "connected"
+    assert data["service"] == "Amazon Ads Optimizer"
 
 
 @pytest.mark.anyio
-async def test_health_endpoint_degraded():
+async def test_health_endpoint_degraded(client, db_probe):
     """Health endpoint should return degraded when DB is disconnected."""
-    with patch("app.main.check_db_connection", new_callable=AsyncMock, return_value=False):
-        from app.main import app
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/health")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "degraded"
-            assert data["database"] == "disconnected"
+    db_probe.return_value = False
+    response = await client.get("/api/health")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["database"] == "disconnected"
+
+
+@pytest.mark.anyio
+async def test_health_reuses_recent_success_but_not_failure(client, db_probe):
+    """Only a successful DB probe is reused within the TTL."""
+    db_probe.return_value = False
+    await client.get("/api/health")
+    await client.get("/api/health")
+    assert db_probe.await_count == 2
+
+    db_probe.return_value = True
+    db_probe.reset_mock()
+    await client.get("/api/health")
+    response = await client.get("/api/health")
+    assert db_probe.await_count == 1
+    assert response.json()["status"] == "healthy"
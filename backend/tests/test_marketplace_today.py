@@ -8,7 +8,7 @@ search-term, product, and cron flows.
 from __future__ import annotations
 
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
@@ -72,3 +72,15 @@ def test_all_mapped_marketplace_timezones_are_valid():
         assert ZoneInfo(tz), f"{code} mapped to invalid TZ {tz}"
     for region, tz in REGION_FALLBACK_TIMEZONES.items():
         assert ZoneInfo(tz), f"{region} mapped to invalid TZ {tz}"
+
+
+def test_utcnow_is_naive_utc():
+    from app.utils import utcnow
+
+    before = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = utcnow()
+    after = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert now.tzinfo is None
+    # Allow for microsecond rounding of the float clock reading.
+    slack = timedelta(milliseconds=1)
+    assert before - slack <= now <= after + slack
@@ -275,3 +275,122 @@ def test_looks_like_server_error_detects_known_markers():
     assert not AmazonAdsMCP._looks_like_server_error_text("")
     assert not AmazonAdsMCP._looks_like_server_error_text("{\"campaigns\": []}")
     assert not AmazonAdsMCP._looks_like_server_error_text("Report queued for processing.")
+
+
+# ── session() connection pooling ──────────────────────────────────────
+
+
+def test_session_pins_one_pool_for_all_calls(fixed_scope_client):
+    async def run():
+        assert fixed_scope_client._transport_kwargs() == {}
+        async with fixed_scope_client.session():
+            pool = fixed_scope_client._pool
+            assert pool is not None
+            factory = fixed_scope_client._transport_kwargs()["httpx_client_factory"]
+            # Each MCP call closes its client; the shared pool must survive.
+            async with factory(headers={"X-Test": "1"}) as http:
+                assert http.headers["X-Test"] == "1"
+            async with fixed_scope_client.session():
+                assert fixed_scope_client._pool is pool
+            assert fixed_scope_client._pool is pool
+        assert fixed_scope_client._pool is None
+        assert fixed_scope_client._transport_kwargs() == {}
+
+    asyncio.run(run())
+
+
+# ── Throttle retry / shared limiter ────────────────────────────────────
+
+
+def test_call_tool_retries_throttled_calls_only(fixed_scope_client, monkeypatch):
+    import app.mcp_client as mcp_mod
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(mcp_mod.asyncio, "sleep", fake_sleep)
+    attempts = {"n": 0}
+
+    async def throttled_then_ok(tool_name, arguments):
+        attempts["n"] += 1
+        if attempts["n"] < 3:
+            raise MCPError("Failed to call x: HTTP 429 Too Many Requests")
+        return {"ok": True}
+
+    monkeypatch.setattr(fixed_scope_client, "_call_tool_once", throttled_then_ok)
+    assert asyncio.run(fixed_scope_client.call_tool("campaign_management-query_campaign", {})) == {"ok": True}
+    assert attempts["n"] == 3
+    assert len(sleeps) == 2 and sleeps[1] > sleeps[0]
+
+    async def bad_request(tool_name, arguments):
+        attempts["n"] += 1
+        raise MCPError("Failed to call x: campaign 1234291 not found")
+
+    attempts["n"] = 0
+    monkeypatch.setattr(fixed_scope_client, "_call_tool_once", bad_request)
+    with pytest.raises(MCPError):
+        asyncio.run(fixed_scope_client.call_tool("campaign_management-query_campaign", {}))
+    assert attempts["n"] == 1
+
+
+def test_is_throttled_unwraps_exception_groups():
+    import httpx
+
+    from app.mcp_client import _is_throttled
+
+    req = httpx.Request("POST", "https://example.test/mcp")
+    err = httpx.HTTPStatusError("x", request=req, response=httpx.Response(429, request=req))
+    assert _is_throttled(ExceptionGroup("tg", [err]))
+    wrapped = MCPError("Failed to call x: unhandled errors in a TaskGroup")
+    wrapped.__cause__ = ExceptionGroup("tg", [err])
+    assert _is_throttled(wrapped)
+    assert not _is_throttled(MCPError("Validation failed for 4290001"))
+
+
+def test_call_tool_concurrency_is_capped(fixed_scope_client, monkeypatch):
+    import app.mcp_client as mcp_mod
+
+    monkeypatch.setattr(mcp_mod, "MCP_MAX_IN_FLIGHT", 2)
+    in_flight = peak = 0
+
+    async def slow(tool_name, arguments):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {}
+
+    monkeypatch.setattr(fixed_scope_client, "_call_tool_once", slow)
+
+    async def run():
+        await asyncio.gather(*(fixed_scope_client.call_tool("t", {}) for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_poll_report_backs_off_and_stops_at_max_wait(fixed_scope_client, monkeypatch):
+    import app.mcp_client as mcp_mod
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    async def pending(report_ids):
+        return {"success": [{"report": {"status": "PENDING"}}]}
+
+    monkeypatch.setattr(mcp_mod.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(fixed_scope_client, "retrieve_report", pending)
+    out = asyncio.run(
+        fixed_scope_client.poll_report(["r1"], max_wait=60, interval=2, backoff=2, max_interval=16)
+    )
+    assert fixed_scope_client._get_report_status(out) == "PENDING"
+    assert sleeps == [2, 4, 8, 16, 16, 14]
+
+    sleeps.clear()
+    asyncio.run(fixed_scope_client.poll_report(["r1"], max_wait=30, interval=10))
+    assert sleeps == [10, 10, 10]
@@ -0,0 +1,197 @@
+"""Tests for OptimizerService target fetching and bid-adjustment math."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import optimizer_service as opt  # noqa: E402
+from app.services.optimizer_service import OptimizerService  # noqa: E402
+
+
+def _service(client=None) -> OptimizerService:
+    return OptimizerService(client or MagicMock())
+
+
+def _adjust(targets, metrics=None, **overrides):
+    params = dict(target_acos=30.0, min_bid=0.02, max_bid=100.0, bid_step=0.10, min_clicks=10)
+    params.update(overrides)
+    return _service()._calculate_adjustments(
+        all_targets=[{"campaign_id": "c1", "targets": {"targets": targets}}],
+        metrics_by_target=metrics,
+        **params,
+    )
+
+
+# ── Target fetch ──────────────────────────────────────────────────────
+
+
+def test_fetch_campaign_targets_runs_concurrently_and_skips_failures():
+    client = MagicMock()
+    in_flight = 0
+    peak = 0
+
+    async def query_targets(campaign_id=None, all_products=False):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if campaign_id == "bad":
+            raise RuntimeError("boom")
+        return {"targets": [{"targetId": f"t-{campaign_id}"}]}
+
+    client.query_targets = query_targets
+    out, failed = asyncio.run(_service(client)._fetch_campaign_targets(["a", "bad", "b"]))
+    assert [g["campaign_id"] for g in out] == ["a", "b"]
+    assert failed == ["bad"]
+    assert peak > 1
+
+
+def test_fetch_campaign_targets_raises_when_all_fail():
+    client = MagicMock()
+    client.query_targets = AsyncMock(side_effect=RuntimeError("down"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(_service(client)._fetch_campaign_targets(["a", "b"]))
+
+
+# ── Bid adjustments ───────────────────────────────────────────────────
+
+
+def test_adjustments_follow_acos_ladder():
+    targets = [
+        # ACOS 50% > 36% → full step down
+        {"targetId": "high", "bid": 1.0, "clicks": 20, "spend": 50, "sales": 100},
+        # ACOS 33% in (30, 36] → half step down
+        {"targetId": "mid", "bid": 1.0, "clicks": 20, "spend": 33, "sales": 100},
+        # ACOS 10% < 21% → step up
+        {"targetId": "low", "bid": 1.0, "clicks": 20, "spend": 10, "sales": 100},
+        # ACOS 25% → within band, unchanged
+        {"targetId": "ok", "bid": 1.0, "clicks": 20, "spend": 25, "sales": 100},
+        # No sales with spend → step down
+        {"targetId": "waste", "bid": {"value": 0.5}, "clicks": 12, "spend": 6, "sales": 0},
+        # Too few clicks → unchanged
+        {"targetId": "few", "bid": 1.0, "clicks": 2, "spend": 50, "sales": 10},
+        # Paused → unchanged
+        {"targetId": "paused", "bid": 1.0, "clicks": 20, "spend": 50, "sales": 100, "state": "paused"},
+    ]
+    res = _adjust(targets)
+    by_id = {c["target_id"]: c for c in res["changes"]}
+    assert set(by_id) == {"high", "mid", "low", "waste"}
+    assert by_id["high"]["new_bid"] == 0.9
+    assert by_id["high"]["reason"] == "ACOS 50.0% > target 30.0% (high)"
+    assert by_id["mid"]["new_bid"] == 0.95
+    assert by_id["mid"]["reason"] == "ACOS 33.0% slightly above target 30.0%"
+    assert by_id["low"]["new_bid"] == 1.1
+    assert by_id["low"]["direction"] == "increase"
+    assert by_id["low"]["reason"] == "ACOS 10.0% well below target (room to grow)"
+    assert by_id["waste"]["new_bid"] == 0.4
+    assert by_id["waste"]["current_acos"] is None
+    assert by_id["waste"]["reason"] == "No sales after 12 clicks ($6.00 spent)"
+    assert res["summary"] == {
+        "total_analyzed": 7,
+        "increases": 1,
+        "decreases": 3,
+        "unchanged": 3,
+        "total_changes": 4,
+        "target_acos": 30.0,
+    }
+
+
+def test_adjustments_prefer_report_metrics_and_clamp_bids():
+    targets = [{"targetId": " t1 ", "bid": 0.05, "clicks": 0, "spend": 0, "sales": 0}]
+    metrics = {"t1": {"clicks": 30, "spend": 80.0, "sales": 100.0}}
+    res = _adjust(targets, metrics)
+    (change,) = res["changes"]
+    assert change["target_id"] == "t1"
+    assert change["new_bid"] == 0.02  # clamped to min_bid
+    assert change["clicks"] == 30
+    assert change["spend"] == 80.0
+
+
+def test_bid_kernel_returns_code_per_target():
+    new_bids, codes = opt._bid_kernel(
+        bids=[1.0, 1.0, 1.0, 1.0, 1.0],
+        clicks_col=[20, 20, 20, 5, 20],
+        spend_col=[50.0, 25.0, 0.0, 50.0, 50.0],
+        sales_col=[100.0, 100.0, 0.0, 10.0, 100.0],
+        eligible_col=[True, True, True, True, False],
+        target_acos=30.0, min_bid=0.02, max_bid=100.0, bid_step=0.10, min_clicks=10,
+    )
+    assert codes == [opt.REASON_ACOS_HIGH] + [opt.NO_CHANGE] * 4
+    assert new_bids == [0.9, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_safe_number_parsing():
+    sf, si = OptimizerService._safe_float, OptimizerService._safe_int
+    assert sf(1.5) == 1.5 and sf(2) == 2.0 and sf("3.25") == 3.25
+    assert sf(None, 7.0) == 7.0 and sf("n/a") == 0.0 and sf({"x": 1}) == 0.0
+    assert si(4) == 4 and si(4.9) == 4 and si("12") == 12
+    assert si("1.5") == 0 and si(None, 3) == 3 and si(float("inf")) == 0
+
+
+def test_optimize_bids_returns_raw_targets_only_on_request(monkeypatch):
+    async def no_report(self, *a, **kw):
+        return {}
+
+    monkeypatch.setattr(opt.ReportingService, "generate_mcp_targeting_performance", no_report)
+    client = MagicMock()
+    client.region = "na"
+    client.query_targets = AsyncMock(return_value={"targets": [{"targetId": "t1", "bid": 1.0}]})
+    client.create_campaign_report = AsyncMock(
+        return_value={"success": [{"report": {"reportId": "r1", "columns": ["..."] * 50}}]}
+    )
+    service = _service(client)
+
+    res = asyncio.run(service.optimize_bids(campaign_ids=["c1"]))
+    assert "_raw_targets" not in res
+    assert "report" not in res
+    assert res["report_meta"]["campaign_report_ids"] == ["r1"]
+    assert res["targets_analyzed"] == 1
+
+    res = asyncio.run(service.optimize_bids(campaign_ids=["c1"], include_raw_targets=True))
+    assert res["_raw_targets"] == [{"campaign_id": "c1", "targets": {"targets": [{"targetId": "t1", "bid": 1.0}]}}]
+    assert res["failed_campaign_ids"] == []
+
+
+def test_optimize_bids_reports_campaigns_whose_targets_failed(monkeypatch):
+    async def no_report(self, *a, **kw):
+        return {}
+
+    async def query_targets(campaign_id=None, all_products=False):
+        if campaign_id == "bad":
+            raise RuntimeError("throttled")
+        return {"targets": [{"targetId": f"t-{campaign_id}", "bid": 1.0}]}
+
+    monkeypatch.setattr(opt.ReportingService, "generate_mcp_targeting_performance", no_report)
+    client = MagicMock()
+    client.region = "na"
+    client.query_targets = query_targets
+    client.create_campaign_report = AsyncMock(return_value={})
+
+    res = asyncio.run(_service(client).optimize_bids(campaign_ids=["c1", "bad"]))
+    assert res["targets_analyzed"] == 1
+    assert res["failed_campaign_ids"] == ["bad"]
+    assert res["summary"]["failed_campaign_ids"] == ["bad"]
+
+
+def test_zero_metrics_do_not_fall_through_to_alternate_fields():
+    # spend is a real 0; the differently-scoped ``cost`` must not replace it.
+    targets = [{"targetId": "t1", "bid": 1.0, "clicks": 20, "spend": 0, "cost": 5.0, "sales": 0}]
+    res = _adjust(targets)
+    assert res["changes"] == []
+    assert res["summary"]["unchanged"] == 1
+
+
+def test_kernel_is_reused_per_threshold_tuple():
+    k1 = opt._make_kernel(30.0, 0.02, 100.0, 0.1, 10)
+    assert opt._make_kernel(30.0, 0.02, 100.0, 0.1, 10) is k1
+    assert opt._make_kernel(25.0, 0.02, 100.0, 0.1, 10) is not k1
@@ -0,0 +1,23 @@
+"""Tests for path-parameter UUID parsing."""
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils import parse_uuid
+
+
+def test_parse_uuid_returns_shared_instance_for_repeated_ids():
+    raw = "6f1c2b1e-8a7d-4c3e-9b2a-1d2e3f4a5b6c"
+    first = parse_uuid(raw)
+    assert first == uuid.UUID(raw)
+    assert parse_uuid(raw) is first
+
+
+@pytest.mark.parametrize("bad", ["not-a-uuid", "", "1234"])
+def test_parse_uuid_rejects_invalid_input_with_400(bad):
+    with pytest.raises(HTTPException) as exc:
+        parse_uuid(bad, "account_id")
+    assert exc.value.status_code == 400
+    assert "account_id" in exc.value.detail
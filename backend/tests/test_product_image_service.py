@@ -0,0 +1,82 @@
+"""Tests for product image URL resolution."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import product_image_service as svc  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _empty_image_cache():
+    svc.clear_image_cache()
+    yield
+    svc.clear_image_cache()
+
+
+def test_extract_image_from_raw_data_walks_known_paths():
+    assert svc.extract_image_from_raw_data({"creative": {"images": [{"url": "https://i/1.jpg"}]}}) == "https://i/1.jpg"
+    assert svc.extract_image_from_raw_data({"creative": {"images": []}, "landingPage": {"url": "https://lp"}}) == "https://lp"
+    assert svc.extract_image_from_raw_data({"creative": {"imageUrl": "not-a-url"}}) is None
+    assert svc.extract_image_from_raw_data({"creative": "x"}) is None
+    assert svc.extract_image_from_raw_data(
+        {"creative": {"primaryImage": {"url": "https://p"}, "imageUrl": "https://later"}}
+    ) == "https://p"
+    assert svc.extract_image_from_raw_data({"creative": {"primaryImage": "x", "imageUrl": "https://i"}}) == "https://i"
+
+
+def test_get_product_image_urls_batches_paapi_and_falls_back(monkeypatch):
+    monkeypatch.setattr(svc, "PAAPI_BATCH_SIZE", 2)
+    calls: list[list[str]] = []
+
+    def fake_fetch(access, secret, tag, asins):
+        calls.append(list(asins))
+        return {a: f"https://paapi/{a}.jpg" for a in asins if a != "B3"}
+
+    monkeypatch.setattr(svc, "_fetch_paapi_images", fake_fetch)
+    urls = asyncio.run(
+        svc.get_product_image_urls(["B1", "B2", "B1", "B3", ""], "ak", "sk", "tag")
+    )
+
+    assert sorted(map(tuple, calls)) == [("B1", "B2"), ("B3",)]
+    assert urls["B1"] == "https://paapi/B1.jpg"
+    assert urls["B3"] == svc._asin_fallback_url("B3")
+    assert set(urls) == {"B1", "B2", "B3"}
+
+
+def test_get_product_image_urls_without_paapi_uses_fallback(monkeypatch):
+    monkeypatch.setattr(svc, "_fetch_paapi_images", lambda *a: (_ for _ in ()).throw(AssertionError))
+    urls = asyncio.run(svc.get_product_image_urls(["B1"]))
+    assert urls == {"B1": svc._asin_fallback_url("B1")}
+
+
+def test_paapi_miss_is_cached_briefly(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(svc.time, "monotonic", lambda: now[0])
+    calls: list[str] = []
+
+    def fake_fetch(access, secret, tag, asins):
+        calls.extend(asins)
+        return {}
+
+    monkeypatch.setattr(svc, "_fetch_paapi_images", fake_fetch)
+    lookup = lambda: asyncio.run(svc.get_product_image_url("B9", None, "ak", "sk", "tag"))  # noqa: E731
+
+    assert lookup() == svc._asin_fallback_url("B9")
+    assert lookup() == svc._asin_fallback_url("B9")
+    assert calls == ["B9"]
+    now[0] += svc.IMAGE_CACHE_MISS_TTL_SECONDS + 1
+    lookup()
+    assert calls == ["B9", "B9"]
+
+
+def test_asin_fallback_url_matches_template():
+    assert svc._asin_fallback_url("B000TEST") == svc.ASIN_IMAGE_URL_TEMPLATE.format(asin="B000TEST")
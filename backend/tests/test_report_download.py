@@ -0,0 +1,201 @@
+"""Report part download and decoding in the reporting service."""
+
+import asyncio
+import gzip
+import json
+import zlib
+
+import httpx
+
+from app.services import reporting_service
+from app.services.reporting_service import ReportingService
+
+
+def _completed(*urls):
+    return {
+        "success": [
+            {
+                "report": {
+                    "status": "COMPLETED",
+                    "completedReportParts": [{"url": u} for u in urls],
+                }
+            }
+        ]
+    }
+
+
+def test_download_merges_parts_in_order_and_skips_failures(serve_parts):
+    bodies, seen = serve_parts
+    bodies["https://s3.test/a"] = httpx.Response(
+        200, content=gzip.compress(json.dumps([{"campaignId": "1"}]).encode())
+    )
+    bodies["https://s3.test/c"] = httpx.Response(
+        200, content=json.dumps({"rows": [{"campaignId": "3"}, {"campaignId": "4"}]}).encode()
+    )
+    rows = asyncio.run(
+        ReportingService._download_report_data(
+            _completed("https://s3.test/a", "https://s3.test/missing", "https://s3.test/c")
+        )
+    )
+    assert [r["campaignId"] for r in rows] == ["1", "3", "4"]
+    assert len(seen) == 3
+
+
+def test_report_client_is_shared_until_closed(monkeypatch):
+    monkeypatch.setattr(reporting_service._HTTP, "client", None)
+    client = reporting_service.report_http()
+    assert reporting_service.report_http() is client
+    asyncio.run(reporting_service.close_http_client())
+    assert client.is_closed and reporting_service._HTTP.client is None
+
+
+def test_download_ignores_reports_that_are_not_completed(serve_parts):
+    _, seen = serve_parts
+    response = {"success": [{"report": {"status": "PENDING", "completedReportParts": [{"url": "x"}]}}]}
+    assert asyncio.run(ReportingService._download_report_data(response)) == []
+    assert seen == []
+
+
+def test_download_streams_multi_chunk_and_multi_member_gzip(serve_parts, monkeypatch):
+    monkeypatch.setattr(reporting_service, "REPORT_READ_CHUNK", 64)
+    bodies, _ = serve_parts
+    first = json.dumps([{"campaignId": str(i), "pad": "x" * 50} for i in range(40)])
+    # Two gzip members whose concatenation is one JSON array.
+    payload = gzip.compress(first[:-1].encode()) + gzip.compress(b', {"campaignId": "last"}]')
+    bodies["https://s3.test/big"] = httpx.Response(200, content=payload)
+    rows = asyncio.run(ReportingService._download_report_data(_completed("https://s3.test/big")))
+    assert len(rows) == 41
+    assert rows[-1] == {"campaignId": "last"}
+
+
+def test_report_json_falls_back_to_stdlib(monkeypatch):
+    assert reporting_service._loads_report_json(b'[{"a": 1}]') == [{"a": 1}]
+    # NaN is valid for the stdlib parser, whichever parser runs first.
+    assert reporting_service._loads_report_json(bytearray(b'[{"a": NaN}]'))[0]["a"] != 0
+    monkeypatch.setattr(reporting_service, "orjson", None)
+    assert reporting_service._loads_report_json(b'{"rows": []}') == {"rows": []}
+
+
+def _client(token="t"):
+    from app.mcp_client import AmazonAdsMCP
+
+    return AmazonAdsMCP(client_id="cid", access_token=token, region="na", profile_id="p1")
+
+
+def test_pending_report_checks_are_batched_per_scope(monkeypatch):
+    monkeypatch.setattr(reporting_service, "PENDING_REPORT_BATCH_WINDOW", 0.01)
+    calls = []
+
+    async def retrieve_report(self, report_ids):
+        calls.append((self.access_token, list(report_ids)))
+        return {"success": [
+            {"report": {"reportId": rid, "status": "COMPLETED" if rid != "r2" else "PENDING"}}
+            for rid in report_ids
+        ]}
+
+    from app.mcp_client import AmazonAdsMCP
+
+    monkeypatch.setattr(AmazonAdsMCP, "retrieve_report", retrieve_report)
+    batcher = reporting_service._PendingReportBatcher()
+    a, b = _client(), _client()
+    other = _client(token="other")
+
+    async def run():
+        return await asyncio.gather(
+            batcher.retrieve(a, "r1"),
+            batcher.retrieve(b, "r2"),
+            batcher.retrieve(a, "r3"),
+            batcher.retrieve(other, "r4"),
+        )
+
+    r1, r2, r3, r4 = asyncio.run(run())
+    assert sorted(calls) == [("other", ["r4"]), ("t", ["r1", "r2", "r3"])]
+    assert AmazonAdsMCP._get_report_status(r1) == "COMPLETED"
+    assert AmazonAdsMCP._get_report_status(r2) == "PENDING"
+    assert r3 == {"success": [{"report": {"reportId": "r3", "status": "COMPLETED"}}]}
+    # A lone check passes the response through untouched.
+    assert r4["success"][0]["report"]["reportId"] == "r4"
+
+
+def test_pending_report_batch_error_reaches_every_caller(monkeypatch):
+    monkeypatch.setattr(reporting_service, "PENDING_REPORT_BATCH_WINDOW", 0.01)
+    from app.mcp_client import AmazonAdsMCP
+
+    async def boom(self, report_ids):
+        raise RuntimeError("throttled")
+
+    monkeypatch.setattr(AmazonAdsMCP, "retrieve_report", boom)
+    batcher = reporting_service._PendingReportBatcher()
+    client = _client()
+
+    async def run():
+        return await asyncio.gather(
+            batcher.retrieve(client, "r1"), batcher.retrieve(client, "r2"),
+            return_exceptions=True,
+        )
+
+    assert [type(r) for r in asyncio.run(run())] == [RuntimeError, RuntimeError]
+    assert batcher._open == {}
+
+
+def test_extract_report_ids_across_response_formats():
+    extract = ReportingService.extract_report_ids
+    assert extract({"success": [None, {"report": {"reportId": "a"}}]}) == ["a"]
+    assert extract({"reportIds": ["b", "c"]}) == ["b", "c"]
+    assert extract({"reports": [{"reportId": "d"}, {"x": 1}, "junk"]}) == ["d"]
+    assert extract({"reportId": "e"}) == ["e"]
+    # An empty earlier format falls through to a later one.
+    assert extract({"success": [], "reportIds": [], "reportId": "f"}) == ["f"]
+    assert extract({"success": [{"report": None}]}) == []
+    assert extract(["not", "a", "dict"]) == []
+    assert extract({"success": [{"report": {"reportId": "g"}}, {"report": {"reportId": "h"}}]}) == ["g"]
+    assert extract({"success": [{"report": "junk"}], "reportId": "i"}) == ["i"]
+    assert extract("junk") == []
+
+
+def test_transport_gzip_is_decoded_once(serve_parts):
+    bodies, _ = serve_parts
+    rows = [{"campaignId": "t"}]
+    # Transport-encoded JSON: httpx strips Content-Encoding itself.
+    bodies["https://s3.test/te"] = httpx.Response(
+        200, content=gzip.compress(json.dumps(rows).encode()),
+        headers={"Content-Encoding": "gzip"},
+    )
+    # GZIP_JSON payload served with transport gzip on top.
+    bodies["https://s3.test/both"] = httpx.Response(
+        200, content=gzip.compress(gzip.compress(json.dumps(rows).encode())),
+        headers={"Content-Encoding": "gzip"},
+    )
+    out = asyncio.run(
+        ReportingService._download_report_data(_completed("https://s3.test/te", "https://s3.test/both"))
+    )
+    assert out == rows + rows
+
+
+def test_gzip_parts_inflate_through_the_selected_backend(serve_parts, monkeypatch):
+    made = []
+
+    class _Backend:
+        @staticmethod
+        def decompressobj(wbits):
+            made.append(wbits)
+            return zlib.decompressobj(wbits=wbits)
+
+    monkeypatch.setattr(reporting_service, "_inflate_zlib", _Backend)
+    bodies, _ = serve_parts
+    bodies["https://s3.test/z"] = httpx.Response(200, content=gzip.compress(b'[{"campaignId": "z"}]'))
+    rows = asyncio.run(ReportingService._download_report_data(_completed("https://s3.test/z")))
+    assert rows == [{"campaignId": "z"}]
+    assert made == [31]
+
+
+def test_report_client_uses_http2_only_when_h2_is_importable(monkeypatch):
+    from app import http_client
+
+    built = []
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", lambda **kw: built.append(kw) or object())
+    for available in (True, False):
+        monkeypatch.setattr(http_client, "h2_available", lambda: available)
+        monkeypatch.setattr(reporting_service._HTTP, "client", None)
+        reporting_service.report_http()
+    assert [kw["http2"] for kw in built] == [True, False]
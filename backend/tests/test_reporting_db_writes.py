@@ -0,0 +1,301 @@
+"""Round-trip shape of the reporting service's DB writes (no live database)."""
+
+import asyncio
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Insert, Select
+
+from app.models import Campaign
+from app.services import reporting_service as rs
+
+
+class _Result:
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def scalars(self):
+        return self
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+    scalar = scalar_one_or_none
+
+    def all(self):
+        return list(self._rows)
+
+
+class _RecordingSession:
+    """Records executed statements; SELECTs answer from ``existing``."""
+
+    def __init__(self, existing=()):
+        self.existing = list(existing)
+        self.statements = []
+        self.added = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if isinstance(stmt, Select):
+            return _Result(self.existing)
+        return _Result()
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def flush(self):
+        pass
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_sync_campaigns_uses_one_lookup_and_one_upsert():
+    cred = uuid.uuid4()
+    cached = Campaign(credential_id=cred, amazon_campaign_id="c1", campaign_name="Old", state="enabled")
+    db = _RecordingSession(existing=[cached])
+    payload = {"campaigns": [
+        {"campaignId": "c1", "name": "Renamed", "state": "PAUSED"},
+        {"campaignId": "c2", "name": "New A"},
+        {"campaignId": "c3", "name": "New B", "dailyBudget": "25"},
+        {"campaignId": "c2", "name": "New A v2"},
+        {"name": "no id"},
+    ]}
+
+    synced = asyncio.run(rs.sync_campaigns_to_db(db, cred, payload, profile_id="p1"))
+
+    assert synced == 4
+    selects = [s for s in db.statements if isinstance(s, Select)]
+    inserts = [s for s in db.statements if isinstance(s, Insert)]
+    assert len(selects) == 1 and len(inserts) == 1
+    assert "IN (" in _sql(selects[0])
+    assert "ON CONFLICT (credential_id, amazon_campaign_id) DO UPDATE" in _sql(inserts[0])
+    rows = inserts[0].compile(dialect=postgresql.dialect()).params
+    assert rows["campaign_name_m0"] == "New A v2"
+    assert rows["daily_budget_m1"] == 25.0
+    assert cached.campaign_name == "Renamed"
+    assert cached.profile_id == "p1"
+    assert db.added == []
+
+
+def test_store_campaign_daily_upserts_in_one_statement():
+    cred = uuid.uuid4()
+    db = _RecordingSession()
+    campaigns = [
+        {"campaign_id": "c1", "spend": 10, "sales": 40},
+        {"campaign_id": "c2", "spend": 5, "campaign_name": "Two"},
+        {"campaign_id": "c2", "spend": 6},
+        {"campaign_id": ""},
+    ]
+
+    stored = asyncio.run(rs.store_campaign_daily_data(db, cred, campaigns, "2026-01-01"))
+
+    assert stored == 3
+    (stmt,) = db.statements
+    assert isinstance(stmt, Insert) and db.added == []
+    sql = _sql(stmt)
+    assert "ON CONFLICT (credential_id, coalesce(profile_id, ''), amazon_campaign_id, date) DO UPDATE" in sql
+    assert "campaign_name = coalesce(excluded.campaign_name, campaign_performance_daily.campaign_name)" in sql
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert (params["amazon_campaign_id_m0"], params["acos_m0"]) == ("c1", 25.0)
+    # the repeated c2 merged into one row: last metrics, earlier name kept
+    assert (params["spend_m1"], params["campaign_name_m1"]) == (6.0, "Two")
+    assert "amazon_campaign_id_m2" not in params
+    assert params["synced_at_m0"] is params["synced_at_m1"]  # one timestamp per batch
+
+
+def test_account_summary_counts_states_case_insensitively():
+    db = _RecordingSession()
+    campaigns = [
+        {"state": "ENABLED", "spend": 1}, {"state": "active"}, {"state": "Paused"},
+        {"state": None}, {"state": "archived"},
+    ]
+    asyncio.run(rs.store_account_daily_summary(db, uuid.uuid4(), campaigns, "2024-03-01"))
+    (stmt,) = db.statements
+    assert "ON CONFLICT (credential_id, coalesce(profile_id, ''), date) DO UPDATE" in _sql(stmt)
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert (params["total_campaigns"], params["active_campaigns"], params["paused_campaigns"]) == (5, 2, 1)
+
+
+def _agg_row(period, campaign_id, spend, sales, meta_state=None):
+    return SimpleNamespace(
+        period=period, amazon_campaign_id=campaign_id, campaign_name=None, campaign_type=None,
+        targeting_type=None, state=None, spend=spend, sales=sales, impressions=0, clicks=0,
+        orders=0, top_of_search_impression_share=None, daily_budget=None,
+        acos=spend / sales * 100 if sales else 0, roas=0, ctr=0, cpc=0, cvr=0,
+        meta_state=meta_state, meta_campaign_type=None, meta_targeting_type=None,
+        meta_daily_budget=20.0 if meta_state else None,
+    )
+
+
+def test_campaign_daily_periods_share_one_aggregate_query():
+    class _Scripted(_RecordingSession):
+        def __init__(self, answers):
+            super().__init__()
+            self.answers = list(answers)
+
+        async def execute(self, stmt):
+            self.statements.append(stmt)
+            return _Result(self.answers.pop(0))
+
+    db = _Scripted([
+        [_agg_row(0, "c1", 10.0, 40.0, "enabled"), _agg_row(0, "c2", 5.0, 0)],  # daily rows: current only
+        [_agg_row(1, "c1", 3.0, 12.0, "enabled")],  # legacy range key for the comparison
+    ])
+    current, previous = asyncio.run(rs.query_campaign_daily_periods(
+        db, uuid.uuid4(), [("2024-03-01", "2024-03-07"), ("2024-02-23", "2024-02-29")]
+    ))
+
+    assert [c["campaign_id"] for c in current] == ["c1", "c2"]
+    assert current[0]["acos"] == 25.0 and current[0]["state"] == "enabled"
+    assert current[0]["daily_budget"] == 20.0
+    assert (current[1]["state"], current[1]["daily_budget"]) == ("", 0)
+    assert [(c["campaign_id"], c["spend"]) for c in previous] == [("c1", 3.0)]
+    assert len(db.statements) == 2
+    assert "GROUP BY period" in _sql(db.statements[0])
+    assert "LEFT OUTER JOIN campaigns ON" in _sql(db.statements[0])
+    assert ["2024-02-23__2024-02-29"] in db.statements[1].compile().params.values()
+
+
+def test_encompassing_range_streams_only_overlapping_keys(monkeypatch):
+    class _Streamed:
+        def __init__(self, rows):
+            self._rows = iter(rows)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._rows)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    class _StreamSession(_RecordingSession):
+        async def stream(self, stmt):
+            self.statements.append(stmt)
+            return _Streamed([
+                ("2024-01-01__2024-12-31",),
+                ("2024-03-01__2024-03-31",),
+                ("2024-03-04__2024-03-08",),  # overlaps but does not cover
+                ("bad__key__x",),
+                ("2024-13-01__2024-13-02",),
+            ])
+
+    picked = []
+
+    async def fake_query(db, credential_id, start, end, profile_id=None):
+        picked.append(start)
+        return [{"campaign_id": "c1"}]
+
+    monkeypatch.setattr(rs, "query_campaign_daily", fake_query)
+    db = _StreamSession()
+    out = asyncio.run(rs.find_encompassing_range_data(db, uuid.uuid4(), "2024-03-05", "2024-03-10"))
+
+    assert out == [{"campaign_id": "c1"}]
+    assert picked == ["2024-03-01__2024-03-31"]
+    (stmt,) = db.statements
+    sql = _sql(stmt)
+    assert "strpos(campaign_performance_daily.date, '__') > 0" in sql
+    assert "split_part" in sql
+    assert stmt.get_execution_options()["yield_per"] == rs.RANGE_KEY_FETCH_BATCH
+
+
+def test_pick_range_key_prefers_covering_then_overlap_and_caches():
+    rs._pick_range_key.cache_clear()
+    d = date.fromisoformat
+    keys = ("2024-03-01__2024-03-09", "2024-02-01__2024-03-31", "bad")
+    assert rs._pick_range_key(d("2024-03-05"), d("2024-03-10"), keys) == (
+        "2024-02-01__2024-03-31", True, 6,
+    )
+    assert rs._pick_range_key(d("2024-03-01"), d("2024-03-10"), keys[:1]) == (
+        "2024-03-01__2024-03-09", False, 9,
+    )
+    assert rs._pick_range_key(d("2024-03-01"), d("2024-03-31"), keys[:1]) is None
+    rs._pick_range_key(d("2024-03-05"), d("2024-03-10"), keys)
+    assert rs._pick_range_key.cache_info().hits == 1
+
+
+def test_day_and_range_key_predicates_match_partial_indexes():
+    from sqlalchemy.schema import CreateIndex
+
+    from app.models import AccountPerformanceDaily, CampaignPerformanceDaily
+
+    for model, predicate in (
+        (CampaignPerformanceDaily, rs.single_day_key),
+        (CampaignPerformanceDaily, rs.range_key),
+        (AccountPerformanceDaily, rs.single_day_key),
+    ):
+        where = _sql(predicate(model.date)).replace(f"{model.__tablename__}.", "")
+        assert "%(" not in where
+        ddl = [str(CreateIndex(ix).compile(dialect=postgresql.dialect())) for ix in model.__table__.indexes]
+        assert any(d.endswith(f"WHERE {where}") for d in ddl), where
+
+
+def test_account_daily_trend_reuses_lambda_statement():
+    from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+    db = _RecordingSession()
+    cred = uuid.uuid4()
+    asyncio.run(rs.query_account_daily_trend(db, cred, "2024-03-01", "2024-03-07", profile_id="p1"))
+    asyncio.run(rs.query_account_daily_trend(db, cred, "2024-04-01", "2024-04-30", profile_id="p2"))
+
+    first, second = db.statements
+    assert isinstance(first, StatementLambdaElement)
+    assert first._generate_cache_key() == second._generate_cache_key()
+    params = second.compile(dialect=postgresql.dialect()).params
+    assert {"2024-04-01", "2024-04-30", "p2"} <= set(params.values())
+
+
+def test_account_daily_trend_selects_output_columns_only():
+    class _TrendSession(_RecordingSession):
+        async def execute(self, stmt):
+            self.statements.append(stmt)
+            return _Result([SimpleNamespace(_mapping={"date": "2024-03-01", "spend": 0.0})])
+
+    db = _TrendSession()
+    out = asyncio.run(rs.query_account_daily_trend(db, uuid.uuid4(), "2024-03-01", "2024-03-07"))
+
+    assert out == [{"date": "2024-03-01", "spend": 0.0}]
+    sql = _sql(db.statements[0])
+    assert "account_performance_daily.id" not in sql
+    assert "AS spend" in sql and "AS active" in sql
+
+
+def test_has_daily_data_probes_with_exists():
+    db = _RecordingSession(existing=[True])
+    assert asyncio.run(rs.has_daily_data(db, uuid.uuid4(), "2024-03-01", "2024-03-31", "p1")) is True
+    sql = _sql(db.statements[0])
+    assert sql.startswith("SELECT EXISTS (SELECT *")
+    assert "count(" not in sql
+    assert asyncio.run(rs.has_daily_data(_RecordingSession(existing=[False]), uuid.uuid4(), "a", "b")) is False
+
+
+def test_candidate_range_keys_are_bounded_by_min_overlap():
+    filters = rs.candidate_range_key_filters(date(2024, 3, 1), date(2024, 3, 10))
+    stmt = Select(Campaign.id).where(*filters)
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    # 10 requested days need 7 in common: start <= Mar 4, end >= Mar 7.
+    assert {v for v in params.values() if isinstance(v, str) and v != "__"} == {
+        "2024-03-04", "2024-03-07",
+    }
+
+
+def test_resolve_perf_date_source_falls_back_to_best_range_key():
+    class _Session(_RecordingSession):
+        async def execute(self, stmt):
+            self.statements.append(stmt)
+            if len(self.statements) < 3:
+                return _Result([0])  # no single-day rows, no exact range key
+            return _Result([("2024-02-25__2024-03-08",), ("2024-03-01__2024-03-31",)])
+
+    db = _Session()
+    out = asyncio.run(rs.resolve_perf_date_source(db, uuid.uuid4(), "2024-03-01", "2024-03-10"))
+    assert out == ("best_range", "2024-03-01__2024-03-31", None)
+    assert "split_part" in _sql(db.statements[2])
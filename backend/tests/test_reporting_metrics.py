@@ -0,0 +1,173 @@
+"""Pure metric helpers in the reporting service."""
+
+import pytest
+
+from datetime import date
+
+from app.services import reporting_service
+from app.services.reporting_service import compute_metrics, enrich_campaigns
+
+
+def test_compute_metrics_totals_and_weighted_top_of_search():
+    campaigns = [
+        {"spend": "10.5", "sales": 42, "impressions": 1000, "clicks": 20, "orders": 2,
+         "top_of_search_impression_share": 10},
+        {"spend": None, "sales": 0, "impressions": 0, "clicks": None, "orders": None,
+         "top_of_search_impression_share": 40},
+        {"spend": 4.5, "sales": 18, "impressions": 3000, "clicks": 10, "orders": 1},
+    ]
+    m = compute_metrics(campaigns)
+    assert m["spend"] == 15.0
+    assert m["sales"] == 60.0
+    assert (m["impressions"], m["clicks"], m["orders"]) == (4000, 30, 3)
+    assert m["acos"] == 25.0
+    assert m["roas"] == 4.0
+    assert m["ctr"] == 0.75
+    assert m["cpc"] == 0.5
+    assert m["cvr"] == 10.0
+    # weights: 1000 impressions, and 1 for the zero-impression row
+    assert m["top_of_search_impression_share"] == pytest.approx(round((10 * 1000 + 40) / 1001, 2))
+
+
+def test_compute_metrics_empty():
+    m = compute_metrics([])
+    assert m["spend"] == 0 and m["acos"] == 0
+    assert m["top_of_search_impression_share"] is None
+
+
+def test_enrich_campaigns_adds_derived_fields_without_mutating_input():
+    src = {"campaign_id": "c1", "spend": 5, "sales": 20, "impressions": 100, "clicks": 4, "orders": 1,
+           "top_of_search_impression_share": "12.345"}
+    (row,) = enrich_campaigns([src])
+    assert row["campaign_id"] == "c1"
+    assert (row["acos"], row["roas"], row["ctr"], row["cpc"], row["cvr"]) == (25.0, 4.0, 4.0, 1.25, 25.0)
+    assert row["top_of_search_impression_share"] == 12.35
+    assert "acos" not in src
+
+
+def test_campaign_daily_columns_compute_ratios_in_sql():
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+
+    from app.services.reporting_service import _campaign_daily_columns
+
+    stmt = select(*_campaign_daily_columns())
+    labels = [c.name for c in stmt.selected_columns]
+    assert labels[-5:] == ["acos", "roas", "ctr", "cpc", "cvr"]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.count("CASE WHEN") == 5
+
+
+def test_date_presets_resolve_from_one_today(monkeypatch):
+    calls = []
+
+    def fake_today(marketplace=None, region=None):
+        calls.append((marketplace, region))
+        return date(2024, 3, 13)  # a Wednesday
+
+    monkeypatch.setattr(reporting_service, "marketplace_today", fake_today)
+    get, comp = reporting_service.get_date_range, reporting_service.get_comparison_range
+    assert get("last_week") == (date(2024, 3, 4), date(2024, 3, 10))
+    assert get("last_month") == (date(2024, 2, 1), date(2024, 2, 29))
+    assert get("unknown") == (date(2024, 3, 6), date(2024, 3, 13))
+    assert comp("this_week") == get("last_week")
+    assert comp("last_week") == (date(2024, 2, 26), date(2024, 3, 3))
+    assert comp("last_month") == (date(2024, 1, 1), date(2024, 1, 31))
+    assert comp("year_to_date") == (date(2023, 1, 1), date(2023, 12, 31))
+    assert comp("unknown") == (date(2024, 2, 27), date(2024, 3, 5))
+    calls.clear()
+    comp("this_month", marketplace="DE")
+    assert calls == [("DE", None)]
+
+
+def test_parse_report_campaigns_aggregates_unenriched_rows():
+    from app.services.reporting_service import ReportingService
+
+    report = {"campaigns": [
+        {"campaign.id": "c1", "metric.totalCost": 10, "metric.sales": 40, "metric.impressions": 100,
+         "metric.clicks": 5, "metric.purchases": 1, "metric.topOfSearchImpressionShare": "20.004%"},
+        {"campaign.id": "c1", "metric.totalCost": 5, "metric.sales": 20, "metric.impressions": 300,
+         "metric.clicks": 5, "metric.purchases": 1, "metric.topOfSearchImpressionShare": 40},
+    ]}
+    raw = ReportingService.parse_report_campaign_rows(report, enrich=False)
+    assert "acos" not in raw[0]
+    assert raw[0]["top_of_search_impression_share"] == 20.0
+    (row,) = ReportingService.parse_report_campaigns(report)
+    assert (row["spend"], row["sales"], row["clicks"]) == (15.0, 60.0, 10)
+    assert row["acos"] == 25.0 and row["cvr"] == 20.0
+    assert row["top_of_search_impression_share"] == 35.0
+
+
+def test_compute_deltas_guards_zero_and_non_numeric_values():
+    from app.services.reporting_service import compute_deltas
+
+    current = {"spend": 150.0, "sales": 0, "orders": 3, "acos": "n/a", "tos": None, "clicks": "20"}
+    previous = {"spend": 100, "sales": 0, "orders": 0, "acos": 10.0, "clicks": -10}
+    assert compute_deltas(current, previous) == {
+        "spend": 50.0, "sales": 0.0, "orders": 100.0, "acos": -100.0, "tos": 0.0, "clicks": 300.0,
+    }
+
+
+def test_currency_lookup_is_case_insensitive():
+    from app.services.reporting_service import get_currency_for_marketplace
+
+    assert get_currency_for_marketplace("DE") == "EUR"
+    assert get_currency_for_marketplace("gb") == "GBP"
+    assert get_currency_for_marketplace("zz", region="FE") == "JPY"
+    assert get_currency_for_marketplace(None, region="na") == "USD"
+    assert get_currency_for_marketplace() == "USD"
+
+
+def test_parse_share_accepts_numbers_and_percent_text():
+    parse = reporting_service._parse_share
+    assert parse(" 12.345% ") == 12.35
+    assert parse(7) == 7.0
+    assert parse("n/a") is None
+    assert parse({"x": 1}) is None
+    assert parse("12.345%") == parse(" 12.345% ")
+
+
+def test_report_rows_keep_real_zero_metrics():
+    from app.services.reporting_service import ReportingService
+
+    (row,) = ReportingService.parse_report_campaign_rows(
+        [{"campaignId": "c1", "metric.totalCost": 0, "cost": 5.0,
+          "metric.clicks": 0, "clicks": 3, "sales": None, "revenue": 9}],
+        enrich=False,
+    )
+    assert row["spend"] == 0.0
+    assert row["clicks"] == 0
+    # None still falls through to the next alias.
+    assert row["sales"] == 9.0
+
+
+def test_extract_report_date_accepts_days_and_single_day_ranges():
+    from app.services.reporting_service import ReportingService
+
+    extract = ReportingService._extract_report_date
+    assert extract({"date": "2024-03-01"}) == "2024-03-01"
+    assert extract({"date": "03/01/2024", "reportDate": "2024-03-02"}) == "2024-03-02"
+    assert extract({"dateRange": "2024-03-05/2024-03-05"}) == "2024-03-05"
+    assert extract({"dateRange.value": "2024-03-05/2024-03-06"}) is None
+    assert extract({"dateRange": "2024-13-05/2024-13-05"}) is None
+    assert extract({}) is None
+
+
+def test_aggregate_accepts_a_lazy_row_stream():
+    from app.services.reporting_service import ReportingService
+
+    rows = ({"campaign_id": "c1", "spend": 2.0, "sales": 8.0} for _ in range(3))
+    (agg,) = ReportingService.aggregate_campaign_rows(rows)
+    assert agg["spend"] == 6.0 and agg["acos"] == 25.0
+    assert ReportingService.aggregate_campaign_rows(iter(())) == []
+
+
+def test_report_rows_fall_back_to_default_date():
+    from app.services.reporting_service import ReportingService
+
+    rows = ReportingService.parse_report_campaign_rows(
+        {"campaigns": [{"campaignId": "a"}, {"campaignId": "b", "date": "2024-03-02"}]},
+        default_date="2024-03-01",
+    )
+    assert [r["report_date"] for r in rows] == ["2024-03-01", "2024-03-02"]
+    assert rows[0]["acos"] == 0
@@ -0,0 +1,308 @@
+"""Search term report storage and summaries (no live database)."""
+
+import asyncio
+import gzip
+import json
+import uuid
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Delete, Insert
+
+from app.services import reporting_service
+from app.services import search_term_service as sts
+from app.services.search_term_service import SearchTermService
+
+
+class _RecordingSession:
+    """Records executed statements and executemany parameter batches."""
+
+    def __init__(self):
+        self.statements = []
+        self.batches = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        if params is not None:
+            self.batches.append(params)
+
+    def add(self, obj):
+        raise AssertionError("search term rows must not go through the ORM")
+
+
+class _Result:
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+
+    def one(self):
+        return self._rows[0]
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class _ScriptedSession:
+    """Answers each execute with the next queued result."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.results.pop(0))
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _store(db, rows, **kw):
+    service = SearchTermService.__new__(SearchTermService)
+    return asyncio.run(
+        service._store_rows(db, uuid.uuid4(), rows, "2026-01-01", "2026-01-31", "SPONSORED_PRODUCTS", **kw)
+    )
+
+
+def test_store_rows_uses_chunked_core_inserts(monkeypatch):
+    monkeypatch.setattr(sts, "SEARCH_TERM_INSERT_CHUNK", 2)
+    db = _RecordingSession()
+    rows = [
+        {"searchTerm": "red shoes", "campaignId": 123, "cost": 5, "sales7d": 20, "clicks": 4, "impressions": 100},
+        {"searchTerm": ""},
+        "junk",
+        {"searchTerm": "blue shoes", "date": "2026-01-05", "purchases14d": 2},
+        {"search_term": "green shoes", "keywordId": 9},
+    ]
+
+    stored = _store(db, rows, profile_id="p1")
+
+    assert stored == 3
+    assert isinstance(db.statements[0], Delete)
+    inserts = db.statements[1:]
+    assert len(inserts) == 2 and all(isinstance(s, Insert) for s in inserts)
+    # One parameterless INSERT run over each batch, with no RETURNING.
+    assert inserts[0] is inserts[1]
+    assert "RETURNING" not in _sql(inserts[0]) and "VALUES" in _sql(inserts[0])
+    assert [len(b) for b in db.batches] == [2, 1]
+    red, blue = db.batches[0]
+    assert red["search_term"] == "red shoes"
+    assert red["amazon_campaign_id"] == "123"
+    assert red["acos"] == 25.0 and red["roas"] == 4.0 and red["ctr"] == 4.0
+    assert red["time_unit"] == "SUMMARY" and red["date"] == "2026-01-31"
+    assert blue["time_unit"] == "DAILY" and blue["date"] == "2026-01-05"
+    assert blue["purchases"] == 2
+    assert red["id"] != blue["id"]
+    assert red["synced_at"] == blue["synced_at"]
+    assert db.batches[1][0]["keyword_id"] == "9"
+
+
+def test_store_rows_with_no_terms_only_clears_the_range():
+    db = _RecordingSession()
+    assert _store(db, [{"clicks": 3}]) == 0
+    assert len(db.statements) == 1 and isinstance(db.statements[0], Delete)
+    assert db.statements[0].get_execution_options()["synchronize_session"] is False
+
+
+def test_insert_chunk_env_override(monkeypatch):
+    monkeypatch.delenv("SEARCH_TERM_BATCH_SIZE", raising=False)
+    assert sts._insert_chunk_from_env() == 1000
+    monkeypatch.setenv("SEARCH_TERM_BATCH_SIZE", "250")
+    assert sts._insert_chunk_from_env() == 250
+    monkeypatch.setenv("SEARCH_TERM_BATCH_SIZE", "100000")
+    assert sts._insert_chunk_from_env() == sts._MAX_INSERT_CHUNK
+    monkeypatch.setenv("SEARCH_TERM_BATCH_SIZE", "lots")
+    assert sts._insert_chunk_from_env() == 1000
+
+
+def _term(name, **kw):
+    base = dict(
+        search_term=name, keyword=None, match_type=None, keyword_type=None, campaign_name=None,
+        ad_group_name=None, amazon_campaign_id=None, amazon_ad_group_id=None, keyword_id=None,
+        impressions=0, clicks=0, cost=0.0, purchases=0, sales=0.0, acos=None, roas=None, ctr=None, cpc=None,
+    )
+    base.update(kw)
+    return SimpleNamespace(**base)
+
+
+def test_summary_aggregates_in_sql_and_loads_only_shown_rows():
+    seller = _term("seller", keyword_id="k1", clicks=9, purchases=2, sales=40.0, cost=10.0)
+    waste = _term("waste", amazon_ad_group_id="ag1", clicks=5, cost=8.0)
+    db = _ScriptedSession(
+        [(1200, 300, 500, 40, 900.5, 2500.0, 7000, 410, "2026-01-01", "2026-01-31")],
+        [seller], [waste], [], [seller, waste],
+        [("k1", 0.75, "enabled")],
+        [("ag1", 0.5)],
+    )
+
+    out = asyncio.run(sts.get_search_term_summary(db, uuid.uuid4(), max_results=10, profile_id="p1"))
+
+    assert out["total"] == 1200
+    assert out["date_range"] == "2026-01-01 to 2026-01-31"
+    assert out["summary"] == {
+        "total_search_terms": 1200, "with_sales": 300, "non_converting": 500, "high_acos_count": 40,
+        "total_cost": 900.5, "total_sales": 2500.0, "total_clicks": 7000, "total_purchases": 410,
+    }
+    assert out["top_by_sales"][0]["target_id"] == "k1"
+    assert out["top_by_sales"][0]["current_bid"] == 0.75
+    assert out["top_non_converting"][0]["ad_group_default_bid"] == 0.5
+    assert [t["search_term"] for t in out["top_by_clicks"]] == ["seller", "waste"]
+    assert "FILTER (WHERE" in _sql(db.statements[0])
+    for stmt in db.statements[1:5]:
+        assert "DESC NULLS LAST" in _sql(stmt) and "LIMIT" in _sql(stmt)
+        columns = _sql(stmt).split(" FROM ")[0]
+        assert "search_term_performance.ad_group_name" in columns
+        assert "targeting" not in columns and "synced_at" not in columns
+    # Inline literals, so the partial ix_stp_top_* predicates can match.
+    assert "AND purchases > 0" in _sql(db.statements[1]).replace("search_term_performance.", "")
+    assert "AND acos > 50 AND cost > 0" in _sql(db.statements[3]).replace("search_term_performance.", "")
+
+
+def test_summary_without_rows_skips_row_queries():
+    db = _ScriptedSession([(0, 0, 0, 0, 0.0, 0.0, 0, 0, None, None)])
+    out = asyncio.run(sts.get_search_term_summary(db, uuid.uuid4()))
+    assert out == {"total": 0, "has_data": False}
+    assert len(db.statements) == 1
+
+
+def _completed_report(*part_urls, url=None):
+    report = {"status": "COMPLETED", "completedReportParts": [{"url": u} for u in part_urls]}
+    if url:
+        report["url"] = url
+    return {"success": [{"report": report}]}
+
+
+def _download_and_store(db, response):
+    service = SearchTermService.__new__(SearchTermService)
+    return asyncio.run(service._download_and_store(
+        db, uuid.uuid4(), response, "2026-01-01", "2026-01-31", "SPONSORED_PRODUCTS"
+    ))
+
+
+def test_download_and_store_inserts_each_part_as_it_arrives(serve_parts):
+    bodies, _ = serve_parts
+    bodies["https://s3.test/a"] = httpx.Response(
+        200, content=gzip.compress(json.dumps({"searchTerms": [{"searchTerm": "a"}]}).encode())
+    )
+    bodies["https://s3.test/b"] = httpx.Response(
+        200, content=b'[{"searchTerm": "b"}, {"searchTerm": "c"}]'
+    )
+    db = _RecordingSession()
+    out = _download_and_store(
+        db, _completed_report("https://s3.test/gone", "https://s3.test/b", url="https://s3.test/a")
+    )
+    assert out == {"status": "completed", "rows_stored": 3}
+    assert isinstance(db.statements[0], Delete)
+    # Parts arrive in completion order.
+    assert sorted(m["search_term"] for b in db.batches for m in b) == ["a", "b", "c"]
+
+
+def test_download_and_store_reports_insert_failure(serve_parts):
+    bodies, _ = serve_parts
+    bodies["https://s3.test/a"] = httpx.Response(200, content=b'[{"searchTerm": "a"}]')
+
+    class _FailingSession(_RecordingSession):
+        rolled_back = False
+
+        async def execute(self, stmt, params=None):
+            if isinstance(stmt, Insert):
+                raise RuntimeError("disk full")
+            await super().execute(stmt)
+
+        async def rollback(self):
+            self.rolled_back = True
+
+    db = _FailingSession()
+    out = _download_and_store(db, _completed_report("https://s3.test/a"))
+    assert out["status"] == "error"
+    assert out["message"] == "Downloaded 1 rows but failed to store: disk full"
+    assert db.rolled_back
+
+
+def test_report_part_urls_skip_incomplete_reports():
+    response = _completed_report("https://s3.test/p", url="https://s3.test/r")
+    response["success"].append({"report": {"status": "PENDING", "url": "https://s3.test/x"}})
+    assert SearchTermService._report_part_urls(response) == ["https://s3.test/r", "https://s3.test/p"]
+    assert SearchTermService._report_part_urls(None) == []
+
+
+def test_download_and_store_fetches_parts_concurrently(monkeypatch):
+    monkeypatch.setattr(sts, "SEARCH_TERM_PART_CONCURRENCY", 2)
+    in_flight = 0
+    peak = 0
+
+    async def fetch(http, url, row_keys):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"searchTerm": url}]
+
+    monkeypatch.setattr(reporting_service._HTTP, "client", None)
+    monkeypatch.setattr(sts, "fetch_report_part", fetch)
+    db = _RecordingSession()
+    out = _download_and_store(db, _completed_report("u1", "u2", "u3", "u4"))
+    assert out["rows_stored"] == 4
+    assert peak == 2
+
+
+def test_build_mappings_is_a_pure_transform():
+    cred = uuid.uuid4()
+    rows = [{"searchTerm": "x", "clicks": "3", "cost": "1.5", "impressions": 0}, None]
+    (m,) = sts._build_mappings(rows, cred, None, "2026-01-01", "2026-01-31", "SPONSORED_BRANDS")
+    assert m["credential_id"] == cred and m["profile_id"] is None
+    assert m["clicks"] == 3 and m["cost"] == 1.5 and m["cpc"] == 0.5
+    assert m["ctr"] is None and m["acos"] is None
+    assert m["ad_product"] == "SPONSORED_BRANDS"
+
+
+def test_truncated_repr_bounds_large_responses():
+    big = {"success": [{"report": {"reportId": "r1", "blob": "x" * 10_000}}] * 500}
+    out = sts._truncated_repr(big)
+    assert len(out) <= 1000
+    assert "'reportId': 'r1'" in out
+
+
+def test_poll_checks_first_then_backs_off_until_max_wait(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(round(seconds, 3))
+
+    monkeypatch.setattr(sts.asyncio, "sleep", fake_sleep)
+    statuses = iter(["PENDING"] * 100)
+
+    class _Client:
+        async def retrieve_report_v3(self, report_id):
+            return {"status": next(statuses)}
+
+        @staticmethod
+        def _get_report_status(result):
+            return result["status"]
+
+    service = SearchTermService.__new__(SearchTermService)
+    service.client = _Client()
+    out = asyncio.run(service._poll_report_v3("r1", max_wait=20, interval=1, max_interval=4))
+    assert out == {"status": "PENDING"}
+    assert sleeps[:4] == [1, 1.7, 2.89, 4]
+    assert sum(sleeps) == pytest.approx(20)
+
+    statuses = iter(["COMPLETED"])
+    sleeps.clear()
+    assert asyncio.run(service._poll_report_v3("r2"))["status"] == "COMPLETED"
+    assert sleeps == []
+
+
+def test_report_part_urls_tolerate_malformed_entries():
+    response = {"success": [
+        "junk", {"report": None}, {}, {"report": {"status": "COMPLETED", "completedReportParts": None}},
+        {"report": {"status": "COMPLETED", "completedReportParts": ["junk", {"url": ""}, {"url": "u"}]}},
+    ]}
+    assert SearchTermService._report_part_urls(response) == ["u"]
+    assert SearchTermService._report_part_urls({"success": None}) == []
@@ -0,0 +1,128 @@
+"""OAuth token refresh in the token service."""
+
+import asyncio
+from urllib.parse import parse_qs
+
+import httpx
+
+from app.services import token_service
+
+
+def test_refresh_reuses_the_shared_token_client(monkeypatch):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"access_token": "new", "expires_in": 3600})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(token_service._HTTP, "client", client)
+
+    async def run():
+        first = await token_service.refresh_access_token("cid", "secret", "rt")
+        await token_service.refresh_access_token("cid", "secret", "rt")
+        assert token_service._http() is client
+        return first
+
+    assert asyncio.run(run())["access_token"] == "new"
+    assert len(seen) == 2
+    assert str(seen[0].url) == token_service.TOKEN_URL
+    assert parse_qs(seen[0].content.decode())["grant_type"] == ["refresh_token"]
+
+
+def test_token_client_is_recreated_after_close(monkeypatch):
+    monkeypatch.setattr(token_service._HTTP, "client", None)
+    client = token_service._http()
+    assert token_service._http() is client
+    asyncio.run(token_service.close_http_client())
+    assert client.is_closed and token_service._HTTP.client is None
+
+
+def test_decrypt_is_memoised_per_ciphertext(monkeypatch):
+    calls = []
+
+    def fake_decrypt(value):
+        calls.append(value)
+        return f"plain:{value}"
+
+    monkeypatch.setattr(token_service, "decrypt_value", fake_decrypt)
+    token_service._decrypt_cached.cache_clear()
+    try:
+        assert token_service._decrypt_cached("ct1") == "plain:ct1"
+        assert token_service._decrypt_cached("ct1") == "plain:ct1"
+        assert token_service._decrypt_cached("ct2") == "plain:ct2"
+        assert calls == ["ct1", "ct2"]
+    finally:
+        token_service._decrypt_cached.cache_clear()
+
+
+def test_concurrent_refreshes_for_one_credential_share_one_call(monkeypatch):
+    import uuid
+    from datetime import datetime, timedelta, timezone
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(token_service, "_refresh_locks", {})
+    monkeypatch.setattr(token_service, "_recent_refresh", {})
+    monkeypatch.setattr(token_service, "_decrypt_cached", lambda v: v)
+    monkeypatch.setattr("app.crypto.encrypt_value", lambda v: f"enc:{v}")
+    calls = []
+
+    async def refresh(client_id, client_secret, refresh_token):
+        calls.append(client_id)
+        await asyncio.sleep(0.01)
+        return {"access_token": "fresh", "expires_in": 3600}
+
+    monkeypatch.setattr(token_service, "refresh_access_token", refresh)
+
+    class _Session:
+        async def flush(self):
+            pass
+
+    cred_id = uuid.uuid4()
+
+    def stale_cred():
+        # Each request loads its own copy of the row.
+        return SimpleNamespace(
+            id=cred_id, name="acct", client_id="cid", client_secret="s", refresh_token="rt",
+            access_token="old", status="active",
+            token_expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+
+    async def run():
+        return await asyncio.gather(
+            *(token_service.ensure_fresh_token(stale_cred(), _Session()) for _ in range(5))
+        )
+
+    creds = asyncio.run(run())
+    assert calls == ["cid"]
+    assert {c.access_token for c in creds} == {"enc:fresh"}
+    assert all(not token_service._token_is_expired(c) for c in creds)
+
+
+def test_token_expiry_uses_refresh_buffer():
+    from datetime import datetime, timedelta, timezone
+    from types import SimpleNamespace
+
+    now = datetime.now(timezone.utc)
+
+    def cred(expires_in):
+        return SimpleNamespace(client_secret="s", refresh_token="rt", token_expires_at=now + expires_in)
+
+    assert not token_service._token_is_expired(cred(timedelta(minutes=10)))
+    assert token_service._token_is_expired(cred(timedelta(minutes=4)))
+    assert token_service._token_is_expired(cred(-timedelta(minutes=1)))
+    assert token_service._token_is_expired(SimpleNamespace(client_secret="s", refresh_token="rt", token_expires_at=None))
+
+
+def test_naive_token_expiry_is_read_as_utc():
+    from datetime import datetime, timedelta, timezone
+    from types import SimpleNamespace
+
+    # Unmigrated databases return naive UTC values for token_expires_at.
+    naive_now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def cred(expires_in):
+        return SimpleNamespace(client_secret="s", refresh_token="rt", token_expires_at=naive_now + expires_in)
+
+    assert not token_service._token_is_expired(cred(timedelta(minutes=10)))
+    assert token_service._token_is_expired(cred(timedelta(minutes=4)))